@@ -0,0 +1,8 @@
+"""性能基准测试
+
+    python -m benchmarks.bench_rules --json results.json
+    python -m benchmarks.bench_rules --compare results.json
+    python -m benchmarks.bench_games --games 200
+    python -m benchmarks.profile_fans --sort hit_rate
+    python -m benchmarks.bench_server --tables 1000 --concurrency 500
+"""
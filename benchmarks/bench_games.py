@@ -0,0 +1,252 @@
+"""端到端吞吐量基准：四个AI完整对局
+
+牌墙排列由ShuffleStream批量生成，通过GameState.initialize_game发牌，由TurnHandler驱动回合，AdvancedStrategy决策。
+输出每秒局数、每秒回合数、各阶段耗时占比、内存块净增量和峰值RSS。
+
+内存块净增量是阶段前后sys.getallocatedblocks的差，即该阶段留下的内存块数，
+阶段内分配又释放的块相互抵消，不是分配次数。两次运行（吞吐量、分阶段统计）
+之前都清空规则和AI共用的缓存，两次运行都从相同的冷缓存开始。
+
+阶段划分（按自身耗时统计，嵌套调用的耗时计入内层阶段）：
+    deal      GameState.initialize_game
+    draw      TurnHandler.draw（含补花）
+    hu_check  规则的can_hu（自摸与点炮判定）
+    decision  TurnHandler.decide / decide_claim（AI决策）
+    claim     ClaimResolver.collect_claims（收集可响应的玩家）
+    scoring   规则的calculate_score
+
+用法：
+    python -m benchmarks.bench_games [--games N] [--seed N] [--json PATH] [--compare PATH]
+"""
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+from contextlib import contextmanager
+
+from benchmarks.harness import compare, environment, write_json
+from src.ai.evaluation import tile_efficiency
+from src.ai.strategy.advanced_strategy import AdvancedStrategy
+from src.core.data.game_state import GameState
+from src.core.data.player import Player
+from src.core.logic.claim_resolver import ClaimResolver
+from src.core.logic.shuffle_stream import ShuffleStream
+from src.core.logic.turn_handler import TurnHandler
+from src.core.tables import canonical, kernels
+from src.rules.tencent_common.rule import TencentCommonRule
+
+PHASES = ('deal', 'draw', 'hu_check', 'decision', 'claim', 'scoring')
+
+
+class PhaseProfiler:
+    """按阶段累计自身耗时和内存块净增量"""
+
+    def __init__(self):
+        self.time_ns = dict.fromkeys(PHASES, 0)
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.blocks = dict.fromkeys(PHASES, 0)
+        self._stack = []
+
+    def wrap(self, phase, fn):
+        """包装函数，调用时计入指定阶段"""
+        perf = time.perf_counter_ns
+        blocks = sys.getallocatedblocks
+        stack = self._stack
+
+        def timed(*args, **kwargs):
+            now = perf()
+            if stack:
+                # 暂停外层阶段的计时
+                outer, outer_start, outer_blocks = stack[-1]
+                self.time_ns[outer] += now - outer_start
+                self.blocks[outer] += blocks() - outer_blocks
+            stack.append([phase, now, blocks()])
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _, start, start_blocks = stack.pop()
+                now = perf()
+                self.time_ns[phase] += now - start
+                self.blocks[phase] += blocks() - start_blocks
+                self.calls[phase] += 1
+                if stack:
+                    stack[-1][1] = now
+                    stack[-1][2] = blocks()
+        return timed
+
+    @contextmanager
+    def installed(self):
+        """在类上安装计时包装，退出时恢复"""
+        targets = [
+            (GameState, 'initialize_game', 'deal', False),
+            (TurnHandler, 'draw', 'draw', True),
+            (TencentCommonRule, 'can_hu', 'hu_check', False),
+            (TurnHandler, 'decide', 'decision', True),
+            (TurnHandler, 'decide_claim', 'decision', True),
+            (ClaimResolver, 'collect_claims', 'claim', True),
+            (TencentCommonRule, 'calculate_score', 'scoring', False),
+        ]
+        originals = []
+        for owner, name, phase, static in targets:
+            raw = owner.__dict__[name]
+            originals.append((owner, name, raw))
+            fn = raw.__func__ if static else raw
+            wrapped = self.wrap(phase, fn)
+            setattr(owner, name, staticmethod(wrapped) if static else wrapped)
+        try:
+            yield self
+        finally:
+            for owner, name, raw in originals:
+                setattr(owner, name, raw)
+
+
+def _new_game(rule):
+    """创建四个AI玩家的对局"""
+    players = [Player(name) for name in ("东家", "南家", "西家", "北家")]
+    strategy = AdvancedStrategy(rule)
+    for player in players:
+        player.ai_strategy = strategy
+    return GameState(players, rule)
+
+
+def play_games(games: int, seed: int, rule=None) -> dict:
+    """连续进行多局对局（需要分阶段统计时在PhaseProfiler.installed()内调用）
+
+    Args:
+        games: 局数
+        seed: 随机种子
+        rule: 规则实例，默认新建TencentCommonRule
+
+    Returns:
+        dict: 局数、回合数、胡牌局数、总耗时
+    """
+    random.seed(seed)
+    rule = rule or TencentCommonRule()
+    stream = ShuffleStream(rule.initial_tile_ids(), seed=seed)
+    turns = wins = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        state = _new_game(rule)
+        state.initialize_game(stream.next())
+        while state.game_stage == "playing":
+            TurnHandler.process_turn(state)
+            turns += 1
+        wins += state.winner is not None
+    return {
+        'games': games,
+        'turns': turns,
+        'wins': wins,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def reset_caches() -> None:
+    """清空跨对局共用的缓存（听牌、向听数、拆分组合）
+
+    番数缓存和AI的缓存属于每次运行新建的规则和策略实例，不需要清空。
+    """
+    canonical.clear_caches()
+    kernels.group_options.cache_clear()
+    tile_efficiency.combine_options.cache_clear()
+    tile_efficiency.standard_shanten.cache_clear()
+
+
+def _peak_rss_kb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def run(games: int = 200, seed: int = 1) -> dict:
+    """运行端到端基准
+
+    先不带阶段统计运行一次得到吞吐量，再带阶段统计运行一次得到分阶段数据，
+    每次运行前都清空缓存。
+
+    Returns:
+        dict: {'environment', 'config', 'results', 'phases', 'memory'}
+    """
+    play_games(5, seed)  # 预热（加载查找表等）
+
+    reset_caches()
+    gc_before = sum(s['collections'] for s in gc.get_stats())
+    totals = play_games(games, seed)
+    gc_collections = sum(s['collections'] for s in gc.get_stats()) - gc_before
+
+    reset_caches()
+    profiler = PhaseProfiler()
+    with profiler.installed():
+        play_games(games, seed)
+
+    total_ns = sum(profiler.time_ns.values()) or 1
+    phases = {
+        phase: {
+            'calls': profiler.calls[phase],
+            'seconds': round(profiler.time_ns[phase] / 1e9, 4),
+            'share': round(profiler.time_ns[phase] / total_ns, 4),
+            'net_block_delta': profiler.blocks[phase],
+        }
+        for phase in PHASES
+    }
+
+    seconds = totals['seconds']
+    return {
+        'environment': environment(),
+        'config': {'games': games, 'seed': seed},
+        'results': {
+            'hands_per_sec': {'ops_per_sec': round(totals['games'] / seconds, 2)},
+            'turns_per_sec': {'ops_per_sec': round(totals['turns'] / seconds, 1)},
+        },
+        'totals': totals,
+        'phases': phases,
+        'memory': {
+            'peak_rss_kb': _peak_rss_kb(),
+            'gc_collections': gc_collections,
+        },
+    }
+
+
+def print_report(report: dict) -> None:
+    totals = report['totals']
+    results = report['results']
+    print(f"对局: {totals['games']}  回合: {totals['turns']}  胡牌: {totals['wins']}  耗时: {totals['seconds']:.2f}s")
+    print(f"每秒局数: {results['hands_per_sec']['ops_per_sec']}  每秒回合数: {results['turns_per_sec']['ops_per_sec']}")
+    print(f"\n{'阶段':<12}{'调用次数':>10}{'耗时(s)':>10}{'占比':>8}{'内存块净增量':>12}")
+    for phase, p in report['phases'].items():
+        print(f"{phase:<12}{p['calls']:>10}{p['seconds']:>10.3f}{p['share']:>8.1%}{p['net_block_delta']:>12}")
+    memory = report['memory']
+    print(f"\n峰值RSS: {memory['peak_rss_kb']} KB  GC次数: {memory['gc_collections']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="端到端对局吞吐量基准")
+    parser.add_argument('--games', type=int, default=200, help="对局数")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    parser.add_argument('--json', default=None, help="将结果写入JSON文件")
+    parser.add_argument('--compare', default=None, help="与之前的JSON结果比较")
+    parser.add_argument('--threshold', type=float, default=0.10, help="判定为性能下降的相对阈值")
+    args = parser.parse_args(argv)
+
+    report = run(args.games, args.seed)
+    print_report(report)
+    if args.json:
+        write_json(args.json, report)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        for name, before, after, change in regressions:
+            print(f"性能下降: {name} {before:.1f} -> {after:.1f} ({change:+.1%})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""规则引擎热点路径的微基准
+
+测试入口：
+    can_hu              TencentHuRules.can_hu（13张手牌 + 和牌）
+    calculate_fans      TencentScoreRules._calculate_fans（14张手牌）
+    get_valid_actions   TencentActionRules.get_valid_actions（摸牌后）
+    recommend_discard   AdvancedStrategy.recommend_discard（14张手牌）
+
+以及固定局面上的AI计算（不按语料分类）：
+
+    hand_sampler/x100        HandSampler.samples，每次调用抽取100组对手手牌
+    win_probability/endgame  WinProbability.evaluate，终盘一向听的全部候选（每次新建计算器）
+
+手牌在计时前按样本构造好；每轮（--repeat）开始前清空番数、听牌、向听数和AI的
+缓存，各轮都是冷缓存的结果，与之前的结果比较才有意义。
+
+用法：
+    python -m benchmarks.bench_rules [--size N] [--repeat N] [--json PATH] [--compare PATH]
+"""
+import argparse
+import functools
+import json
+import random
+import sys
+
+from benchmarks.corpus import build_corpus
+from benchmarks.harness import compare, environment, measure, print_table, write_json
+from src.ai.evaluation.hand_sampler import HandSampler
+from src.ai.evaluation.win_probability import WinProbability
+from src.ai.strategy.advanced_strategy import AdvancedStrategy
+from src.core.data.game_state import GameState
+from src.core.data.player import Player
+from src.core.data.tile import card_from_id
+from src.core.logic.turn_handler import TurnHandler
+from src.core.tables import canonical
+from src.rules.tencent_common.rule import TencentCommonRule
+
+
+def _make_state(rule):
+    """创建一个对局中途的固定局面"""
+    players = [Player(f"玩家{i}") for i in range(4)]
+    state = GameState(players, rule)
+    state.assign_seats()
+    state.deck = [card_from_id(t) for t in range(34) for _ in range(2)]
+    state.discard_pile = [card_from_id(t) for t in range(0, 34, 3)]
+    state.current_player = players[0]
+    state.game_stage = "playing"
+    return state
+
+
+def entry_points(rule):
+    """构造各入口的被测函数
+
+    Returns:
+        dict: {入口: (prepare, fn)}，prepare(sample)在计时前为样本构造好玩家和手牌，
+            fn(prepared)只调用被测入口
+    """
+    state = _make_state(rule)
+    strategy = AdvancedStrategy(rule)
+
+    def concealed(sample):
+        player = Player("玩家0")
+        player.seat = 0
+        player.hand = sample.concealed
+        player.drawn_card = sample.winning_card
+        return player, sample.winning_card
+
+    def full_hand(sample):
+        player, card = concealed(sample)
+        player.hand = sample.full_hand
+        return player, card
+
+    def can_hu(prepared):
+        player, card = prepared
+        rule.can_hu(player, card)
+
+    def calculate_fans(prepared):
+        player, card = prepared
+        rule.score_rules._calculate_fans(player, card)
+
+    def get_valid_actions(prepared):
+        rule.get_valid_actions(prepared[0], state)
+
+    def recommend_discard(prepared):
+        strategy.recommend_discard(prepared[0], state)
+
+    return {
+        'can_hu': (concealed, can_hu),
+        'calculate_fans': (full_hand, calculate_fans),
+        'get_valid_actions': (concealed, get_valid_actions),
+        'recommend_discard': (full_hand, recommend_discard),
+    }, strategy
+
+
+def _midgame_state(rule, seed: int = 5, turns: int = 20):
+    """按种子发牌并摸切若干回合后的局面"""
+    random.seed(seed)
+    players = [Player(name) for name in ("东家", "南家", "西家", "北家")]
+    state = GameState(players, rule, seed=seed)
+    state.initialize_game()
+    for _ in range(turns):
+        if state.game_stage != "playing":
+            break
+        TurnHandler.process_turn(state)
+    return state
+
+
+def _endgame_state(rule):
+    """终盘（每人还能摸4张）一向听的局面"""
+    players = [Player(name) for name in ("东家", "南家", "西家", "北家")]
+    state = GameState(players, rule)
+    state.assign_seats()
+    state.deck = [card_from_id(t) for t in range(16)]
+    player = players[0]
+    player.hand = [card_from_id(t) for t in (0, 1, 2, 3, 4, 5, 15, 16, 17, 27, 27, 22, 25, 33)]
+    return state, player
+
+
+def scenarios(rule) -> dict:
+    """构造固定局面上的被测函数
+
+    Returns:
+        dict: {名称: fn()}
+    """
+    state = _midgame_state(rule)
+    sampler = HandSampler(state, state.players[0], rng=random.Random(4))
+    endgame, player = _endgame_state(rule)
+
+    def sample_hands():
+        for _ in sampler.samples(100):
+            pass
+
+    def win_probability():
+        WinProbability().evaluate(player, endgame)
+
+    return {
+        'hand_sampler/x100': sample_hands,
+        'win_probability/endgame': win_probability,
+    }
+
+
+def clear_caches(rule, strategy) -> None:
+    """清空番数、听牌、向听数和AI的缓存，使每轮都从冷缓存开始"""
+    if rule.score_rules.fan_cache is not None:
+        rule.score_rules.fan_cache.clear()
+    canonical.clear_caches()
+    strategy.tile_efficiency.clear()
+    strategy.win_probability.clear()
+
+
+def run(size: int = 200, repeat: int = 3, seed: int = 20240601, only=None) -> dict:
+    """运行全部微基准
+
+    Args:
+        size: 每类语料样本数
+        repeat: 重复次数
+        seed: 语料随机种子
+        only: 只运行名称包含该字符串的项
+
+    Returns:
+        dict: {'environment': ..., 'config': ..., 'results': {入口/类别: 指标}}
+    """
+    corpus = build_corpus(size, seed)
+    rule = TencentCommonRule()
+    results = {}
+    entries, strategy = entry_points(rule)
+    reset = functools.partial(clear_caches, rule, strategy)
+    for entry, (prepare, fn) in entries.items():
+        for kind, samples in corpus.items():
+            name = f"{entry}/{kind}"
+            if only and only not in name:
+                continue
+            fn(prepare(samples[0]))  # 预热（加载查找表等）
+            results[name] = measure(fn, samples, repeat, prepare, reset)
+    calls = range(max(size // 10, 1))
+    for name, fn in scenarios(rule).items():
+        if only and only not in name:
+            continue
+        fn()
+        results[name] = measure(lambda _: fn(), calls, repeat, reset=reset)
+    return {
+        'environment': environment(),
+        'config': {'size': size, 'repeat': repeat, 'seed': seed},
+        'results': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="规则引擎微基准")
+    parser.add_argument('--size', type=int, default=200, help="每类语料样本数")
+    parser.add_argument('--repeat', type=int, default=3, help="重复次数")
+    parser.add_argument('--seed', type=int, default=20240601, help="语料随机种子")
+    parser.add_argument('--only', default=None, help="只运行名称包含该字符串的项")
+    parser.add_argument('--json', default=None, help="将结果写入JSON文件")
+    parser.add_argument('--compare', default=None, help="与之前的JSON结果比较")
+    parser.add_argument('--threshold', type=float, default=0.10, help="判定为性能下降的相对阈值")
+    args = parser.parse_args(argv)
+
+    report = run(args.size, args.repeat, args.seed, args.only)
+    print_table(report['results'])
+    if args.json:
+        write_json(args.json, report)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        for name, before, after, change in regressions:
+            print(f"性能下降: {name} {before:.1f} -> {after:.1f} ops/s ({change:+.1%})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
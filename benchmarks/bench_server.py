@@ -0,0 +1,82 @@
+"""异步桌台服务的合成负载基准
+
+同时运行多张桌台，每张桌台一个人类座位，由本地socket另一端的脚本客户端
+摸切回复（可设置思考时间），其余三家为AI。输出每秒决策数、每秒桌台数、
+决策延迟p50/p99、超时数和无效回复数。
+
+用法：
+    python -m benchmarks.bench_server [--tables N] [--concurrency N] [--delay S] [--timeout S]
+"""
+import argparse
+import asyncio
+import json
+import random
+
+from src.ai.strategy.advanced_strategy import AdvancedStrategy
+from src.core.data.game_state import GameState
+from src.core.data.player import Player
+from src.core.logic.shuffle_stream import ShuffleStream
+from src.interface.table_host import TableHost
+from src.interface.transport import local_socket_pair, run_scripted_client, tsumogiri
+from src.rules.tencent_common.rule import TencentCommonRule
+
+
+def new_tables(count: int, seed: int, human_seat: int = 0, rule=None) -> list:
+    """创建已发牌的桌台，每桌human_seat座位为人类玩家（human_seat为None时全部为AI）"""
+    random.seed(seed)
+    rule = rule or TencentCommonRule()
+    strategy = AdvancedStrategy(rule)
+    stream = ShuffleStream(rule.initial_tile_ids(), seed=seed)
+    states = []
+    for _ in range(count):
+        players = [Player(name) for name in ("东家", "南家", "西家", "北家")]
+        for player in players:
+            player.ai_strategy = strategy
+        if human_seat is not None:
+            players[human_seat].is_ai = False
+        state = GameState(players, rule)
+        state.initialize_game(stream.next())
+        states.append(state)
+    return states
+
+
+async def serve(tables: int, seed: int, concurrency: int = None, delay: float = 0.0,
+                move_timeout: float = 5.0) -> dict:
+    """运行合成负载
+
+    Returns:
+        dict: TableHost.metrics()
+    """
+    states = new_tables(tables, seed)
+    transport, reader, writer = await local_socket_pair()
+    client = asyncio.ensure_future(run_scripted_client(reader, writer, tsumogiri, delay))
+    host = TableHost(transport, move_timeout=move_timeout)
+    try:
+        await host.run(states, concurrency)
+    finally:
+        await transport.close()
+        writer.close()
+        client.cancel()
+    return host.metrics()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="异步桌台服务合成负载基准")
+    parser.add_argument('--tables', type=int, default=200, help="桌台数")
+    parser.add_argument('--concurrency', type=int, default=None, help="同时进行的桌台数上限")
+    parser.add_argument('--delay', type=float, default=0.0, help="脚本客户端每次回复的思考时间（秒）")
+    parser.add_argument('--timeout', type=float, default=5.0, help="每次决策的超时秒数")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', help="将结果写入JSON文件")
+    args = parser.parse_args(argv)
+
+    metrics = asyncio.run(serve(args.tables, args.seed, args.concurrency, args.delay, args.timeout))
+    for key, value in metrics.items():
+        print(f"{key:<16}{value}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(metrics, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
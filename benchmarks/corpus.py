@@ -0,0 +1,91 @@
+"""固定随机种子生成的牌型语料"""
+import random
+
+from src.core.data.tile import card_from_id
+
+ORPHANS = [0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33]
+
+# 语料类别
+KINDS = ('ready', 'pure_suit', 'seven_pairs', 'thirteen_orphans', 'garbage')
+
+
+class HandSample:
+    """一手牌样本：13张手牌 + 和牌（或摸到的牌）"""
+
+    def __init__(self, kind: str, tiles: list):
+        """
+        Args:
+            kind: 语料类别
+            tiles: 14个牌编号，最后一个为和牌
+        """
+        self.kind = kind
+        self.tiles = tiles
+
+    @property
+    def concealed(self) -> list:
+        """13张手牌"""
+        return [card_from_id(t) for t in self.tiles[:-1]]
+
+    @property
+    def winning_card(self):
+        """和牌"""
+        return card_from_id(self.tiles[-1])
+
+    @property
+    def full_hand(self) -> list:
+        """包含和牌的14张牌"""
+        return [card_from_id(t) for t in self.tiles]
+
+
+def _standard_hand(rng, tile_pool) -> list:
+    """生成4组面子+1对将牌"""
+    while True:
+        counts = [0] * 34
+        tiles = []
+        ok = True
+        for _ in range(4):
+            base = rng.choice(tile_pool)
+            if base < 27 and base % 9 <= 6 and rng.random() < 0.6:
+                meld = [base, base + 1, base + 2]
+            else:
+                meld = [base] * 3
+            for t in meld:
+                counts[t] += 1
+                ok = ok and counts[t] <= 4
+            tiles.extend(meld)
+        pair = rng.choice(tile_pool)
+        counts[pair] += 2
+        tiles.extend([pair, pair])
+        if ok and counts[pair] <= 4:
+            return tiles
+
+
+def _generate(kind: str, rng) -> list:
+    if kind == 'ready':
+        tiles = _standard_hand(rng, list(range(34)))
+    elif kind == 'pure_suit':
+        suit = rng.randrange(3)
+        tiles = _standard_hand(rng, list(range(suit * 9, suit * 9 + 9)))
+    elif kind == 'seven_pairs':
+        tiles = [t for t in rng.sample(range(34), 7) for _ in range(2)]
+    elif kind == 'thirteen_orphans':
+        tiles = ORPHANS + [rng.choice(ORPHANS)]
+    else:
+        wall = [t for t in range(34) for _ in range(4)]
+        tiles = rng.sample(wall, 14)
+    rng.shuffle(tiles)
+    return tiles
+
+
+def build_corpus(size: int = 200, seed: int = 20240601) -> dict:
+    """生成各类别的牌型语料
+
+    Args:
+        size: 每类样本数
+        seed: 随机种子（相同种子生成相同语料，便于跨提交比较）
+
+    Returns:
+        dict: 类别 -> HandSample列表
+    """
+    rng = random.Random(seed)
+    return {kind: [HandSample(kind, _generate(kind, rng)) for _ in range(size)] for kind in KINDS}
@@ -0,0 +1,93 @@
+"""基准测试计时与结果比较"""
+import json
+import platform
+import subprocess
+import sys
+import time
+
+
+def measure(fn, samples, repeat: int = 3, prepare=None, reset=None) -> dict:
+    """逐次计时调用fn(sample)
+
+    Args:
+        fn: 被测函数
+        samples: 输入样本列表
+        repeat: 语料重复次数
+        prepare: 可选，prepare(sample)在计时前把样本转换为fn的输入（如预先构造手牌）
+        reset: 可选，每轮开始前调用（如清空缓存，使各轮结果可比）
+
+    Returns:
+        dict: calls, ops_per_sec, p50_us, p99_us
+    """
+    if prepare is not None:
+        samples = [prepare(sample) for sample in samples]
+    timings = []
+    perf = time.perf_counter_ns
+    for _ in range(repeat):
+        if reset is not None:
+            reset()
+        for sample in samples:
+            start = perf()
+            fn(sample)
+            timings.append(perf() - start)
+
+    timings.sort()
+    total = sum(timings)
+    n = len(timings)
+    return {
+        'calls': n,
+        'ops_per_sec': round(n / (total / 1e9), 1) if total else 0.0,
+        'p50_us': round(timings[n // 2] / 1000, 2),
+        'p99_us': round(timings[min(n - 1, n * 99 // 100)] / 1000, 2),
+    }
+
+
+def environment() -> dict:
+    """记录运行环境，便于判断结果是否可比"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+    }
+
+
+def write_json(path: str, results: dict) -> None:
+    """写入JSON结果"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> list:
+    """比较两次运行结果，找出吞吐量下降超过阈值的项
+
+    Args:
+        baseline: 基准结果（results字段为 {名称: 指标}）
+        current: 当前结果
+        threshold: 允许的相对下降比例
+
+    Returns:
+        list: (名称, 基准ops, 当前ops, 变化比例) 列表
+    """
+    regressions = []
+    for name, base in baseline['results'].items():
+        cur = current['results'].get(name)
+        if cur is None or not base['ops_per_sec']:
+            continue
+        change = cur['ops_per_sec'] / base['ops_per_sec'] - 1
+        if change < -threshold:
+            regressions.append((name, base['ops_per_sec'], cur['ops_per_sec'], change))
+    return regressions
+
+
+def print_table(results: dict) -> None:
+    """打印结果表"""
+    print(f"{'名称':<40}{'ops/s':>12}{'p50(us)':>10}{'p99(us)':>10}")
+    for name in sorted(results):
+        r = results[name]
+        print(f"{name:<40}{r['ops_per_sec']:>12.1f}{r['p50_us']:>10.2f}{r['p99_us']:>10.2f}")
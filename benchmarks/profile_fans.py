@@ -0,0 +1,48 @@
+"""番型判定剖析
+
+分别在基准语料（各类14张手牌直接计算番数）和完整AI对局中统计
+TencentScoreRules各_is_*判定的调用次数、累计耗时和命中率，打印排序表。
+
+用法：
+    python -m benchmarks.profile_fans [--size N] [--games N] [--sort total|calls|hit_rate]
+"""
+import argparse
+import sys
+
+from benchmarks.bench_games import play_games
+from benchmarks.bench_rules import _make_state
+from benchmarks.corpus import build_corpus
+from src.rules.tencent_common.rule import TencentCommonRule
+
+
+def profile_corpus(rule, size: int, seed: int) -> None:
+    """对语料中的每手牌计算一次番数"""
+    player = _make_state(rule).players[0]
+    for samples in build_corpus(size, seed).values():
+        for sample in samples:
+            player.hand = sample.full_hand
+            player.drawn_card = sample.winning_card
+            rule.score_rules._calculate_fans(player, sample.winning_card)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="番型判定剖析")
+    parser.add_argument('--size', type=int, default=200, help="每类语料样本数（0为不使用语料）")
+    parser.add_argument('--games', type=int, default=50, help="模拟对局数（0为不模拟）")
+    parser.add_argument('--seed', type=int, default=20240601, help="随机种子")
+    parser.add_argument('--sort', default='total', choices=('total', 'calls', 'hit_rate'), help="排序依据")
+    parser.add_argument('--limit', type=int, default=None, help="最多打印的行数")
+    args = parser.parse_args(argv)
+
+    rule = TencentCommonRule()
+    with rule.score_rules.profile() as profiler:
+        if args.size:
+            profile_corpus(rule, args.size, args.seed)
+        if args.games:
+            play_games(args.games, args.seed, rule)
+    profiler.print_report(args.sort, args.limit)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,6 +8,7 @@ from src.core.data.game_state import GameState
 from src.core.data.player import Player
 from src.rules.tencent_common.rule import TencentCommonRule
 from src.ui.ai_integration import AIDecisionManager
+from src.ui.hint_worker import HintWorker
 
 class MahjongCLIGame:
     """麻将游戏命令行版本"""
@@ -16,8 +17,11 @@ class MahjongCLIGame:
         # 初始化游戏规则
         self.rule = TencentCommonRule()
         
-        # 初始化AI决策管理器
-        self.ai_manager = AIDecisionManager()
+        # 初始化AI决策管理器（共享同一个规则实例）
+        self.ai_manager = AIDecisionManager(self.rule)
+        
+        # 玩家思考时在后台预先计算AI提示
+        self.hints = HintWorker(self.ai_manager)
         
         # 创建游戏状态
         self.game_state = self._create_initial_game_state()
@@ -72,13 +76,15 @@ class MahjongCLIGame:
         if not self.game_state.current_player.is_ai:  # 只有人类玩家才显示AI推荐
             print("\n" + "=" * 60)
             print("AI智能推荐:")
-            best_card, reason = self.ai_manager.get_best_discard(self.game_state.current_player, self.game_state)
+            # 优先使用后台预先算好的提示
+            player = self.game_state.current_player
+            analysis = self.hints.discard_hint(player, self.game_state) or self.ai_manager.analyze(player, self.game_state)
+            best_card, reason, danger_cards = analysis
             print(f"推荐出牌: {best_card.get_display_name()}")
             print(f"推荐理由: {reason}")
             
             # 显示危险牌分析
             print("\n危险牌分析:")
-            danger_cards = self.ai_manager.analyze_danger_cards(self.game_state.current_player, self.game_state)
             for card, risk in list(danger_cards.items())[:5]:  # 只显示前5个危险牌
                 risk_level = "高" if risk > 0.7 else "中" if risk > 0.3 else "低"
                 print(f"{card.get_display_name()}: 风险等级{risk_level} (风险值: {risk:.2f})")
@@ -123,6 +129,9 @@ class MahjongCLIGame:
             
             # 如果是当前玩家的回合
             if not self.game_state.current_player.is_ai:
+                # 等待输入期间在后台推演接下来的局面
+                self.hints.speculate(self.game_state.current_player, self.game_state)
+                
                 # 获取玩家输入
                 choice = self._get_player_input()
                 
@@ -151,6 +160,7 @@ class MahjongCLIGame:
                 print(f"{self.game_state.current_player.name}打出: {best_card.get_display_name()}")
                 self._handle_player_action("discard", best_card)
         
+        self.hints.close()
         print("\n游戏结束！")
     
     def _handle_player_discard(self):
@@ -1,9 +1,8 @@
-import tkinter as tk
 from src.core.data.game_state import GameState
 from src.core.data.player import Player
 from src.rules.tencent_common.rule import TencentCommonRule
-from src.ui.mahjong_ui import MahjongUI, configure_card_styles
 from src.ui.ai_integration import AIDecisionManager
+from src.ui.hint_worker import HintWorker
 
 class MahjongGame:
     """麻将游戏主控制器"""
@@ -12,13 +11,18 @@ class MahjongGame:
         # 初始化游戏规则
         self.rule = TencentCommonRule()
         
-        # 初始化AI决策管理器
-        self.ai_manager = AIDecisionManager()
+        # 初始化AI决策管理器（共享同一个规则实例）
+        self.ai_manager = AIDecisionManager(self.rule)
+        
+        # 玩家思考时在后台预先计算AI提示
+        self.hints = HintWorker(self.ai_manager)
         
         # 创建游戏状态
         self.game_state = self._create_initial_game_state()
         
-        # 初始化GUI
+        # 初始化GUI（tkinter只在真正创建窗口时导入）
+        import tkinter as tk
+        from src.ui.mahjong_ui import MahjongUI, configure_card_styles
         self.root = tk.Tk()
         configure_card_styles(self.root)
         self.ui = MahjongUI(self.root, self.game_state)
@@ -69,12 +73,18 @@ class MahjongGame:
         """更新AI推荐"""
         current_player = self.game_state.players[self.game_state.current_player_index]
         if current_player.type == "human":  # 只有人类玩家才显示AI推荐
-            best_card, reason = self.ai_manager.get_best_discard(current_player, self.game_state)
+            analysis = self.hints.discard_hint(current_player, self.game_state) or self.ai_manager.analyze(current_player, self.game_state)
+            best_card, reason, _ = analysis
             self.ui.set_ai_recommendation(best_card, reason)
+            # 等待玩家操作期间在后台推演接下来的局面
+            self.hints.speculate(current_player, self.game_state)
     
     def run(self):
         """运行游戏"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.hints.close()
 
 if __name__ == "__main__":
     game = MahjongGame()
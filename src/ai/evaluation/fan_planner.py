@@ -0,0 +1,169 @@
+"""高番目标规划
+
+估计当前手牌做成几种高番牌型（清一色、混一色、碰碰胡）的距离，
+即只按该牌型计算的向听数，再结合普通向听数和剩余摸牌次数估计期望番数：
+
+- 清一色（某花色）：只看该花色的牌，按标准型拆分
+- 混一色（某花色）：只看该花色和字牌，按标准型拆分
+- 碰碰胡：只能由刻子和将牌组成，按各种牌的张数直接得到
+
+七对、十三幺不作为目标：规则的和牌判定只接受标准型。
+
+各花色的拆分组合（面子、搭子、将牌数）查询按花色牌型缓存的拆分表
+（kernels.group_options），与普通向听数使用同一张表，各牌型只是合并不同的
+花色子集，因此求全部牌型的距离与一次向听数计算的开销相当。逐个候选评估
+打出的牌时只有该牌所在花色的拆分变化，其余花色的结果直接复用。
+
+TencentScoreRules只在手牌为14张（没有副露）时判定这几种番型，因此有副露时
+不规划目标。番数从规则的计分规则（FAN_VALUES）读取，按max_fans封顶；
+没有规则时每个目标记为1番。
+"""
+from src.core.data.tile import NUM_TILE_TYPES
+from src.core.tables.kernels import group_options
+from src.ai.evaluation.tile_efficiency import SUITS, combine_options, standard_shanten
+
+# 目标牌型（名称与计分规则的FAN_VALUES一致）
+QING_YI_SE = '清一色'
+HUN_YI_SE = '混一色'
+PENG_PENG_HU = '碰碰胡'
+TARGETS = (QING_YI_SE, HUN_YI_SE, PENG_PENG_HU)
+
+REACH_DECAY = 0.3  # 目标距离每比普通向听数（各打法中最小的）多1，做成的可能性乘以该系数
+
+EMPTY = frozenset({(0, 0, 0)})
+HONORS = 3  # 字牌在SUITS中的下标
+
+
+def _suit_targets(options, sizes) -> list:
+    """由各花色的拆分组合得到清一色、混一色的距离
+
+    拆分只看目标花色内的牌，牌数不足时每次摸牌最多换进一张有用的牌，
+    因此距离至少为 13 - 有用的牌数。
+
+    Args:
+        options: 各花色的拆分组合
+        sizes: 各花色的牌数
+
+    Returns:
+        list: [(牌型, 花色下标, 距离)]
+    """
+    honors = options[HONORS]
+    return [(name, s, _distance(options[s], extra, sizes[s] + extra_size))
+            for s in range(HONORS)
+            for name, extra, extra_size in ((QING_YI_SE, EMPTY, 0), (HUN_YI_SE, honors, sizes[HONORS]))]
+
+
+def _distance(options, extra, size: int) -> int:
+    """由目标花色（及字牌）的拆分组合和牌数得到距离"""
+    return max(standard_shanten(combine_options(options, extra)), 13 - size)
+
+
+def _pong_distance(triplets: int, pairs: int) -> int:
+    """碰碰胡的距离：刻子作面子、对子作搭子或将牌"""
+    best = 8 - 2 * triplets - min(pairs, 4 - triplets)
+    if pairs:
+        best = min(best, 7 - 2 * triplets - min(pairs - 1, 4 - triplets))
+    return best
+
+
+class FanPlanner:
+    """高番目标的距离和期望番数"""
+
+    def __init__(self, rule=None, decay: float = REACH_DECAY):
+        """
+        Args:
+            rule: 可选，游戏规则（从其计分规则读取番数，按max_fans封顶）
+            decay: 目标距离每比普通向听数多1时可能性的衰减系数
+        """
+        self.decay = decay
+        values = getattr(getattr(rule, 'score_rules', None), 'FAN_VALUES', {})
+        cap = getattr(rule, 'max_fans', None)
+        self.fans = {}
+        for name in TARGETS:
+            fans = values.get(name, 1)
+            self.fans[name] = min(fans, cap) if cap else fans
+
+    def targets(self, counts, melds=()) -> list:
+        """当前手牌各目标牌型的距离
+
+        Args:
+            counts: 暗牌计数（只取前NUM_TILE_TYPES种）
+            melds: 副露（有副露时这几种番型不计分，返回空列表）
+
+        Returns:
+            list: [(牌型, 番数（封顶后）, 距离)]，按距离从近到远、番数从高到低排列；
+                清一色、混一色只列出距离最近的花色
+        """
+        if len(melds):
+            return []
+        hand = tuple(counts[:NUM_TILE_TYPES])
+        options = [group_options(hand[start:start + length], seq) for start, length, seq in SUITS]
+        sizes = [sum(hand[start:start + length]) for start, length, _ in SUITS]
+        best = {}
+        for name, _, distance in _suit_targets(options, sizes):
+            best[name] = min(best.get(name, distance), distance)
+        triplets = sum(1 for n in hand if n >= 3)
+        pairs = sum(1 for n in hand if n == 2)
+        best[PENG_PENG_HU] = _pong_distance(triplets, pairs)
+        return sorted(((name, self.fans[name], distance) for name, distance in best.items()),
+                      key=lambda item: (item[2], -item[1]))
+
+    def evaluate_discards(self, counts, shantens, draws: int = None, melds=()) -> dict:
+        """打出每种牌后最有希望的目标和期望番数
+
+        Args:
+            counts: 暗牌计数（张数除以3余2，只取前NUM_TILE_TYPES种）
+            shantens: {牌编号: 打出该牌后的普通向听数}，只评估其中的牌；
+                其中的最小值作为衡量目标距离的基准
+            draws: 剩余摸牌次数，距离不小于该值的目标视为无法做成；为None时不限制
+            melds: 副露（有副露时返回空字典）
+
+        Returns:
+            dict: {牌编号: (牌型, 距离, 期望番数)}，没有可能做成的目标时牌型为None、期望番数为0
+        """
+        if len(melds):
+            return {}
+        hand = list(counts[:NUM_TILE_TYPES])
+        groups = [tuple(hand[start:start + length]) for start, length, _ in SUITS]
+        options = [group_options(group, seq) for group, (_, _, seq) in zip(groups, SUITS)]
+        sizes = [sum(group) for group in groups]
+        base = _suit_targets(options, sizes)
+        triplets = sum(1 for n in hand if n >= 3)
+        pairs = sum(1 for n in hand if n == 2)
+
+        # 以各打法中最小的普通向听数为基准，退向听的打法不会因此显得离目标更近
+        reference = min(shantens.values(), default=0)
+        results = {}
+        for tid in shantens:
+            n = hand[tid]
+            if not n:
+                continue
+            s = min(tid // 9, HONORS)
+            start, length, seq = SUITS[s]
+            group = list(groups[s])
+            group[tid - start] -= 1
+            changed = list(options)
+            changed[s] = group_options(tuple(group), seq)
+            sizes[s] -= 1
+            # 只有打出的牌所在的花色（打字牌时是全部混一色）需要重新合并
+            distances = [(name, suit, distance if suit != s and (s != HONORS or name == QING_YI_SE)
+                          else _distance(changed[suit], changed[HONORS] if name == HUN_YI_SE else EMPTY,
+                                         sizes[suit] + (sizes[HONORS] if name == HUN_YI_SE else 0)))
+                         for name, suit, distance in base]
+            sizes[s] += 1
+            t3 = triplets - (n == 3)
+            t2 = pairs - (n == 2) + (n == 3)
+            distances.append((PENG_PENG_HU, -1, _pong_distance(t3, t2)))
+            results[tid] = self._best(distances, reference, draws)
+        return results
+
+    def _best(self, distances, reference: int, draws) -> tuple:
+        """在各目标中取期望番数最高的一个"""
+        best = (None, None, 0.0)
+        for name, _, distance in distances:
+            if draws is not None and distance >= draws:
+                continue
+            expected = self.fans[name] * self.decay ** max(distance - reference, 0)
+            if expected > best[2]:
+                best = (name, distance, expected)
+        return best
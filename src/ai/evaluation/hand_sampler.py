@@ -0,0 +1,185 @@
+"""对手暗手牌抽样
+
+从某个玩家的角度，按可见信息（自己的手牌、各家面子、弃牌堆、花牌、
+各家手牌张数、牌墙剩余张数）随机抽取对手的暗手牌和牌墙顺序，
+作为基于抽样的风险评估和搜索的基础。
+
+未见的牌在构造时一次算好，每次抽样只在预先分配的数组上做部分
+Fisher–Yates洗牌，结果写入复用的计数数组，不创建牌对象：
+
+- hands[i]: 第i个对手（seats[i]）暗手牌的计数数组（长度NUM_TILE_TYPES）
+- wall: 牌墙顺序（与Wall相同，最后一个元素最先被摸到）
+
+对手的暗手牌中不会有花牌（摸到即补花），未见的花牌只出现在牌墙中。
+
+可按对手打过的牌降低其持有同种牌的概率：每抽到一张牌，以该对手对这种牌的
+权重（0-1）接受，不接受时重新抽取，相当于按 未见张数 × 权重 成比例抽取。
+"""
+import random
+
+from src.core.data.tile import NUM_ALL_TILE_TYPES, NUM_TILE_TYPES
+
+MAX_REJECTS = 8  # 同一张牌连续被拒绝的次数上限（超出时直接接受，避免权重全为0时死循环）
+
+
+def discard_weights(tiles, factor: float = 0.5) -> list:
+    """由对手打过的牌得到持有各种牌的权重
+
+    打过的牌（现物）说明对手多半不再需要，权重乘以factor（打过多张时连乘）。
+
+    Args:
+        tiles: 对手打过的牌编号序列
+        factor: 每打过一张的权重系数
+
+    Returns:
+        list: 长度NUM_TILE_TYPES的权重
+    """
+    weights = [1.0] * NUM_TILE_TYPES
+    for tid in tiles:
+        if 0 <= tid < NUM_TILE_TYPES:
+            weights[tid] *= factor
+    return weights
+
+
+class HandSampler:
+    """与可见信息一致的对手暗手牌和牌墙抽样器"""
+
+    def __init__(self, game_state, player, rng=None, discards=None, discard_factor: float = 0.5):
+        """
+        Args:
+            game_state: 当前游戏状态（只在构造时读取，之后的变化不会反映到抽样中）
+            player: 观察者（其手牌视为已知）
+            rng: 随机数生成器，默认新建一个random.Random
+            discards: {座位: 该对手打过的牌编号序列}，用于降低其持有同种牌的概率；
+                为None时取自各座位的弃牌河（game_state.rivers），传入空字典则不加偏置
+            discard_factor: 每打过一张的权重系数（见discard_weights）
+
+        Raises:
+            ValueError: 未见的牌不足以填满对手手牌和牌墙
+        """
+        self.rng = rng or random.Random()
+        self.seats = []
+        self.sizes = []
+        self._weights = []
+        if discards is None:
+            discards = {seat: river.tiles for seat, river in game_state.rivers.rivers.items()}
+        for other in game_state.players:
+            if other is player:
+                continue
+            self.seats.append(other.seat)
+            self.sizes.append(len(other.hand))
+            history = discards.get(other.seat)
+            self._weights.append(discard_weights(history, discard_factor) if history else None)
+
+        self.unseen = self.unseen_counts(game_state, player)
+        self._tiles = bytes(tid for tid in range(NUM_TILE_TYPES) for _ in range(self.unseen[tid]))
+        self._flowers = bytes(tid for tid in range(NUM_TILE_TYPES, NUM_ALL_TILE_TYPES)
+                              for _ in range(self.unseen[tid]))
+        self.concealed = sum(self.sizes)
+        self.wall_size = len(game_state.deck)
+        if self.concealed > len(self._tiles) or \
+                self.concealed + self.wall_size > len(self._tiles) + len(self._flowers):
+            raise ValueError(f"未见的牌（{len(self._tiles)}张，花牌{len(self._flowers)}张）"
+                             f"不足以填满对手手牌（{self.concealed}张）和牌墙（{self.wall_size}张）")
+
+        self._pool = bytearray(self._tiles)
+        self._zeros = [0] * NUM_TILE_TYPES
+        self.hands = [[0] * NUM_TILE_TYPES for _ in self.seats]
+        self.wall = bytearray(self.wall_size)
+
+    @staticmethod
+    def unseen_counts(game_state, player) -> list:
+        """从该玩家的角度每种牌未见的张数
+
+        Args:
+            game_state: 当前游戏状态
+            player: 观察者
+
+        Returns:
+            list: 长度NUM_ALL_TILE_TYPES，初始牌组中的张数减去已见的张数
+        """
+        unseen = [0] * NUM_ALL_TILE_TYPES
+        for tid in game_state.rule.initial_tile_ids():
+            unseen[tid] += 1
+        counts = player.hand.counts
+        discarded = game_state.discard_counts
+        for tid in range(NUM_ALL_TILE_TYPES):
+            unseen[tid] -= counts[tid] + discarded[tid]
+        for other in game_state.players:
+            for tid, n in enumerate(other.melds.counts):
+                unseen[tid] -= n
+            for card in other.hua_cards:
+                unseen[card.tile_id] -= 1
+        return [max(n, 0) for n in unseen]
+
+    def sample(self, with_wall: bool = False) -> list:
+        """抽取一组对手暗手牌（结果写入self.hands，下次抽样时被覆盖）
+
+        Args:
+            with_wall: 是否同时抽取牌墙顺序（写入self.wall）
+
+        Returns:
+            list: self.hands
+        """
+        pool = self._pool
+        pool[:] = self._tiles
+        n = len(pool)
+        rand = self.rng.random
+        pos = 0
+        for counts, size, weights in zip(self.hands, self.sizes, self._weights):
+            counts[:] = self._zeros
+            for _ in range(size):
+                j = pos + int(rand() * (n - pos))
+                tid = pool[j]
+                if weights is not None:
+                    rejects = 0
+                    while rejects < MAX_REJECTS and rand() >= weights[tid]:
+                        rejects += 1
+                        j = pos + int(rand() * (n - pos))
+                        tid = pool[j]
+                pool[j] = pool[pos]
+                pool[pos] = tid
+                pos += 1
+                counts[tid] += 1
+        if with_wall:
+            self._sample_wall(pos)
+        return self.hands
+
+    def _sample_wall(self, start: int) -> None:
+        """用对手手牌以外的未见牌（含花牌）随机排出牌墙"""
+        rest = self._pool[start:] + self._flowers
+        rand = self.rng.random
+        for i in range(len(rest) - 1, 0, -1):
+            j = int(rand() * (i + 1))
+            rest[i], rest[j] = rest[j], rest[i]
+        self.wall[:] = rest[:self.wall_size]
+
+    def samples(self, count: int, with_wall: bool = False):
+        """连续抽样count次
+
+        Args:
+            count: 抽样次数
+            with_wall: 是否同时抽取牌墙顺序
+
+        Yields:
+            list: self.hands（每次都是同一组数组，需要保留时应复制）
+        """
+        for _ in range(count):
+            yield self.sample(with_wall)
+
+    def holding_frequency(self, count: int) -> list:
+        """抽样估计每个对手持有各种牌的概率
+
+        Args:
+            count: 抽样次数
+
+        Returns:
+            list: 每个对手一个长度NUM_TILE_TYPES的列表，值为持有至少一张的样本比例
+        """
+        totals = [[0] * NUM_TILE_TYPES for _ in self.seats]
+        for hands in self.samples(count):
+            for total, counts in zip(totals, hands):
+                for tid in range(NUM_TILE_TYPES):
+                    if counts[tid]:
+                        total[tid] += 1
+        return [[n / count for n in total] for total in totals] if count else totals
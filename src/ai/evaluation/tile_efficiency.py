@@ -0,0 +1,236 @@
+"""两步牌效率
+
+一步牌效率（进张数）：打出候选牌后，摸到哪些牌能减少向听数，按未见张数加权。
+两步牌效率：对每种有效进张，摸到后再打出一张保持进展的牌，取其中进张数
+最多的打法，按摸到该进张的张数加权求和。它能区分进张数相同、但进张后
+形状好坏不同的打法（如好型搭子与坎张、边张）。
+
+每个候选约要计算34种进张 × 14种打法的中间手牌，逐一调用向听数过慢，
+因此按以下层次缓存，缓存键只含手牌（与未见张数无关），同一回合的各候选
+之间、以及跨回合（手牌只差一张，大部分中间手牌相同）都可以复用：
+
+- 进张：13张手牌 -> (向听数, 有效进张位图)
+- 进张后的形状：14张手牌 -> 打出一张保持进展后的各种13张手牌的有效进张位图
+- 花色：摸到某花色的牌只改变该花色的拆分，其余花色的拆分组合（面子、搭子、
+  将牌数）合并一次后，以 (该花色的牌型, 其余花色的组合) 为键缓存该花色
+  每种牌的效果；中间手牌之间通常只有一两个花色不同，大部分查询命中
+
+与规则的和牌判定（can_hu、ClaimIndex）一致，只按标准型计算向听数和进张。
+查询时只需按未见张数对位图加权求和。
+"""
+import threading
+from functools import lru_cache
+
+from src.core.data.tile import NUM_TILE_TYPES
+from src.core.tables.kernels import group_options
+
+MAX_CACHE = 1 << 15  # 每个缓存的容量（超出时清空）
+MAX_SHANTEN = 2       # 向听数超过该值时只计算一步牌效率（进张种类多，两步的开销大而区分度低）
+TOP_CANDIDATES = 4    # 只对一步进张数最多的几种打法计算两步牌效率
+
+SUITS = ((0, 9, True), (9, 9, True), (18, 9, True), (27, 7, False))  # (起始编号, 种类数, 能否组成顺子)
+
+
+@lru_cache(maxsize=1 << 14)
+def combine_options(a: frozenset, b: frozenset) -> frozenset:
+    """合并两组 (面子数, 搭子数, 将牌数) 组合，只保留不被支配的组合"""
+    combined = {(min(m1 + m2, 4), min(p1 + p2, 4), pr1 + pr2)
+                for m1, p1, pr1 in a for m2, p2, pr2 in b if pr1 + pr2 <= 1}
+    # 向听数对面子数、搭子数单调，将牌数相同时被支配的组合不影响结果
+    return frozenset(o for o in combined
+                     if not any(q != o and q[2] == o[2] and q[0] >= o[0] and q[1] >= o[1]
+                                for q in combined))
+
+
+@lru_cache(maxsize=1 << 14)
+def standard_shanten(options: frozenset) -> int:
+    """由全部花色合并后的组合得到标准型向听数"""
+    return min(8 - 2 * m - min(p, 4 - m) - pr for m, p, pr in options)
+
+
+def _decompose(hand: tuple, declared: int) -> tuple:
+    """按花色拆分手牌
+
+    Returns:
+        tuple: (各花色的牌型, 各花色以外（含副露）的组合, 标准型向听数)
+    """
+    groups = [hand[start:start + length] for start, length, _ in SUITS]
+    options = [group_options(group, seq) for group, (_, _, seq) in zip(groups, SUITS)]
+    prefix = [frozenset({(min(declared, 4), 0, 0)})]
+    for opts in options[:-1]:
+        prefix.append(combine_options(prefix[-1], opts))
+    suffix = [frozenset({(0, 0, 0)})]
+    for opts in reversed(options[1:]):
+        suffix.append(combine_options(suffix[-1], opts))
+    suffix.reverse()
+    others = [combine_options(before, after) for before, after in zip(prefix, suffix)]
+    return groups, others, standard_shanten(combine_options(prefix[-1], options[-1]))
+
+
+def weighted(mask: int, left) -> int:
+    """位图中各种牌的剩余张数之和"""
+    total = 0
+    while mask:
+        low = mask & -mask
+        total += left[low.bit_length() - 1]
+        mask ^= low
+    return total
+
+
+class TileEfficiency:
+    """一步、两步牌效率计算器（缓存跨回合保留）"""
+
+    def __init__(self, max_cache: int = MAX_CACHE, max_shanten: int = MAX_SHANTEN,
+                 top_candidates: int = TOP_CANDIDATES):
+        """
+        Args:
+            max_cache: 每个缓存的容量
+            max_shanten: 计算两步牌效率的最大向听数
+            top_candidates: 计算两步牌效率的候选数
+        """
+        self.max_cache = max_cache
+        self.max_shanten = max_shanten
+        self.top_candidates = top_candidates
+        self._accept = {}  # (13张手牌, 副露数) -> (向听数, 有效进张位图)
+        self._follow = {}  # (14张手牌, 副露数) -> 保持进展的打法的有效进张位图元组
+        self._suit = {}    # (花色, 该花色牌型, 其余花色的组合, 向听数) -> 该花色有效进张的位图
+        self._lock = threading.Lock()  # 后台提示线程与主线程可能共用同一个策略实例
+
+    def clear(self) -> None:
+        self._accept.clear()
+        self._follow.clear()
+        self._suit.clear()
+
+    def evaluate(self, counts, unseen, declared: int = 0, second_order: bool = True) -> dict:
+        """计算打出每种牌后的牌效率
+
+        Args:
+            counts: 暗牌计数（张数除以3余2，只取前NUM_TILE_TYPES种）
+            unseen: 每种牌未见的张数
+            declared: 副露的面子数
+            second_order: 是否计算两步牌效率（只对向听数最小、未听牌且向听数不超过max_shanten时，
+                一步进张数最多的top_candidates种打法计算）
+
+        Returns:
+            dict: {牌编号: (向听数, 进张数, 两步进张数)}，未计算两步时为0
+        """
+        counts = list(counts[:NUM_TILE_TYPES])
+        left = list(unseen[:NUM_TILE_TYPES])
+        results = {}
+        with self._lock:
+            for c in range(NUM_TILE_TYPES):
+                if not counts[c]:
+                    continue
+                counts[c] -= 1
+                shanten, mask = self.acceptance(tuple(counts), declared)
+                results[c] = (shanten, weighted(mask, left), mask)
+                counts[c] += 1
+            if not results:
+                return {}
+            best = min(shanten for shanten, _, _ in results.values())
+            chosen = ()
+            if second_order and 0 < best <= self.max_shanten:
+                chosen = sorted((c for c, (shanten, _, _) in results.items() if shanten == best),
+                                key=lambda c: -results[c][1])[:self.top_candidates]
+            for c, (shanten, first, mask) in results.items():
+                second = 0
+                if c in chosen:
+                    counts[c] -= 1
+                    second = self._second_order(counts, mask, left, declared)
+                    counts[c] += 1
+                results[c] = (shanten, first, second)
+        return results
+
+    def acceptance(self, hand: tuple, declared: int = 0) -> tuple:
+        """13张手牌（张数除以3余1）的向听数和有效进张位图（缓存）
+
+        Args:
+            hand: 暗牌计数元组（长度NUM_TILE_TYPES）
+            declared: 副露的面子数
+
+        Returns:
+            tuple: (向听数, 第t位为1表示摸到t后向听数减少)
+        """
+        key = (hand, declared)
+        cached = self._accept.get(key)
+        if cached is not None:
+            return cached
+
+        groups, others, current = _decompose(hand, declared)
+        mask = 0
+        for s, (start, length, seq) in enumerate(SUITS):
+            mask |= self._suit_mask(s, groups[s], seq, others[s], current) << start
+
+        if len(self._accept) >= self.max_cache:
+            self._accept.clear()
+        self._accept[key] = result = (current, mask)
+        return result
+
+    def _suit_mask(self, suit: int, group: tuple, seq: bool, others: frozenset, current: int) -> int:
+        """该花色摸到后标准型向听数低于current的牌的位图（以该花色的第一种牌为第0位）"""
+        key = (suit, group, others, current)
+        cached = self._suit.get(key)
+        if cached is not None:
+            return cached
+        counts = list(group)
+        mask = 0
+        for i in range(len(counts)):
+            if counts[i] >= 4:
+                continue
+            counts[i] += 1
+            if standard_shanten(combine_options(others, group_options(tuple(counts), seq))) < current:
+                mask |= 1 << i
+            counts[i] -= 1
+        if len(self._suit) >= self.max_cache:
+            self._suit.clear()
+        self._suit[key] = mask
+        return mask
+
+    def _second_order(self, hand, mask, left, declared) -> int:
+        """Σ 摸到有效进张t的张数 × 摸到t后最优打法的进张数"""
+        total = 0
+        while mask:
+            low = mask & -mask
+            t = low.bit_length() - 1
+            mask ^= low
+            n = left[t]
+            if not n:
+                continue
+            hand[t] += 1
+            follow = self._follow_masks(tuple(hand), declared)
+            hand[t] -= 1
+            left[t] -= 1
+            total += n * max((weighted(m, left) for m in follow), default=0)
+            left[t] += 1
+        return total
+
+    def _follow_masks(self, hand: tuple, declared: int) -> tuple:
+        """14张手牌打出一张后向听数最小的各种打法的有效进张位图（缓存）"""
+        key = (hand, declared)
+        cached = self._follow.get(key)
+        if cached is not None:
+            return cached
+        # 先按花色增量求出每种打法后的向听数，只对向听数最小的打法计算进张
+        groups, others, _ = _decompose(hand, declared)
+        shantens = {}
+        for s, (start, length, seq) in enumerate(SUITS):
+            group = list(groups[s])
+            for i in range(length):
+                if not group[i]:
+                    continue
+                group[i] -= 1
+                shantens[start + i] = standard_shanten(combine_options(others[s], group_options(tuple(group), seq)))
+                group[i] += 1
+        target = min(shantens.values())
+        counts = list(hand)
+        masks = set()
+        for x, value in shantens.items():
+            if value == target:
+                counts[x] -= 1
+                masks.add(self.acceptance(tuple(counts), declared)[1])
+                counts[x] += 1
+        result = tuple(masks)
+        if len(self._follow) >= self.max_cache:
+            self._follow.clear()
+        self._follow[key] = result
+        return result
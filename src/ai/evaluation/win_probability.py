@@ -0,0 +1,331 @@
+"""剩余摸牌次数内和牌的概率
+
+对每个出牌候选，按动态规划计算在自己剩余的摸牌次数内和牌的概率和期望番数：
+
+    P(H, d) = Σ p(t) · 胡(H+t) 或 max_x P(H+t-x, d-1)    （有效进张t）
+            + (1 - Σ p(t)) · P(H, d-1)                    （其他摸牌摸切）
+
+其中H为打出候选牌后的暗牌计数，d为剩余摸牌次数，p(t)为摸到t的概率
+（未见张数减去比出牌前的14张多出的张数，即之后摸进并留在手里的张数，除以未见总数）。
+
+- 只考虑减少向听数的进张和保持进展的出牌（摸到无用牌时摸切），
+  因此结果是该打法下的精确值、最优打法下的下界
+- 向听数不小于剩余摸牌次数、或超过max_shanten的手牌直接剪枝为0，
+  打出后退向听的候选也记为0
+- 听牌后每次摸牌和牌的概率w固定，P = 1 - (1 - w)^d 直接求出，不再展开；
+  一向听摸到有效牌后的最优打法（w最大）与d无关，每种14张只算一次
+- 子问题以 (计数, 剩余摸牌次数) 为键缓存，同一回合（出牌前的14张相同）的各出牌候选共享
+- 与规则的和牌判定（can_hu、ClaimIndex）一致，只按标准型计算向听数和听牌
+
+和牌时的番数由规则的_calculate_fans计算（按花色置换规范化缓存），
+没有规则时每次和牌记为1番。
+"""
+import threading
+
+from src.ai.evaluation.tile_efficiency import SUITS, combine_options, standard_shanten
+from src.core.data.hand import Hand
+from src.core.data.tile import NUM_TILE_TYPES, card_from_id
+from src.core.tables import canonical
+from src.core.tables.kernels import group_options
+
+MAX_DRAWS = 6     # 默认最多展开的摸牌次数（更多时按此截断，结果为下界）
+MAX_SHANTEN = 1   # 默认只展开向听数不超过该值的手牌（更远的手牌记为0，结果为下界）
+MAX_SHANTEN_CACHE = 1 << 15
+
+
+def own_draws(player, game_state) -> int:
+    """该玩家在牌墙摸完前还能摸几张牌（不计吃碰杠改变的顺序）
+
+    Args:
+        player: 玩家（刚摸牌、即将出牌）
+        game_state: 当前游戏状态
+
+    Returns:
+        int: 剩余摸牌次数
+    """
+    count = len(game_state.players) or 1
+    return len(game_state.deck) // count
+
+
+class WinProbability:
+    """和牌概率和期望番数计算器"""
+
+    def __init__(self, rule=None, max_draws: int = MAX_DRAWS, max_shanten: int = MAX_SHANTEN):
+        """
+        Args:
+            rule: 规则实例（用于计算番数，为空时每次和牌记为1番）
+            max_draws: 最多展开的摸牌次数
+            max_shanten: 最多展开的向听数（每增加1，状态数约增加两个数量级）
+        """
+        self.rule = rule
+        self.max_draws = max_draws
+        self.max_shanten = max_shanten
+        self._memo = {}
+        self._unseen = None
+        self._base = None
+        self._total = 0
+        self._declared = 0
+        self._player = None
+        self._shanten = {}
+        self._lock = threading.Lock()  # 后台提示线程与主线程可能共用同一个策略实例
+
+    def clear(self) -> None:
+        """清空子问题和向听数缓存"""
+        with self._lock:
+            self._memo.clear()
+            self._shanten.clear()
+            self._base = self._unseen = self._player = None
+
+    def evaluate(self, player, game_state, draws: int = None) -> dict:
+        """计算打出每种手牌后的和牌概率和期望番数
+
+        Args:
+            player: 当前玩家（手牌张数除以3余2）
+            game_state: 当前游戏状态
+            draws: 剩余摸牌次数，默认由牌墙剩余张数估计
+
+        Returns:
+            dict: {牌: (和牌概率, 期望番数)}
+        """
+        from src.ai.evaluation.hand_sampler import HandSampler
+        if draws is None:
+            draws = own_draws(player, game_state)
+        unseen = HandSampler.unseen_counts(game_state, player)[:NUM_TILE_TYPES]
+        counts = list(player.hand.counts[:NUM_TILE_TYPES])
+        return self.evaluate_counts(counts, unseen, draws, player)
+
+    def evaluate_counts(self, counts, unseen, draws: int, player=None) -> dict:
+        """由计数数组计算打出每种牌后的和牌概率和期望番数
+
+        Args:
+            counts: 暗牌计数（长度NUM_TILE_TYPES，张数除以3余2）
+            unseen: 每种牌未见的张数
+            draws: 剩余摸牌次数
+            player: 可选，和牌玩家（用于计算番数时的面子、门风等）
+
+        Returns:
+            dict: {牌: (和牌概率, 期望番数)}
+        """
+        counts = list(counts)
+        draws = min(draws, self.max_draws)
+        results = {}
+        with self._lock:
+            self._begin(counts, unseen, player)
+            candidates = {}
+            for tid in range(NUM_TILE_TYPES):
+                if counts[tid]:
+                    counts[tid] -= 1
+                    candidates[tid] = tuple(counts)
+                    counts[tid] += 1
+            if not candidates:
+                return results
+            # 只展开打出后向听数最小的候选（退向听的打法记为0）
+            target = min(self._shanten_of(hand) for hand in candidates.values())
+            for tid, hand in candidates.items():
+                if self._shanten_of(hand) == target:
+                    results[card_from_id(tid)] = self._solve(hand, draws)
+                else:
+                    results[card_from_id(tid)] = (0.0, 0.0)
+        return results
+
+    def _begin(self, counts, unseen, player):
+        """开始新的一次计算（手牌、未见的牌或玩家不同时子问题不能共享）"""
+        base = tuple(counts)
+        unseen = tuple(unseen)
+        declared = len(player.melds) if player is not None else 0
+        if (base, unseen, declared) != (self._base, self._unseen, self._declared) \
+                or player is not self._player:
+            self._memo.clear()
+        if declared != self._declared:
+            self._shanten.clear()
+        self._base = base
+        self._unseen = unseen
+        self._total = sum(unseen)
+        self._declared = declared
+        self._player = player
+
+    def _solve(self, hand: tuple, draws: int) -> tuple:
+        """P(hand, draws)：返回 (和牌概率, 期望番数)"""
+        key = (hand, draws)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+        current = self._shanten_of(hand)
+        if draws <= 0 or current >= draws or current > self.max_shanten or not self._total:
+            self._memo[key] = result = (0.0, 0.0)
+            return result
+        if current == 0:
+            self._memo[key] = result = self._tenpai_result(hand, draws)
+            return result
+
+        unseen, base, total = self._unseen, self._base, self._total
+        prob = value = 0.0
+        useless = 1.0
+        counts = list(hand)
+        isolated = None
+        for t in range(NUM_TILE_TYPES):
+            left = unseen[t] - max(hand[t] - base[t], 0)
+            if left <= 0:
+                continue
+            counts[t] += 1
+            if self._isolated(hand, t):
+                # 孤张不能与手牌组成对子或搭子，摸到哪一种的向听数都相同，只算一次
+                if isolated is None:
+                    isolated = self._shanten_of(counts)
+                after = isolated
+            else:
+                after = self._shanten_of(counts)
+            if after < current:
+                p = left / total
+                useless -= p
+                if after == 0:
+                    tenpai = self._best_tenpai(tuple(counts))
+                    best = self._tenpai_result(tenpai, draws - 1) if tenpai else (0.0, 0.0)
+                else:
+                    best = self._best_discard(counts, after, draws - 1)
+                prob += p * best[0]
+                value += p * best[1]
+            counts[t] -= 1
+        if useless > 0:
+            rest = self._solve(hand, draws - 1)
+            prob += useless * rest[0]
+            value += useless * rest[1]
+        self._memo[key] = result = (prob, value)
+        return result
+
+    def _tenpai_result(self, hand: tuple, draws: int) -> tuple:
+        """听牌时每次摸牌和牌的概率固定为w，draws次内和牌的概率为 1 - (1 - w)^draws"""
+        wins = self._win_rate(hand)
+        if not wins or draws <= 0:
+            return 0.0, 0.0
+        prob = 1.0 - (1.0 - wins) ** draws
+        return prob, prob * self._fan_sum(hand) / wins
+
+    def _win_rate(self, hand: tuple) -> float:
+        """13张听牌手牌每次摸牌和牌的概率"""
+        key = (hand, -1)
+        wins = self._memo.get(key)
+        if wins is None:
+            wins = 0.0
+            for t in self._waits(hand):
+                wins += self._left(hand, t)
+            wins /= self._total
+            self._memo[key] = wins
+        return wins
+
+    def _fan_sum(self, hand: tuple) -> float:
+        """13张听牌手牌每次摸牌和牌时按概率加权的番数和（只对需要的手牌计算）"""
+        key = (hand, -3)
+        fan_sum = self._memo.get(key)
+        if fan_sum is None:
+            fan_sum = 0.0
+            counts = list(hand)
+            for t in self._waits(hand):
+                left = self._left(hand, t)
+                counts[t] += 1
+                fan_sum += left * self._fans(counts, t)
+                counts[t] -= 1
+            fan_sum /= self._total
+            self._memo[key] = fan_sum
+        return fan_sum
+
+    def _best_tenpai(self, hand: tuple) -> tuple:
+        """14张打出一张成为听牌时和牌概率最高的13张（相同时取期望番数高的，无法听牌时为空元组）
+
+        听牌后和牌概率只取决于每次摸牌和牌的概率，最优打法与剩余摸牌次数无关。
+        番数开销较大，只对和牌概率最高的几种打法计算。
+        """
+        key = (hand, -2)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+        best_rate, best = 0.0, []
+        counts = list(hand)
+        for x in range(NUM_TILE_TYPES):
+            if not counts[x]:
+                continue
+            counts[x] -= 1
+            after = tuple(counts)
+            rate = self._win_rate(after)
+            if rate > best_rate:
+                best_rate, best = rate, [after]
+            elif rate == best_rate and rate:
+                best.append(after)
+            counts[x] += 1
+        if len(best) > 1 and self.rule is not None:
+            result = max(best, key=self._fan_sum)
+        else:
+            result = best[0] if best else ()
+        self._memo[key] = result
+        return result
+
+    def _left(self, hand: tuple, t: int) -> int:
+        """t还能摸到的张数（未见张数减去之后摸进并留在手里的张数）"""
+        return max(self._unseen[t] - max(hand[t] - self._base[t], 0), 0)
+
+    def _waits(self, hand: tuple) -> list:
+        """听的牌（见_waiting_mask）"""
+        mask = self._waiting_mask(hand)
+        waits = []
+        while mask:
+            low = mask & -mask
+            waits.append(low.bit_length() - 1)
+            mask ^= low
+        return waits
+
+    def _best_discard(self, counts, target: int, draws: int) -> tuple:
+        """从14张中打出一张、保持向听数target时的最优结果（概率优先，其次期望番数）"""
+        best = (0.0, 0.0)
+        for x in range(NUM_TILE_TYPES):
+            if not counts[x]:
+                continue
+            counts[x] -= 1
+            if self._shanten_of(counts) == target:
+                result = self._solve(tuple(counts), draws)
+                if result > best:
+                    best = result
+            counts[x] += 1
+        return best
+
+    def _waiting_mask(self, hand: tuple) -> int:
+        """听牌位图：标准型（与ClaimIndex共用缓存）"""
+        from src.core.data.claim_index import ClaimIndex
+        return canonical.waiting_mask(hand, ClaimIndex._compute_win_mask)
+
+    def _shanten_of(self, counts) -> int:
+        """标准型向听数（在本计算器内按计数元组缓存，各花色的拆分组合查询共用的拆分表）"""
+        key = tuple(counts)
+        value = self._shanten.get(key)
+        if value is None:
+            if len(self._shanten) >= MAX_SHANTEN_CACHE:
+                self._shanten.clear()
+            options = frozenset({(min(self._declared, 4), 0, 0)})
+            for start, length, seq in SUITS:
+                options = combine_options(options, group_options(key[start:start + length], seq))
+            value = self._shanten[key] = standard_shanten(options)
+        return value
+
+    @staticmethod
+    def _isolated(hand, t: int) -> bool:
+        """t在手牌中是孤张（没有同种牌，序数牌前后两张内也没有同花色的牌）"""
+        if hand[t]:
+            return False
+        if t >= 27:
+            return True
+        rank = t % 9
+        low = t - min(rank, 2)
+        high = t + min(8 - rank, 2)
+        return not any(hand[low:high + 1])
+
+    def _fans(self, counts, tid: int) -> float:
+        """自摸tid和牌的番数"""
+        rule, player = self.rule, self._player
+        if rule is None or player is None:
+            return 1.0
+        from src.core.data.player import Player
+        winner = Player.__new__(Player)
+        winner.__dict__.update(player.__dict__)
+        winner.hand = Hand([card_from_id(t) for t in range(NUM_TILE_TYPES) for _ in range(counts[t])])
+        card = card_from_id(tid)
+        winner.drawn_card = card
+        return float(rule.score_rules._calculate_fans(winner, card))
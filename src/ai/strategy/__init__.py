@@ -1,4 +1,11 @@
 from src.ai.strategy.base_strategy import BaseStrategy
-from src.ai.strategy.advanced_strategy import AdvancedStrategy
 
 __all__ = ['BaseStrategy', 'AdvancedStrategy']
+
+
+def __getattr__(name):
+    # 具体策略按需导入，避免导入策略包时加载全部AI模块
+    if name == 'AdvancedStrategy':
+        from src.ai.strategy.advanced_strategy import AdvancedStrategy
+        return AdvancedStrategy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,21 @@
 from src.ai.strategy.base_strategy import BaseStrategy
+from src.ai.evaluation.fan_planner import FanPlanner
+from src.ai.evaluation.hand_sampler import HandSampler
 from src.ai.evaluation.risk_evaluator import RiskEvaluator
+from src.ai.evaluation.tile_efficiency import TileEfficiency
+from src.ai.evaluation.win_probability import WinProbability, own_draws
 from src.core.data.card import Card
+from src.core.data.meld import MeldType
+from src.core.data.tile import card_from_id
+from src.core.utils.instrument import instrumented
+
+ENDGAME_DRAWS = 4        # 自己剩余摸牌次数不超过该值时计算和牌概率
+WIN_PROBABILITY_WEIGHT = 10.0
+SHANTEN_WEIGHT = 3.0     # 打出后向听数每比最优打法多1的惩罚
+ACCEPTANCE_WEIGHT = 2.0  # 进张数（按各打法中的最大值归一化）的权重
+SECOND_ORDER_WEIGHT = 1.0  # 两步进张数（同上）的权重
+TARGET_FAN_WEIGHT = 0.1  # 高番目标每1期望番数的权重
+TARGET_REASON_FANS = 8   # 期望番数不低于该值时在推荐理由中说明目标
 
 class AdvancedStrategy(BaseStrategy):
     """高级AI策略"""
@@ -8,6 +23,11 @@ class AdvancedStrategy(BaseStrategy):
     def __init__(self, rule):
         super().__init__(rule)
         self.risk_evaluator = RiskEvaluator(rule)
+        # 出牌评分只用到和牌概率，不计算番数（每次和牌记为1番）
+        self.win_probability = WinProbability(max_draws=ENDGAME_DRAWS)
+        # 中间手牌的缓存跨回合保留（每回合手牌只变化一张，大部分可以复用）
+        self.tile_efficiency = TileEfficiency()
+        self.fan_planner = FanPlanner(rule)
     
     def recommend_action(self, player, game_state):
         """推荐动作
@@ -22,9 +42,61 @@ class AdvancedStrategy(BaseStrategy):
         # 如果可以胡牌，直接推荐胡牌
         # TODO: 实现胡牌检测逻辑
         
+        # 可以暗杠或补杠时推荐杠牌
+        kong_card = self._find_self_kong(player)
+        if kong_card is not None:
+            return "kong", kong_card, f"杠{kong_card.get_display_name()}"
+        
         # 否则，推荐最佳出牌
         return "discard", *self.recommend_discard(player, game_state)
     
+    def should_claim(self, player, game_state, claim_type, card):
+        """判断是否响应别人打出的牌
+        
+        Args:
+            player: 当前玩家
+            game_state: 当前游戏状态
+            claim_type: 响应类型（hu/kong/pong/chow）
+            card: 打出的牌
+        
+        Returns:
+            bool: 是否响应
+        """
+        if claim_type in ("hu", "kong"):
+            return True
+        # 碰、吃会破坏门清，只在该牌无法与其他手牌组成顺子时碰；吃牌暂不主动进行
+        if claim_type == "pong":
+            return not self._has_neighbors(card, player)
+        return False
+    
+    def _has_neighbors(self, card, player):
+        """判断手牌中是否有与该牌相邻（可组成搭子）的序数牌"""
+        tid = card.tile_id
+        if tid >= 27:
+            return False
+        rank = tid % 9
+        counts = player.hand.counts
+        return (rank > 0 and counts[tid - 1] > 0) or (rank < 8 and counts[tid + 1] > 0)
+    
+    def _find_self_kong(self, player):
+        """查找可以暗杠或补杠的牌
+        
+        Args:
+            player: 当前玩家
+        
+        Returns:
+            Card: 可以杠的牌，没有时为None
+        """
+        counts = player.hand.counts
+        for card in player.hand:
+            if counts[card.tile_id] == 4:
+                return card
+        for meld in player.melds:
+            if meld.type == MeldType.PONG and counts[meld.tile]:
+                return card_from_id(meld.tile)
+        return None
+    
+    @instrumented
     def recommend_discard(self, player, game_state):
         """推荐最佳出牌
         
@@ -35,18 +107,52 @@ class AdvancedStrategy(BaseStrategy):
         Returns:
             tuple: (推荐牌, 推荐理由)
         """
+        best_card, reason, _ = self.analyze_discards(player, game_state)
+        return best_card, reason
+    
+    def analyze_discards(self, player, game_state):
+        """一次遍历同时得到推荐出牌和危险牌分析
+        
+        相同的牌评分和风险相同，每种牌只评估一次。
+        
+        Args:
+            player: 当前玩家
+            game_state: 当前游戏状态
+        
+        Returns:
+            tuple: (推荐牌, 推荐理由, 危险牌字典)，危险牌字典键为牌、值为风险值，按风险从高到低排列
+        """
         if not player.hand:
-            return None, "手牌为空"
+            return None, "手牌为空", {}
+        
+        # 终盘时计算打出每种牌后在牌墙摸完前和牌的概率
+        win_chances = None
+        if len(player.hand) % 3 == 2 and own_draws(player, game_state) <= ENDGAME_DRAWS:
+            win_chances = self.win_probability.evaluate(player, game_state)
+        efficiency = self._evaluate_efficiency(player, game_state)
+        # 打出每种牌后最有希望的高番目标（清一色、混一色、碰碰胡）
+        targets = self._plan_targets(player, game_state, efficiency)
         
-        # 计算每张牌的综合评分
+        # 计算每种牌的综合评分
         card_scores = []
+        risks = {}
         for card in player.hand:
+            if card in risks:
+                continue
             # 计算打出该牌的价值（越高越好）
             discard_value = self.calculate_discard_value(card, player, game_state)
             # 计算打出该牌的风险（越低越好）
             risk = self.risk_evaluator.evaluate_card_risk(card, player, game_state)
+            risks[card] = risk
             # 综合评分：价值高且风险低的牌更适合打出
             score = discard_value - risk * 10  # 风险权重更高
+            if win_chances:
+                # 打出后和牌概率高的牌更适合打出
+                score -= win_chances[card][0] * WIN_PROBABILITY_WEIGHT
+            if efficiency:
+                score += efficiency[card.tile_id][0]
+            if targets:
+                score -= targets[card.tile_id][2] * TARGET_FAN_WEIGHT
             card_scores.append((score, card))
         
         # 找出评分最低的牌（最应该打出的牌）
@@ -54,9 +160,54 @@ class AdvancedStrategy(BaseStrategy):
         best_card = card_scores[0][1]
         
         # 生成推荐理由
-        reason = self._generate_reason(best_card, player, game_state)
+        target = targets[best_card.tile_id] if targets else (None, None, 0.0)
+        reason = self._generate_reason(best_card, player, game_state, risks[best_card],
+                                       target[0] if target[2] >= TARGET_REASON_FANS else None)
         
-        return best_card, reason
+        # 按危险等级排序
+        danger_cards = dict(sorted(risks.items(), key=lambda item: item[1], reverse=True))
+        return best_card, reason, danger_cards
+    
+    def _evaluate_efficiency(self, player, game_state):
+        """由一步、两步牌效率得到打出每种牌的评分修正
+        
+        Args:
+            player: 当前玩家（手牌张数除以3余2时才计算）
+            game_state: 当前游戏状态
+        
+        Returns:
+            dict: {牌编号: (评分修正, 打出后的向听数)}，评分修正越低越适合打出；不需要计算时为None
+        """
+        if len(player.hand) % 3 != 2:
+            return None
+        unseen = HandSampler.unseen_counts(game_state, player)
+        results = self.tile_efficiency.evaluate(player.hand.counts, unseen, len(player.melds))
+        if not results:
+            return None
+        best = min(shanten for shanten, _, _ in results.values())
+        top_first = max(first for _, first, _ in results.values()) or 1
+        top_second = max(second for _, _, second in results.values()) or 1
+        return {tid: ((shanten - best) * SHANTEN_WEIGHT
+                      - first / top_first * ACCEPTANCE_WEIGHT
+                      - second / top_second * SECOND_ORDER_WEIGHT, shanten)
+                for tid, (shanten, first, second) in results.items()}
+    
+    def _plan_targets(self, player, game_state, efficiency):
+        """打出每种牌后最有希望的高番目标
+        
+        Args:
+            player: 当前玩家
+            game_state: 当前游戏状态
+            efficiency: _evaluate_efficiency的结果
+        
+        Returns:
+            dict: {牌编号: (牌型, 距离, 期望番数)}，不需要计算时为None
+        """
+        if not efficiency:
+            return None
+        shantens = {tid: shanten for tid, (_, shanten) in efficiency.items()}
+        return self.fan_planner.evaluate_discards(player.hand.counts, shantens,
+                                                  own_draws(player, game_state), player.melds)
     
     def evaluate_hand(self, player, game_state):
         """评估手牌价值
@@ -157,19 +308,22 @@ class AdvancedStrategy(BaseStrategy):
             return -1.0
         return 0.0
     
-    def _generate_reason(self, card, player, game_state):
+    def _generate_reason(self, card, player, game_state, risk=None, target=None):
         """生成推荐理由
         
         Args:
             card: 推荐打出的牌
             player: 当前玩家
             game_state: 当前游戏状态
+            risk: 已计算的该牌风险（为空时重新计算）
+            target: 打出后追求的高番牌型（没有时为None）
         
         Returns:
             str: 推荐理由
         """
         # 计算该牌的风险
-        risk = self.risk_evaluator.evaluate_card_risk(card, player, game_state)
+        if risk is None:
+            risk = self.risk_evaluator.evaluate_card_risk(card, player, game_state)
         
         # 统计该牌在手中的数量
         card_count = sum(1 for c in player.hand if c == card)
@@ -193,6 +347,10 @@ class AdvancedStrategy(BaseStrategy):
         if card.suit in ['风', '箭']:
             reason_parts.append("字牌，难以形成顺子")
         
+        # 番型相关理由
+        if target:
+            reason_parts.append(f"保留{target}的机会")
+        
         # 组合理由
         if reason_parts:
             return f"推荐打出{card.get_display_name()}，理由：{'; '.join(reason_parts)}"
@@ -1,18 +1,64 @@
-from datetime import datetime
+import time
+
+# 操作码，下标即操作码的值
+OPCODE_NAMES = ('draw', 'discard', 'chow', 'pong', 'kong', 'hu', 'flower')
+OPCODES = {name: op for op, name in enumerate(OPCODE_NAMES)}
+
 
 class Action:
-    def __init__(self, action_type: str, card: 'Card' = None, from_player=None):
+    """操作
+
+    以整数操作码、牌编号和来源座位表示，不带__dict__。来源座位seat随
+    from_player一起更新（之后再设置from_player时也保持一致）。只有开启记录
+    （Action.set_recording(True)，如需要回放对局时）才记录单调时钟时间戳。
+    """
+    __slots__ = ('op', 'card', 'tile', '_from_player', 'seat', 'cards', 'timestamp')
+
+    DRAW = 0
+    DISCARD = 1
+    CHOW = 2
+    PONG = 3
+    KONG = 4
+    HU = 5
+    FLOWER = 6
+
+    recording = False
+
+    def __init__(self, action_type, card: 'Card' = None, from_player=None, cards: list = None):
         """操作类定义
-        
+
         Args:
-            action_type: 操作类型（draw/discard/chow/pong/kong/hu）
+            action_type: 操作类型（操作码或名称draw/discard/chow/pong/kong/hu/flower）
             card: 涉及的牌
             from_player: 来源玩家
+            cards: 与card组成面子的手牌（吃牌时指定搭子，为空时自动选择）
         """
-        self.type = action_type
+        self.op = OPCODES[action_type] if isinstance(action_type, str) else action_type
         self.card = card
+        self.tile = card.tile_id if card is not None else -1
         self.from_player = from_player
-        self.timestamp = datetime.now()  # 操作时间戳
-        
+        self.cards = cards
+        self.timestamp = time.monotonic() if Action.recording else None
+
+    @classmethod
+    def set_recording(cls, enabled: bool) -> None:
+        """开启或关闭时间戳记录"""
+        cls.recording = enabled
+
+    @property
+    def from_player(self):
+        """来源玩家"""
+        return self._from_player
+
+    @from_player.setter
+    def from_player(self, player):
+        self._from_player = player
+        self.seat = player.seat if player is not None and player.seat is not None else -1
+
+    @property
+    def type(self) -> str:
+        """操作类型名称"""
+        return OPCODE_NAMES[self.op]
+
     def __repr__(self):
-        return f"Action(type={self.type}, card={self.card}, from={self.from_player.name if self.from_player else 'None'})"
\ No newline at end of file
+        return f"Action(type={self.type}, card={self.card}, from={self.from_player.name if self.from_player else 'None'})"
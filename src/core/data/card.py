@@ -1,3 +1,5 @@
+from src.core.data.tile import tile_id
+
 class Card:
     def __init__(self, suit: str, rank: str):
         """牌类定义
@@ -9,6 +11,7 @@ class Card:
         self.suit = suit
         self.rank = rank
         self.id = f"{suit}{rank}"  # 唯一标识
+        self.tile_id = tile_id(suit, rank)  # 紧凑编号（见tile.py）
         self.is_visible = False    # 是否可见（用于暗杠）
         
     def __repr__(self):
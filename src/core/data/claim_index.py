@@ -0,0 +1,138 @@
+from src.core.data.tile import NUM_TILE_TYPES
+
+# 吃牌时搭子相对被吃牌的点数偏移，下标即chow_shapes中的位
+CHOW_OFFSETS = ((-2, -1), (-1, 1), (1, 2))
+
+
+class ClaimIndex:
+    """手牌可响应的牌集合（以34位整数位图表示，第i位对应编号为i的牌）
+
+    - pong: 可以碰的牌（手中至少两张）
+    - kong: 可以明杠的牌（手中恰好三张）
+    - chow: 可以吃的牌（手中有能组成顺子的两张搭子）
+    - chow_shapes: 每张序数牌可用的搭子组合，第k位对应CHOW_OFFSETS[k]
+    - win:  加入后构成标准胡牌型的牌（只判断牌型，番数由规则另行检查）
+
+    手牌每增减一张牌时调用update，只更新该牌及同花色±2范围内的位；
+    听牌位图依赖整手牌，在手牌变化后首次读取时重新计算。
+    """
+
+    def __init__(self, counts):
+        """
+        Args:
+            counts: 手牌计数数组（引用，随手牌变化）
+        """
+        self.counts = counts
+        self.pong = 0
+        self.kong = 0
+        self.chow = 0
+        self.chow_shapes = [0] * 27
+        self._win = 0
+        self._win_dirty = True
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """根据计数数组重新计算所有位图"""
+        counts = self.counts
+        pong = kong = 0
+        for tid in range(NUM_TILE_TYPES):
+            c = counts[tid]
+            if c >= 2:
+                pong |= 1 << tid
+                if c == 3:
+                    kong |= 1 << tid
+        self.pong = pong
+        self.kong = kong
+        self.chow = 0
+        for tid in range(27):
+            self._update_chow(tid)
+        self._win_dirty = True
+
+    def update(self, tid: int) -> None:
+        """某种牌的数量变化后更新位图
+
+        Args:
+            tid: 数量发生变化的牌编号
+        """
+        if tid >= NUM_TILE_TYPES:
+            return  # 花牌不参与响应
+
+        bit = 1 << tid
+        c = self.counts[tid]
+        if c >= 2:
+            self.pong |= bit
+        else:
+            self.pong &= ~bit
+        if c == 3:
+            self.kong |= bit
+        else:
+            self.kong &= ~bit
+
+        if tid < 27:
+            base = tid - tid % 9
+            for t in range(max(base, tid - 2), min(base + 8, tid + 2) + 1):
+                self._update_chow(t)
+
+        self._win_dirty = True
+
+    def _update_chow(self, tid: int) -> None:
+        """重新计算一张序数牌的可吃搭子"""
+        counts = self.counts
+        rank = tid % 9
+        shapes = 0
+        if rank >= 2 and counts[tid - 2] and counts[tid - 1]:
+            shapes |= 1
+        if 1 <= rank <= 7 and counts[tid - 1] and counts[tid + 1]:
+            shapes |= 2
+        if rank <= 6 and counts[tid + 1] and counts[tid + 2]:
+            shapes |= 4
+        self.chow_shapes[tid] = shapes
+        if shapes:
+            self.chow |= 1 << tid
+        else:
+            self.chow &= ~(1 << tid)
+
+    @property
+    def win(self) -> int:
+        """听牌位图"""
+        if self._win_dirty:
+            self._win = self._win_mask(self.counts)
+            self._win_dirty = False
+        return self._win
+
+    @staticmethod
+    def _win_mask(counts) -> int:
+        """计算听牌位图（花色置换后相同的手牌共用缓存）"""
+        if sum(counts[:NUM_TILE_TYPES]) % 3 != 1:
+            return 0
+
+        from src.core.tables import canonical
+        return canonical.waiting_mask(counts[:NUM_TILE_TYPES], ClaimIndex._compute_win_mask)
+
+    @staticmethod
+    def _compute_win_mask(counts) -> int:
+        """逐张尝试计算听牌位图"""
+        from src.core.tables import kernels
+        if kernels.HAS_NUMBA:
+            return kernels.waiting_mask(kernels.as_counts(counts), False)
+
+        from src.core.tables.lookup import is_standard_hu
+        work = list(counts[:NUM_TILE_TYPES])
+        mask = 0
+        for tid in range(NUM_TILE_TYPES):
+            if work[tid] >= 4:
+                continue
+            # 孤张不可能凑成面子或将牌：要求本身或同花色±2范围内有牌
+            if not work[tid]:
+                if tid >= 27:
+                    continue
+                rank = tid % 9
+                lo = tid - min(rank, 2)
+                hi = tid + min(8 - rank, 2)
+                if not any(work[lo:hi + 1]):
+                    continue
+            work[tid] += 1
+            if is_standard_hu(work):
+                mask |= 1 << tid
+            work[tid] -= 1
+        return mask
@@ -0,0 +1,153 @@
+"""各对手的危险度向量
+
+每个座位保存一个长度NUM_TILE_TYPES的向量，表示该玩家听的牌是某种牌的
+相对可能性（0-1），在打牌、吃碰杠时增量更新，查询时直接取值：
+
+- 现物：该玩家打过的牌
+- 筋牌：该玩家打过的序数牌相隔3的同花色牌（打过4万时1万、7万）
+- 副露花色倾向：面子集中在某个花色（或字牌）时，该花色的牌更危险、其他花色较安全
+
+听牌可能性由牌局进度和副露数在查询时估计（各为O(1)）。
+组合各对手时还查询弃牌河（DiscardRivers.passed）：对手上次打牌后别人打出过
+而对手没有胡的牌，对该对手几乎是安全的。
+"""
+from src.core.data.tile import NUM_TILE_TYPES
+
+GENBUTSU_FACTOR = 0.2   # 现物的危险度
+SUJI_FACTOR = 0.6       # 筋牌的危险度
+FOCUS_FACTOR = 1.5      # 面子全部集中在一个花色时该花色的危险度
+OFF_SUIT_FACTOR = 0.5   # 面子全部集中在一个花色时其他花色的危险度
+MELD_TENPAI_BONUS = 0.1 # 每个副露增加的听牌可能性
+PASSED_FACTOR = 0.05    # 对手见过而没有胡的牌的危险度（可能只是不愿胡小牌）
+
+SUIT_OF = tuple(min(tid // 9, 3) for tid in range(NUM_TILE_TYPES))  # 0万 1筒 2条 3字
+
+
+class SeatDanger:
+    """一个座位的危险度向量"""
+    __slots__ = ('discarded', 'suji', 'tile_factor', 'suit_melds', 'suit_factor', 'discards')
+
+    def __init__(self):
+        self.discarded = [0] * NUM_TILE_TYPES     # 打过的张数
+        self.suji = [0] * NUM_TILE_TYPES          # 成为筋牌的次数
+        self.tile_factor = [1.0] * NUM_TILE_TYPES  # 现物、筋牌得到的系数
+        self.suit_melds = [0] * 4                 # 各花色的面子数
+        self.suit_factor = [1.0] * 4              # 副露花色倾向得到的系数
+        self.discards = 0                         # 打牌次数
+
+    def copy(self) -> 'SeatDanger':
+        other = SeatDanger.__new__(SeatDanger)
+        for name in self.__slots__:
+            value = getattr(self, name)
+            setattr(other, name, value.copy() if isinstance(value, list) else value)
+        return other
+
+    def danger(self, tid: int) -> float:
+        """该座位听tid的相对可能性（0-1.5）"""
+        return self.tile_factor[tid] * self.suit_factor[SUIT_OF[tid]]
+
+    def on_discard(self, tid: int) -> None:
+        """记录该座位打出tid，更新tid及其筋牌的系数"""
+        if not 0 <= tid < NUM_TILE_TYPES:
+            return
+        self.discards += 1
+        self.discarded[tid] += 1
+        self._refresh(tid)
+        if tid < 27:
+            rank = tid % 9
+            for offset in (-3, 3):
+                if 0 <= rank + offset < 9:
+                    self.suji[tid + offset] += 1
+                    self._refresh(tid + offset)
+
+    def on_meld(self, tid: int) -> None:
+        """记录该座位以tid为基准牌的面子，更新各花色的系数"""
+        if not 0 <= tid < NUM_TILE_TYPES:
+            return
+        melds = self.suit_melds
+        melds[SUIT_OF[tid]] += 1
+        total = sum(melds)
+        # 面子越多、越集中在一个花色（可能做清一色、混一色、碰碰胡），倾向越可信
+        confidence = min(total, 3) / 3
+        for suit in range(4):
+            share = melds[suit] / total
+            if suit == 3:
+                target = 1.0 + (FOCUS_FACTOR - 1.0) * share
+            else:
+                target = OFF_SUIT_FACTOR + (FOCUS_FACTOR - OFF_SUIT_FACTOR) * share
+            self.suit_factor[suit] = 1.0 + (target - 1.0) * confidence
+
+    def _refresh(self, tid: int) -> None:
+        if self.discarded[tid]:
+            self.tile_factor[tid] = GENBUTSU_FACTOR
+        elif self.suji[tid]:
+            self.tile_factor[tid] = SUJI_FACTOR
+        else:
+            self.tile_factor[tid] = 1.0
+
+
+class DangerMap:
+    """全部座位的危险度向量（由DeckManager、TurnHandler在打牌和吃碰杠时更新）"""
+    __slots__ = ('seats',)
+
+    def __init__(self):
+        self.seats = {}
+
+    def copy(self) -> 'DangerMap':
+        other = DangerMap()
+        other.seats = {seat: danger.copy() for seat, danger in self.seats.items()}
+        return other
+
+    def seat(self, seat: int) -> SeatDanger:
+        """获取座位的危险度向量（没有记录时新建）"""
+        danger = self.seats.get(seat)
+        if danger is None:
+            danger = self.seats[seat] = SeatDanger()
+        return danger
+
+    def on_discard(self, player, tid: int) -> None:
+        """玩家打出一张牌"""
+        if player is not None and player.seat is not None:
+            self.seat(player.seat).on_discard(tid)
+
+    def on_meld(self, player, meld) -> None:
+        """玩家吃、碰、杠得到一副面子"""
+        if player is not None and player.seat is not None:
+            self.seat(player.seat).on_meld(meld.tile)
+
+    def tenpai_probability(self, player, progress: float) -> float:
+        """估计玩家听牌的可能性
+
+        Args:
+            player: 对手
+            progress: 牌局进度（0-1）
+
+        Returns:
+            float: 0-1
+        """
+        return min(progress * 2 + MELD_TENPAI_BONUS * player.melds.open_melds, 1.0)
+
+    def combined_danger(self, tid: int, player, opponents, progress: float, rivers=None) -> float:
+        """tid点炮给任一对手的可能性（各对手独立）
+
+        Args:
+            tid: 牌编号
+            player: 打牌的玩家（不计入）
+            opponents: 全部玩家
+            progress: 牌局进度（0-1）
+            rivers: 可选，弃牌河（DiscardRivers），用于排除对手见过而没有胡的牌
+
+        Returns:
+            float: 0-1
+        """
+        safe = 1.0
+        seats = self.seats
+        for other in opponents:
+            if other is player:
+                continue
+            danger = seats.get(other.seat)
+            weight = danger.danger(tid) if danger is not None and 0 <= tid < NUM_TILE_TYPES else 1.0
+            if rivers is not None and rivers.passed(other.seat, tid):
+                weight *= PASSED_FACTOR
+            safe *= 1.0 - min(self.tenpai_probability(other, progress) * weight, 1.0)
+        return 1.0 - safe
@@ -0,0 +1,32 @@
+class DecisionRequest:
+    """需要玩家做出的决策
+
+    回合流程（TurnHandler.turn_steps）和响应仲裁（ClaimResolver.resolve_steps）
+    是生成器，每到需要玩家决策时产出一个DecisionRequest，由驱动方
+    通过send传回结果：ACTION传回Action，CLAIM传回是否响应（bool）。
+    同步驱动见TurnHandler.process_turn，异步驱动见src.interface.table_host。
+    """
+    __slots__ = ('kind', 'player', 'valid_actions', 'claim_type', 'card')
+
+    ACTION = 0  # 回合内的操作（打牌、暗杠/补杠等）
+    CLAIM = 1   # 是否响应别人打出的牌
+
+    def __init__(self, kind: int, player, valid_actions=None, claim_type: str = None, card=None):
+        """
+        Args:
+            kind: 决策类型（ACTION/CLAIM）
+            player: 需要决策的玩家
+            valid_actions: 有效操作码列表（ACTION，规则复用的缓冲区，需要保留时请复制）
+            claim_type: 响应类型hu/kong/pong/chow（CLAIM）
+            card: 被响应的牌（CLAIM）
+        """
+        self.kind = kind
+        self.player = player
+        self.valid_actions = valid_actions
+        self.claim_type = claim_type
+        self.card = card
+
+    def __repr__(self):
+        if self.kind == DecisionRequest.CLAIM:
+            return f"DecisionRequest(claim, {self.player.name}, {self.claim_type} {self.card})"
+        return f"DecisionRequest(action, {self.player.name})"
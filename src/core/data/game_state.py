@@ -1,47 +1,131 @@
+import random
+
+from src.core.data.danger_map import DangerMap
+from src.core.data.river import DiscardRivers
+from src.core.data.tile import NUM_ALL_TILE_TYPES
+from src.core.data.wall import Wall
+from src.core.data.zobrist import discard_key, state_key
+
 class GameState:
-    def __init__(self, players=None, rule=None, rule_name: str = "tencent_common"):
+    def __init__(self, players=None, rule=None, rule_name: str = "tencent_common", seed=None):
         """游戏状态类定义
         
         Args:
             players: 玩家列表
             rule: 规则实例
             rule_name: 使用的规则名称
+            seed: 本局随机种子（为空时使用random模块的全局随机数生成器）
         """
         self.rule_name = rule_name
-        self.deck = []              # 剩余牌墙
-        self.discard_pile = []      # 已打出的牌
+        self.rng = random.Random(seed) if seed is not None else random
+        self.deck = []              # 剩余牌墙（赋值时自动包装为Wall）
+        self.discard_pile = []      # 已打出的牌（赋值时重新计算discard_hash、discard_counts）
+        self.rivers = DiscardRivers()  # 各座位的弃牌河（打牌、被取走时增量更新）
+        self.danger_map = DangerMap()  # 各座位的危险度向量（打牌、吃碰杠时增量更新）
         self.players = players or []  # 玩家列表
         self.current_player = None  # 当前回合玩家
         self.last_discarded_card = None  # 上一张打出的牌
         self.game_stage = "init"    # 游戏阶段：init/playing/ended
         self.winner = None          # 赢家
+        self.winners = []           # 所有赢家（一炮多响时不止一个）
         self.round_number = 1       # 局数
         self.wind = "东"            # 场风
         self.rule = rule            # 当前规则实例
+        self.must_discard = False   # 当前玩家吃碰杠后不再摸牌（杠的补牌已在drawn_card中）
     
-    def initialize_game(self):
+    @property
+    def deck(self):
+        """牌墙"""
+        return self._deck
+    
+    @deck.setter
+    def deck(self, cards):
+        self._deck = cards if isinstance(cards, Wall) else Wall.from_cards(cards)
+    
+    @property
+    def discard_pile(self):
+        """已打出的牌（通过DeckManager.discard_card/take_discard增删以增量更新discard_hash、discard_counts）"""
+        return self._discard_pile
+    
+    @discard_pile.setter
+    def discard_pile(self, cards):
+        self._discard_pile = list(cards)
+        self.discard_hash = 0
+        self.discard_counts = [0] * NUM_ALL_TILE_TYPES
+        for position, card in enumerate(self._discard_pile):
+            self.discard_hash ^= discard_key(position, card.tile_id)
+            self.discard_counts[card.tile_id] += 1
+    
+    @property
+    def zobrist(self) -> int:
+        """局面的64位Zobrist哈希（手牌、面子、弃牌、牌墙位置和当前玩家）"""
+        return state_key(self)
+    
+    def clone(self) -> 'GameState':
+        """复制局面（玩家、牌墙、弃牌堆为独立副本，规则共享）
+        
+        用于在不影响实际对局的情况下推演假设的局面（如后台预先计算AI提示）。
+        
+        Returns:
+            GameState: 副本，current_player、winner等指向副本中的对应玩家
+        """
+        other = GameState.__new__(GameState)
+        other.__dict__.update(self.__dict__)
+        players = [player.clone() for player in self.players]
+        mapping = {id(old): new for old, new in zip(self.players, players)}
+        other.players = players
+        other.deck = self.deck.copy()
+        other.discard_pile = self.discard_pile
+        other.rivers = self.rivers.copy()
+        other.danger_map = self.danger_map.copy()
+        other.rng = random.Random()
+        other.current_player = mapping.get(id(self.current_player), self.current_player)
+        other.winner = mapping.get(id(self.winner), self.winner)
+        other.winners = [mapping.get(id(p), p) for p in self.winners]
+        if players and players[0].seat is not None:
+            other.assign_seats()
+        return other
+    
+    def initialize_game(self, permutation=None):
         """初始化游戏
         
         创建初始牌组，为每个玩家发牌
+        
+        Args:
+            permutation: 已洗好的牌编号序列（如ShuffleStream生成的排列），为空时用本局随机数生成器洗牌
         """
         if not self.rule:
             from src.rules.tencent_common.rule import TencentCommonRule
             self.rule = TencentCommonRule()
         
-        # 创建初始牌组
-        self.deck = self.rule.create_initial_deck()
+        if permutation is None:
+            # 创建初始牌组并洗牌
+            self.deck = Wall(self.rule.initial_tile_ids())
+            self.deck.shuffle(self.rng)
+        else:
+            self.deck = Wall(permutation)
+        
+        # 设置座位和上下家
+        self.assign_seats()
+        self.rivers = DiscardRivers()
+        self.danger_map = DangerMap()
         
-        # 洗牌
-        import random
-        random.shuffle(self.deck)
+        # 为每个玩家发牌（初始13张），整段切出直接构造手牌
+        from src.core.logic.deck_manager import DeckManager
+        DeckManager.deal_hands(self, 13)
         
-        # 为每个玩家发牌（初始13张）
+        # 补花
         for player in self.players:
-            player.hand = []
-            for _ in range(13):
-                if self.deck:
-                    player.hand.append(self.deck.pop())
+            DeckManager.replace_flowers(self, player)
         
         # 设置当前玩家（庄家）
         self.current_player = self.players[0]
-        self.game_stage = "playing"
\ No newline at end of file
+        self.game_stage = "playing"
+    
+    def assign_seats(self):
+        """按玩家列表顺序设置座位序号和上下家关系"""
+        count = len(self.players)
+        for i, player in enumerate(self.players):
+            player.seat = i
+            player.previous_player = self.players[(i - 1) % count]
+            player.next_player = self.players[(i + 1) % count]
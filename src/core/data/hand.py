@@ -0,0 +1,127 @@
+from src.core.data.claim_index import ClaimIndex
+from src.core.data.tile import NUM_ALL_TILE_TYPES
+from src.core.data.zobrist import HAND_KEYS, MAX_COPIES
+
+class Hand(list):
+    """手牌
+
+    行为与list相同，同时维护每种牌的计数数组counts（下标为牌编号），
+    增删牌时以O(1)更新，查询某种牌的数量也是O(1)。
+    同时增量维护手牌的Zobrist哈希zobrist（与牌的顺序无关）。
+    """
+    __slots__ = ('counts', 'zobrist', '_claims')
+
+    def __init__(self, cards=()):
+        super().__init__(cards)
+        self.counts = [0] * NUM_ALL_TILE_TYPES
+        self.zobrist = 0
+        for card in self:
+            tid = card.tile_id
+            if tid >= 0:
+                self.counts[tid] += 1
+                self.zobrist ^= HAND_KEYS[tid][min(self.counts[tid], MAX_COPIES) - 1]
+        self._claims = ClaimIndex(self.counts)
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (list(self),)
+
+    def _add(self, card):
+        tid = card.tile_id
+        if tid >= 0:
+            self.counts[tid] += 1
+            self.zobrist ^= HAND_KEYS[tid][min(self.counts[tid], MAX_COPIES) - 1]
+            self._claims.update(tid)
+
+    def _sub(self, card):
+        tid = card.tile_id
+        if tid >= 0:
+            self.zobrist ^= HAND_KEYS[tid][min(self.counts[tid], MAX_COPIES) - 1]
+            self.counts[tid] -= 1
+            self._claims.update(tid)
+
+    def append(self, card):
+        super().append(card)
+        self._add(card)
+
+    def extend(self, cards):
+        for card in cards:
+            self.append(card)
+
+    def __iadd__(self, cards):
+        self.extend(cards)
+        return self
+
+    def insert(self, index, card):
+        super().insert(index, card)
+        self._add(card)
+
+    def pop(self, index=-1):
+        card = super().pop(index)
+        self._sub(card)
+        return card
+
+    def remove(self, card):
+        tid = card.tile_id
+        if tid < 0:
+            super().remove(card)
+            return
+        self.take(tid)
+
+    def clear(self):
+        super().clear()
+        self.counts = [0] * NUM_ALL_TILE_TYPES
+        self.zobrist = 0
+        self._claims = ClaimIndex(self.counts)
+
+    def claim_index(self) -> ClaimIndex:
+        """获取可响应牌的位图（随手牌增量更新）"""
+        return self._claims
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            old = self[index]
+        else:
+            old = [self[index]]
+        super().__setitem__(index, value)
+        for card in old:
+            self._sub(card)
+        for card in (value if isinstance(index, slice) else [value]):
+            self._add(card)
+
+    def __delitem__(self, index):
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for card in old:
+            self._sub(card)
+
+    def __contains__(self, card):
+        tid = getattr(card, 'tile_id', -1)
+        if tid >= 0:
+            return self.counts[tid] > 0
+        return super().__contains__(card)
+
+    def count(self, card) -> int:
+        tid = getattr(card, 'tile_id', -1)
+        if tid >= 0:
+            return self.counts[tid]
+        return super().count(card)
+
+    def take(self, tid: int):
+        """移除并返回一张指定编号的牌
+
+        Args:
+            tid: 牌编号
+
+        Returns:
+            Card: 被移除的牌
+
+        Raises:
+            ValueError: 手牌中没有该牌
+        """
+        if not self.counts[tid]:
+            raise ValueError(f"手牌中没有编号为{tid}的牌")
+        # 从尾部查找：刚摸到的牌通常在最后
+        for i in range(len(self) - 1, -1, -1):
+            if self[i].tile_id == tid:
+                return self.pop(i)
@@ -0,0 +1,226 @@
+from enum import IntEnum
+
+from src.core.data.tile import NUM_TILE_TYPES, card_from_id
+from src.core.data.zobrist import meld_key
+
+# 面子类型的中文名（与计分规则中使用的名称一致），下标为MeldType的值
+MELD_LABELS = ('顺子', '明刻', '明杠', '暗杠', '暗刻')
+
+
+class MeldType(IntEnum):
+    """面子类型"""
+    CHOW = 0       # 顺子
+    PONG = 1       # 明刻
+    MING_GANG = 2  # 明杠
+    AN_GANG = 3    # 暗杠
+    AN_KE = 4      # 暗刻
+
+    @property
+    def label(self) -> str:
+        """中文名"""
+        return MELD_LABELS[self]
+
+    @classmethod
+    def parse(cls, value) -> 'MeldType':
+        """由MeldType、整数或中文名得到面子类型
+
+        Raises:
+            ValueError: 未知的面子类型
+        """
+        if isinstance(value, str):
+            return cls(MELD_LABELS.index(value))
+        return cls(value)
+
+
+# 刻子和杠子（计入刻子类番型）
+PUNG_TYPES = frozenset((MeldType.PONG, MeldType.MING_GANG, MeldType.AN_GANG, MeldType.AN_KE))
+KONG_TYPES = frozenset((MeldType.MING_GANG, MeldType.AN_GANG))
+CONCEALED_PUNG_TYPES = frozenset((MeldType.AN_GANG, MeldType.AN_KE))
+
+
+class Meld:
+    """吃碰杠形成的面子
+
+    只记录类型、基准牌编号（顺子为最小的一张）和来源，组成面子的牌按需生成。
+    """
+    __slots__ = ('type', 'tile', 'from_player', 'from_seat')
+
+    # 兼容旧写法Meld.CHOW等
+    CHOW = MeldType.CHOW
+    PONG = MeldType.PONG
+    MING_GANG = MeldType.MING_GANG
+    AN_GANG = MeldType.AN_GANG
+    AN_KE = MeldType.AN_KE
+
+    def __init__(self, meld_type, cards=None, from_player=None, tile: int = -1):
+        """
+        Args:
+            meld_type: 面子类型（MeldType或中文名）
+            cards: 组成面子的牌（给出时由其得到基准牌）
+            from_player: 被吃碰杠的玩家（暗杠为None）
+            tile: 基准牌编号（未给出cards时使用）
+        """
+        self.type = MeldType.parse(meld_type)
+        self.tile = min(card.tile_id for card in cards) if cards else tile
+        self.from_player = from_player
+        self.from_seat = from_player.seat if from_player is not None and from_player.seat is not None else -1
+
+    @property
+    def tile_ids(self) -> tuple:
+        """组成面子的牌编号"""
+        t = self.tile
+        kind = self.type
+        if kind == MeldType.CHOW:
+            return (t, t + 1, t + 2)
+        if kind in KONG_TYPES:
+            return (t, t, t, t)
+        return (t, t, t)
+
+    @property
+    def cards(self) -> list:
+        """组成面子的牌"""
+        return [card_from_id(t) for t in self.tile_ids]
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __len__(self):
+        return 4 if self.type in KONG_TYPES else 3
+
+    def __repr__(self):
+        return f"Meld(type={self.type.label}, cards={self.cards})"
+
+
+class MeldList(list):
+    """玩家的吃碰杠面子列表
+
+    行为与list相同，同时维护汇总计数，增删面子时更新：
+
+    - counts: 每种牌在面子中的张数
+    - pung_mask: 有刻子或杠子的牌（34位整数位图）
+    - kongs / exposed_kongs / concealed_kongs: 杠子数 / 明杠数 / 暗杠数
+    - concealed_pungs: 暗刻和暗杠数
+    - open_melds: 除暗杠外的面子数（为0时门清）
+    - zobrist: 面子的Zobrist哈希（与顺序无关）
+    """
+    __slots__ = ('counts', 'pung_mask', 'kongs', 'exposed_kongs', 'concealed_kongs',
+                 'concealed_pungs', 'open_melds', 'zobrist')
+
+    def __init__(self, melds=()):
+        super().__init__(melds)
+        self._recount()
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (list(self),)
+
+    def _recount(self):
+        self.counts = [0] * NUM_TILE_TYPES
+        self.pung_mask = 0
+        self.kongs = self.exposed_kongs = self.concealed_kongs = 0
+        self.concealed_pungs = self.open_melds = 0
+        self.zobrist = 0
+        seen = []
+        for meld in self:
+            self._apply(meld, 1)
+            key = self._key(meld)
+            self.zobrist ^= meld_key(key[0], key[1], seen.count(key))
+            seen.append(key)
+
+    @staticmethod
+    def _key(meld) -> tuple:
+        """(面子类型, 基准牌编号)，兼容只有type和cards属性的面子对象"""
+        tile = getattr(meld, 'tile', -1)
+        if tile < 0:
+            tile = min(card.tile_id for card in meld.cards)
+        return MeldType.parse(meld.type), tile
+
+    def _apply(self, meld, sign: int):
+        kind, tile = self._key(meld)
+        if kind == MeldType.CHOW:
+            for t in (tile, tile + 1, tile + 2):
+                self.counts[t] += sign
+        else:
+            self.counts[tile] += sign * (4 if kind in KONG_TYPES else 3)
+            if sign > 0:
+                self.pung_mask |= 1 << tile
+            elif not any(m is not meld and self._key(m)[0] in PUNG_TYPES and self._key(m)[1] == tile for m in self):
+                self.pung_mask &= ~(1 << tile)
+        if kind in KONG_TYPES:
+            self.kongs += sign
+            if kind == MeldType.AN_GANG:
+                self.concealed_kongs += sign
+            else:
+                self.exposed_kongs += sign
+        if kind in CONCEALED_PUNG_TYPES:
+            self.concealed_pungs += sign
+        if kind != MeldType.AN_GANG:
+            self.open_melds += sign
+
+    def _toggle(self, meld):
+        """异或面子的哈希键（序号为列表中其他相同面子的数量）"""
+        key = self._key(meld)
+        index = sum(1 for m in self if m is not meld and self._key(m) == key)
+        self.zobrist ^= meld_key(key[0], key[1], index)
+
+    def append(self, meld):
+        super().append(meld)
+        self._apply(meld, 1)
+        self._toggle(meld)
+
+    def extend(self, melds):
+        for meld in melds:
+            self.append(meld)
+
+    def __iadd__(self, melds):
+        self.extend(melds)
+        return self
+
+    def insert(self, index, meld):
+        super().insert(index, meld)
+        self._apply(meld, 1)
+        self._toggle(meld)
+
+    def pop(self, index=-1):
+        meld = super().pop(index)
+        self._apply(meld, -1)
+        self._toggle(meld)
+        return meld
+
+    def remove(self, meld):
+        super().remove(meld)
+        self._apply(meld, -1)
+        self._toggle(meld)
+
+    def clear(self):
+        super().clear()
+        self._recount()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._recount()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._recount()
+
+    def upgrade(self, meld, meld_type) -> None:
+        """改变面子的类型（补杠时明刻变为明杠）并更新计数
+
+        Args:
+            meld: 列表中的面子
+            meld_type: 新的面子类型
+        """
+        self._apply(meld, -1)
+        self._toggle(meld)
+        meld.type = MeldType.parse(meld_type)
+        self._apply(meld, 1)
+        self._toggle(meld)
+
+    def find(self, meld_type, tile: int):
+        """查找指定类型和基准牌的面子，没有时返回None"""
+        key = (MeldType.parse(meld_type), tile)
+        return next((m for m in self if self._key(m) == key), None)
+
+    def has_pung(self, tile: int) -> bool:
+        """判断是否有某种牌的刻子或杠子"""
+        return bool(self.pung_mask >> tile & 1)
@@ -1,3 +1,6 @@
+from src.core.data.hand import Hand
+from src.core.data.meld import MeldList
+
 class Player:
     def __init__(self, name: str, is_ai: bool = True):
         """玩家类定义
@@ -8,10 +11,11 @@ class Player:
         """
         self.name = name
         self.is_ai = is_ai
-        self.hand = []              # 手牌
-        self.melds = []             # 吃碰杠的牌
+        self.hand = []              # 手牌（赋值时自动包装为Hand）
+        self.melds = []             # 吃碰杠的面子（赋值时自动包装为MeldList）
         self.score = 0              # 分数
         self.position = None        # 位置：东、南、西、北
+        self.seat = None            # 座位序号（0为庄家，按出牌顺序递增）
         self.is_dealer = False      # 是否是庄家
         self.drawn_card = None      # 当前摸到的牌
         self.ai_strategy = None     # AI策略
@@ -20,5 +24,43 @@ class Player:
         self.last_action = None     # 上一次操作
         self.consecutive_gang_count = 0  # 连续杠次数
         self.changed_flower_count = 0    # 补花次数
+        self.hua_cards = []              # 已补出的花牌
         self.is_ji_hu = False       # 是否是鸡胡
-        self.ji_hu_from = None      # 鸡胡来源（自摸/点炮）
\ No newline at end of file
+        self.ji_hu_from = None      # 鸡胡来源（自摸/点炮）
+    
+    @property
+    def hand(self):
+        """手牌"""
+        return self._hand
+    
+    @hand.setter
+    def hand(self, cards):
+        self._hand = cards if isinstance(cards, Hand) else Hand(cards)
+    
+    @property
+    def melds(self):
+        """吃碰杠的面子"""
+        return self._melds
+    
+    @melds.setter
+    def melds(self, melds):
+        self._melds = melds if isinstance(melds, MeldList) else MeldList(melds)
+    
+    def clone(self) -> 'Player':
+        """复制玩家（手牌、面子、花牌为独立副本，上下家关系由GameState.clone重建）
+
+        面子按 (类型, 基准牌) 重建为Meld（补杠会原地修改面子的类型，不能共用），
+        兼容只有type和cards属性的面子对象。
+        """
+        from src.core.data.meld import Meld
+        other = Player.__new__(Player)
+        other.__dict__.update(self.__dict__)
+        other.hand = list(self.hand)
+        melds = []
+        for meld in self.melds:
+            kind, tile = MeldList._key(meld)
+            melds.append(Meld(kind, tile=tile, from_player=getattr(meld, 'from_player', None)))
+        other.melds = melds
+        other.hua_cards = list(self.hua_cards)
+        other.previous_player = other.next_player = None
+        return other
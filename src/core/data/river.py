@@ -0,0 +1,121 @@
+"""各座位的弃牌河
+
+GameState.discard_pile只保存全局的出牌顺序，不记录是谁打的。
+DiscardRivers为每个座位按顺序保存打出的牌（牌编号、出牌序号、是否被吃碰杠胡），
+并在每次打牌时维护：
+
+- 每个座位打过的牌的34位掩码和计数（"X是否打过T"为O(1)）
+- 每个座位最近一次打牌的序号
+- 每种牌最近一次被打出的序号和座位
+
+由此可以O(1)判断某张牌是否是某个对手"见过而没有胡"的牌：该对手上次打牌
+之后有别人打出这张牌，而对手的手牌从那之后没有变化，说明对手没有听这张牌。
+"""
+from src.core.data.tile import NUM_TILE_TYPES
+
+
+class River:
+    """一个座位的弃牌河"""
+    __slots__ = ('tiles', 'turns', 'called', 'mask', 'counts', 'last_turn')
+
+    def __init__(self):
+        self.tiles = bytearray()    # 牌编号
+        self.turns = []             # 出牌序号（全局第几次打牌，从0开始）
+        self.called = bytearray()   # 是否被吃碰杠胡取走
+        self.mask = 0               # 打过的牌的掩码（只含非花牌）
+        self.counts = [0] * NUM_TILE_TYPES
+        self.last_turn = -1         # 最近一次打牌的序号
+
+    def copy(self) -> 'River':
+        other = River.__new__(River)
+        other.tiles = bytearray(self.tiles)
+        other.turns = list(self.turns)
+        other.called = bytearray(self.called)
+        other.mask = self.mask
+        other.counts = list(self.counts)
+        other.last_turn = self.last_turn
+        return other
+
+    def __len__(self):
+        return len(self.tiles)
+
+    def __iter__(self):
+        """按顺序遍历 (牌编号, 出牌序号, 是否被取走)"""
+        return zip(self.tiles, self.turns, map(bool, self.called))
+
+    def has_discarded(self, tid: int) -> bool:
+        """该座位是否打过tid"""
+        return bool(self.mask >> tid & 1)
+
+    def append(self, tid: int, turn: int) -> None:
+        self.tiles.append(tid)
+        self.turns.append(turn)
+        self.called.append(0)
+        if 0 <= tid < NUM_TILE_TYPES:
+            self.mask |= 1 << tid
+            self.counts[tid] += 1
+        self.last_turn = turn
+
+
+class DiscardRivers:
+    """全部座位的弃牌河（由DeckManager.discard_card/take_discard维护）"""
+    __slots__ = ('rivers', 'turn', 'tile_turn', 'tile_seat', 'last_seat')
+
+    def __init__(self):
+        self.rivers = {}                        # 座位 -> River
+        self.turn = 0                           # 下一次打牌的序号
+        self.tile_turn = [-1] * NUM_TILE_TYPES  # 每种牌最近一次被打出的序号
+        self.tile_seat = [-1] * NUM_TILE_TYPES  # 每种牌最近一次被谁打出
+        self.last_seat = -1                     # 最近一次打牌的座位（被取走后为-1）
+
+    def copy(self) -> 'DiscardRivers':
+        other = DiscardRivers.__new__(DiscardRivers)
+        other.rivers = {seat: river.copy() for seat, river in self.rivers.items()}
+        other.turn = self.turn
+        other.tile_turn = list(self.tile_turn)
+        other.tile_seat = list(self.tile_seat)
+        other.last_seat = self.last_seat
+        return other
+
+    def __getitem__(self, seat: int) -> River:
+        """获取座位的弃牌河（没有记录时新建）"""
+        river = self.rivers.get(seat)
+        if river is None:
+            river = self.rivers[seat] = River()
+        return river
+
+    def record(self, seat: int, tid: int) -> int:
+        """记录座位seat打出tid
+
+        Returns:
+            int: 这次打牌的序号
+        """
+        turn = self.turn
+        self.turn += 1
+        self[seat].append(tid, turn)
+        if 0 <= tid < NUM_TILE_TYPES:
+            self.tile_turn[tid] = turn
+            self.tile_seat[tid] = seat
+        self.last_seat = seat
+        return turn
+
+    def mark_called(self) -> None:
+        """最近打出的牌被取走（吃碰杠胡）"""
+        if self.last_seat >= 0:
+            self.rivers[self.last_seat].called[-1] = 1
+            self.last_seat = -1
+
+    def passed(self, seat: int, tid: int) -> bool:
+        """座位seat上次打牌之后，是否有别人打出过tid（该座位见过这张牌而没有胡）
+
+        Args:
+            seat: 对手座位
+            tid: 牌编号
+
+        Returns:
+            bool: 是否见过而没有胡
+        """
+        river = self.rivers.get(seat)
+        if river is None or river.last_turn < 0 or not 0 <= tid < NUM_TILE_TYPES:
+            return False
+        return self.tile_turn[tid] > river.last_turn and self.tile_seat[tid] != seat
@@ -0,0 +1,102 @@
+"""牌编号（tile ID）定义
+
+将牌映射为紧凑的整数编号，供查表、计数数组等高性能路径使用：
+
+    0-8   一万 ~ 九万
+    9-17  一筒 ~ 九筒
+    18-26 一条 ~ 九条
+    27-30 东 南 西 北
+    31-33 中 发 白
+    34-41 梅 兰 竹 菊 春 夏 秋 冬
+"""
+
+NUMBER_SUITS = ('万', '筒', '条')
+WINDS = ('东', '南', '西', '北')
+ARROWS = ('中', '发', '白')
+FLOWERS = ('梅', '兰', '竹', '菊', '春', '夏', '秋', '冬')
+
+NUM_TILE_TYPES = 34     # 不含花牌的牌种数
+NUM_ALL_TILE_TYPES = 42 # 含花牌的牌种数
+FLOWER_BASE = 34
+
+# (花色, 点数) -> 编号
+TILE_IDS = {}
+for _s, _suit in enumerate(NUMBER_SUITS):
+    for _rank in range(1, 10):
+        TILE_IDS[(_suit, str(_rank))] = _s * 9 + _rank - 1
+for _i, _rank in enumerate(WINDS):
+    TILE_IDS[('风', _rank)] = 27 + _i
+for _i, _rank in enumerate(ARROWS):
+    TILE_IDS[('箭', _rank)] = 31 + _i
+for _i, _rank in enumerate(FLOWERS):
+    TILE_IDS[('花', _rank)] = FLOWER_BASE + _i
+
+# 编号 -> (花色, 点数)
+TILE_NAMES = [None] * NUM_ALL_TILE_TYPES
+for (_suit, _rank), _tid in TILE_IDS.items():
+    TILE_NAMES[_tid] = (_suit, _rank)
+
+_CARD_POOL = [None] * NUM_ALL_TILE_TYPES
+
+
+def tile_id(suit: str, rank: str) -> int:
+    """获取牌的编号
+
+    Args:
+        suit: 花色
+        rank: 点数
+
+    Returns:
+        int: 牌编号，未知的牌返回-1
+    """
+    return TILE_IDS.get((suit, rank), -1)
+
+
+def card_from_id(tid: int):
+    """根据编号获取共享的Card实例（享元，不可修改）
+
+    Args:
+        tid: 牌编号
+
+    Returns:
+        Card: 对应的牌
+    """
+    card = _CARD_POOL[tid]
+    if card is None:
+        from src.core.data.card import Card
+        card = Card(*TILE_NAMES[tid])
+        _CARD_POOL[tid] = card
+    return card
+
+
+def is_number_tile(tid: int) -> bool:
+    """判断是否是序数牌"""
+    return 0 <= tid < 27
+
+
+def is_honor_tile(tid: int) -> bool:
+    """判断是否是字牌（风牌、箭牌）"""
+    return 27 <= tid < NUM_TILE_TYPES
+
+
+def is_flower_tile(tid: int) -> bool:
+    """判断是否是花牌"""
+    return tid >= FLOWER_BASE
+
+
+def to_counts(cards, size: int = NUM_TILE_TYPES) -> list:
+    """将牌列表转换为计数数组
+
+    Args:
+        cards: 牌列表
+        size: 数组长度（默认34，不统计花牌）
+
+    Returns:
+        list: 每种牌的数量
+    """
+    counts = [0] * size
+    for card in cards:
+        tid = card.tile_id
+        if 0 <= tid < size:
+            counts[tid] += 1
+    return counts
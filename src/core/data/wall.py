@@ -0,0 +1,132 @@
+import random
+
+from src.core.data.tile import card_from_id
+from src.core.data.zobrist import MAX_WALL, WALL_HEAD_KEYS, WALL_TAIL_KEYS
+
+class Wall:
+    """牌墙
+
+    以bytearray保存牌编号，head/tail两个指针界定剩余部分：
+    正常摸牌从尾端取（tail前移），杠牌、补花的补牌从另一端取（head后移）。
+    摸牌、查询剩余张数都是O(1)，不移动数组元素；局面快照只需复制缓冲区。
+
+    为兼容原先的列表牌墙，支持len、bool、迭代以及pop()/pop(0)。
+    """
+    __slots__ = ('tiles', 'head', 'tail')
+
+    def __init__(self, tiles=b''):
+        """
+        Args:
+            tiles: 牌编号序列（最后一个元素最先被摸到）
+        """
+        self.tiles = bytearray(tiles)
+        self.head = 0
+        self.tail = len(self.tiles)
+
+    @classmethod
+    def from_cards(cls, cards) -> 'Wall':
+        """由牌列表创建牌墙（列表末尾的牌最先被摸到）"""
+        return cls(card.tile_id for card in cards)
+
+    def __len__(self):
+        return self.tail - self.head
+
+    def __bool__(self):
+        return self.tail > self.head
+
+    def __iter__(self):
+        """按从head到tail的顺序遍历剩余的牌"""
+        tiles = self.tiles
+        for i in range(self.head, self.tail):
+            yield card_from_id(tiles[i])
+
+    def __repr__(self):
+        return f"Wall({len(self)}张)"
+
+    @property
+    def zobrist(self) -> int:
+        """牌墙位置的Zobrist哈希（由head、tail得到，O(1)）"""
+        return WALL_HEAD_KEYS[self.head % MAX_WALL] ^ WALL_TAIL_KEYS[self.tail % MAX_WALL]
+
+    def shuffle(self, rng=random) -> None:
+        """原地洗乱剩余的牌（Fisher–Yates）
+
+        Args:
+            rng: 随机数生成器（需要提供randrange），默认为random模块
+        """
+        tiles = self.tiles
+        head = self.head
+        randrange = rng.randrange
+        for i in range(self.tail - 1, head, -1):
+            j = head + randrange(i - head + 1)
+            tiles[i], tiles[j] = tiles[j], tiles[i]
+
+    def draw_id(self) -> int:
+        """从尾端摸一张牌，返回牌编号（牌墙已空时返回-1）"""
+        if self.tail <= self.head:
+            return -1
+        self.tail -= 1
+        return self.tiles[self.tail]
+
+    def draw_replacement_id(self) -> int:
+        """从另一端补一张牌，返回牌编号（牌墙已空时返回-1）"""
+        if self.tail <= self.head:
+            return -1
+        tid = self.tiles[self.head]
+        self.head += 1
+        return tid
+
+    def draw_block(self, count: int) -> bytes:
+        """从尾端一次摸多张牌
+
+        Args:
+            count: 张数（超过剩余张数时取完为止）
+
+        Returns:
+            bytes: 牌编号，顺序与逐张摸牌相同
+        """
+        start = max(self.head, self.tail - count)
+        block = self.tiles[start:self.tail][::-1]
+        self.tail = start
+        return bytes(block)
+
+    def draw(self):
+        """从尾端摸一张牌（牌墙已空时返回None）"""
+        tid = self.draw_id()
+        return card_from_id(tid) if tid >= 0 else None
+
+    def draw_replacement(self):
+        """从另一端补一张牌（牌墙已空时返回None）"""
+        tid = self.draw_replacement_id()
+        return card_from_id(tid) if tid >= 0 else None
+
+    def pop(self, index: int = -1):
+        """兼容列表接口：pop()摸牌，pop(0)补牌
+
+        Raises:
+            IndexError: 牌墙已空或位置不受支持
+        """
+        if not self:
+            raise IndexError("牌墙已空")
+        if index == -1:
+            return self.draw()
+        if index == 0:
+            return self.draw_replacement()
+        raise IndexError("牌墙只能从两端取牌")
+
+    def snapshot(self) -> tuple:
+        """获取快照 (牌编号缓冲区, head, tail)"""
+        return bytes(self.tiles), self.head, self.tail
+
+    @classmethod
+    def restore(cls, snapshot: tuple) -> 'Wall':
+        """由快照恢复牌墙"""
+        tiles, head, tail = snapshot
+        wall = cls(tiles)
+        wall.head = head
+        wall.tail = tail
+        return wall
+
+    def copy(self) -> 'Wall':
+        """复制牌墙"""
+        return Wall.restore(self.snapshot())
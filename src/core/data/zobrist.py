@@ -0,0 +1,98 @@
+"""局面的Zobrist哈希
+
+为局面中的每个组成部分预先生成64位随机键，局面哈希为所含部分的键的异或。
+各部分在变化时增量更新哈希（异或掉旧键、异或上新键），每次操作O(1)：
+
+- 手牌（Hand.zobrist）：第k张编号为t的牌对应键HAND_KEYS[t][k-1]
+- 面子（MeldList.zobrist）：第k副相同的面子对应键MELD_KEYS[类型][基准牌][k-1]
+- 弃牌（GameState.discard_hash）：弃牌堆第i张为t对应键DISCARD_KEYS[i][t]
+- 牌墙位置（Wall.zobrist）：由head、tail两个指针的键异或得到
+
+state_key组合各玩家、弃牌、牌墙位置和当前玩家，可用作置换表和
+AI推荐缓存的键。键由固定种子生成，同一局面在不同进程中哈希相同。
+"""
+import random
+
+from src.core.data.tile import NUM_ALL_TILE_TYPES
+
+MASK64 = (1 << 64) - 1
+MAX_COPIES = 8        # 手牌中同一种牌的张数上限（超出时与最后一个键共用）
+MAX_MELD_COPIES = 4   # 相同面子的数量上限
+MAX_DISCARDS = 160    # 弃牌位置数（超出时循环使用）
+MAX_WALL = 256        # 牌墙指针位置数（超出时循环使用）
+MAX_SEATS = 8
+NUM_MELD_TYPES = 5
+
+_rng = random.Random(0x5A0B_2157)
+
+
+def _keys(*shape):
+    if len(shape) == 1:
+        return tuple(_rng.getrandbits(64) for _ in range(shape[0]))
+    return tuple(_keys(*shape[1:]) for _ in range(shape[0]))
+
+
+HAND_KEYS = _keys(NUM_ALL_TILE_TYPES, MAX_COPIES)
+MELD_KEYS = _keys(NUM_MELD_TYPES, NUM_ALL_TILE_TYPES, MAX_MELD_COPIES)
+DISCARD_KEYS = _keys(MAX_DISCARDS, NUM_ALL_TILE_TYPES)
+WALL_HEAD_KEYS = _keys(MAX_WALL)
+WALL_TAIL_KEYS = _keys(MAX_WALL)
+TURN_KEYS = _keys(MAX_SEATS)
+MUST_DISCARD_KEY = _rng.getrandbits(64)
+# 按座位混合玩家哈希的奇数乘数（乘以奇数在模2^64下是双射）
+SEAT_MULTIPLIERS = tuple(_rng.getrandbits(64) | 1 for _ in range(MAX_SEATS))
+
+del _rng
+
+
+def hand_key(tid: int, count: int) -> int:
+    """手牌中第count张编号为tid的牌的键"""
+    return HAND_KEYS[tid][min(count, MAX_COPIES) - 1]
+
+
+def meld_key(kind: int, tile: int, index: int) -> int:
+    """第index+1副 (类型, 基准牌) 相同的面子的键"""
+    return MELD_KEYS[kind][tile][min(index, MAX_MELD_COPIES - 1)]
+
+
+def discard_key(position: int, tid: int) -> int:
+    """弃牌堆第position张为tid的键"""
+    return DISCARD_KEYS[position % MAX_DISCARDS][tid]
+
+
+def player_key(player) -> int:
+    """玩家的哈希（手牌和面子，与座位无关）"""
+    return player.hand.zobrist ^ player.melds.zobrist
+
+
+def tiles_key(game_state) -> int:
+    """牌的分布的哈希：各座位的手牌和面子、弃牌、牌墙位置（不含轮到谁）
+
+    Args:
+        game_state: 游戏状态实例
+
+    Returns:
+        int: 64位哈希
+    """
+    h = game_state.discard_hash ^ game_state.deck.zobrist
+    for seat, player in enumerate(game_state.players):
+        h ^= player_key(player) * SEAT_MULTIPLIERS[seat % MAX_SEATS] & MASK64
+    return h
+
+
+def state_key(game_state) -> int:
+    """局面哈希：牌的分布加上当前玩家和是否需要直接出牌
+
+    Args:
+        game_state: 游戏状态实例
+
+    Returns:
+        int: 64位哈希
+    """
+    h = tiles_key(game_state)
+    current = game_state.current_player
+    if current is not None and current.seat is not None:
+        h ^= TURN_KEYS[current.seat % MAX_SEATS]
+    if game_state.must_discard:
+        h ^= MUST_DISCARD_KEY
+    return h
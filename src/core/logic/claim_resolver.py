@@ -0,0 +1,107 @@
+from src.core.data.action import Action
+from src.core.data.decision import DecisionRequest
+
+class ClaimResolver:
+    """打出牌后的响应仲裁（胡 > 杠/碰 > 吃）"""
+
+    # 响应优先级
+    PRIORITY = {"hu": 3, "kong": 2, "pong": 2, "chow": 1}
+
+    @staticmethod
+    def collect_claims(game_state, discarder, card) -> list:
+        """一次遍历收集所有对手可以进行的响应
+
+        先用每位玩家预先计算好的可响应位图过滤，绝大多数情况下
+        每位对手只需一次位运算即可排除；命中后再由规则做完整检查。
+
+        Args:
+            game_state: 游戏状态实例
+            discarder: 打出牌的玩家
+            card: 打出的牌
+
+        Returns:
+            list: (玩家, 响应类型) 列表，按距打出者的座位顺序排列
+        """
+        rule = game_state.rule
+        players = game_state.players
+        count = len(players)
+        bit = 1 << card.tile_id
+        claims = []
+
+        for offset in range(1, count):
+            player = players[(discarder.seat + offset) % count]
+            index = player.hand.claim_index()
+            mask = index.win | index.pong
+            if offset == 1:
+                mask |= index.chow  # 只能吃上家的牌
+            if not mask & bit:
+                continue
+
+            if index.win & bit and rule.allow_other_hu and rule.can_hu(player, card):
+                claims.append((player, "hu"))
+            if index.kong & bit and rule.allow_kong and rule.can_kong(player, card, discarder):
+                claims.append((player, "kong"))
+            if index.pong & bit and rule.allow_pong and rule.can_pong(player, card, discarder):
+                claims.append((player, "pong"))
+            if offset == 1 and index.chow & bit and rule.allow_chow and rule.can_chow(player, card, discarder):
+                claims.append((player, "chow"))
+
+        return claims
+
+    @staticmethod
+    def resolve(game_state, discard_action, decide) -> list:
+        """仲裁打出牌后的响应
+
+        按优先级依次询问玩家是否响应。胡牌按规则的multiple_hu_policy处理：
+        "first"为截胡（距打出者最近的玩家胡），"all"为一炮多响。
+
+        Args:
+            game_state: 游戏状态实例
+            discard_action: 打牌操作
+            decide: 询问玩家是否响应的回调 decide(player, claim_type, card) -> bool
+
+        Returns:
+            list: (玩家, 响应操作) 列表；无人响应时为空列表
+        """
+        steps = ClaimResolver.resolve_steps(game_state, discard_action)
+        try:
+            request = next(steps)
+            while True:
+                request = steps.send(decide(request.player, request.claim_type, request.card))
+        except StopIteration as stop:
+            return stop.value
+
+    @staticmethod
+    def resolve_steps(game_state, discard_action):
+        """仲裁打出牌后的响应（生成器形式）
+
+        每次需要询问玩家时产出DecisionRequest.CLAIM，由驱动方send回是否响应。
+
+        Returns:
+            list: 同resolve，作为生成器的返回值
+        """
+        discarder = discard_action.from_player
+        card = discard_action.card
+        claims = ClaimResolver.collect_claims(game_state, discarder, card)
+        if not claims:
+            return []
+
+        # 稳定排序：同优先级按座位顺序
+        claims.sort(key=lambda claim: -ClaimResolver.PRIORITY[claim[1]])
+
+        winners = []
+        for player, claim_type in claims:
+            if claim_type != "hu":
+                break
+            if (yield DecisionRequest(DecisionRequest.CLAIM, player, claim_type=claim_type, card=card)):
+                winners.append((player, Action(Action.HU, card, discarder)))
+                if game_state.rule.multiple_hu_policy == "first":
+                    break
+        if winners:
+            return winners
+
+        for player, claim_type in claims:
+            if claim_type != "hu" and (yield DecisionRequest(DecisionRequest.CLAIM, player, claim_type=claim_type, card=card)):
+                return [(player, Action(claim_type, card, discarder))]
+
+        return []
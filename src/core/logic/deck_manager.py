@@ -1,6 +1,10 @@
 import random
 
 from src.core.data.card import Card
+from src.core.data.hand import Hand
+from src.core.data.tile import FLOWER_BASE, NUM_ALL_TILE_TYPES, card_from_id
+from src.core.data.wall import Wall
+from src.core.data.zobrist import discard_key
 
 class DeckManager:
     """牌墙管理类"""
@@ -18,17 +22,18 @@ class DeckManager:
         return rule.create_initial_deck()
     
     @staticmethod
-    def shuffle(deck) -> list:
+    def shuffle(deck, rng=None) -> Wall:
         """洗牌
         
         Args:
-            deck: 牌组
+            deck: 牌组（牌列表或牌墙，不会被修改）
+            rng: 随机数生成器，默认为random模块
         
         Returns:
-            洗牌后的牌组
+            洗牌后的牌墙
         """
-        shuffled = deck.copy()
-        random.shuffle(shuffled)
+        shuffled = deck.copy() if isinstance(deck, Wall) else Wall.from_cards(deck)
+        shuffled.shuffle(rng or random)
         return shuffled
     
     @staticmethod
@@ -48,13 +53,27 @@ class DeckManager:
         # 发牌：顺时针方向，每次发一张牌
         for _ in range(starting_tiles):
             for player in players:
-                card = deck.pop()
+                card = deck.draw()
                 player.hand.append(card)
         
         # 庄家额外多一张牌
         if rule.dealer_extra_tile:
             dealer = next(p for p in players if p.is_dealer)
-            dealer.hand.append(deck.pop())
+            dealer.hand.append(deck.draw())
+    
+    @staticmethod
+    def deal_hands(game_state, count: int) -> None:
+        """按玩家顺序为每人一次切出count张牌作为手牌
+        
+        每手牌只构造一次（计数数组和可响应位图一次算好），不逐张追加。
+        
+        Args:
+            game_state: 游戏状态实例
+            count: 每人的张数
+        """
+        deck = game_state.deck
+        for player in game_state.players:
+            player.hand = Hand([card_from_id(tid) for tid in deck.draw_block(count)])
     
     @staticmethod
     def draw_card(game_state) -> Card:
@@ -66,21 +85,75 @@ class DeckManager:
         Returns:
             摸到的牌
         """
-        if not game_state.deck:
-            return None  # 牌墙已空
+        return game_state.deck.draw()  # 牌墙已空时为None
+    
+    @staticmethod
+    def draw_replacement_card(game_state) -> Card:
+        """从牌墙另一端补牌（杠牌、补花后使用）
         
-        return game_state.deck.pop()
+        Args:
+            game_state: 游戏状态实例
+        
+        Returns:
+            补到的牌
+        """
+        return game_state.deck.draw_replacement()  # 牌墙已空时为None
     
     @staticmethod
-    def discard_card(game_state, card) -> None:
+    def replace_flowers(game_state, player) -> None:
+        """将手牌中的花牌补出，并从牌墙另一端补牌
+        
+        Args:
+            game_state: 游戏状态实例
+            player: 玩家
+        """
+        hand = player.hand
+        flower_ids = [tid for tid in range(FLOWER_BASE, NUM_ALL_TILE_TYPES) if hand.counts[tid]]
+        for tid in flower_ids:
+            player.hua_cards.append(hand.take(tid))
+            player.changed_flower_count += 1
+            card = DeckManager.draw_replacement_card(game_state)
+            while card is not None and card.suit == '花':
+                player.hua_cards.append(card)
+                player.changed_flower_count += 1
+                card = DeckManager.draw_replacement_card(game_state)
+            if card is not None:
+                hand.append(card)
+    
+    @staticmethod
+    def discard_card(game_state, card, player=None) -> None:
         """将牌打入弃牌堆
         
         Args:
             game_state: 游戏状态实例
             card: 要打出的牌
+            player: 打牌的玩家，默认为当前玩家（用于记入其弃牌河、更新其危险度向量）
         """
-        game_state.discard_pile.append(card)
+        pile = game_state.discard_pile
+        game_state.discard_hash ^= discard_key(len(pile), card.tile_id)
+        game_state.discard_counts[card.tile_id] += 1
+        pile.append(card)
+        player = player or game_state.current_player
+        if player is not None and player.seat is not None:
+            game_state.rivers.record(player.seat, card.tile_id)
+        game_state.danger_map.on_discard(player, card.tile_id)
         game_state.last_discarded_card = card
+    
+    @staticmethod
+    def take_discard(game_state) -> Card:
+        """取走最后打出的牌（被吃碰杠胡时使用）
+        
+        Args:
+            game_state: 游戏状态实例
+        
+        Returns:
+            被取走的牌
+        """
+        card = game_state.discard_pile.pop()
+        game_state.discard_hash ^= discard_key(len(game_state.discard_pile), card.tile_id)
+        game_state.discard_counts[card.tile_id] -= 1
+        game_state.rivers.mark_called()
+        return card
 
 def shuffle_and_deal(game_state) -> None:
     """洗牌并发牌
@@ -92,7 +165,7 @@ def shuffle_and_deal(game_state) -> None:
     initial_deck = DeckManager.create_initial_deck(game_state.rule)
     
     # 洗牌
-    shuffled_deck = DeckManager.shuffle(initial_deck)
+    shuffled_deck = DeckManager.shuffle(initial_deck, game_state.rng)
     
     # 设置到游戏状态中
     game_state.deck = shuffled_deck
@@ -19,8 +19,8 @@ class GameFlow:
         # 处理当前玩家的回合
         action = TurnHandler.process_turn(self.game_state)
         
-        # 如果是胡牌操作，游戏结束
-        if action.type == "hu":
+        # 胡牌或流局，游戏结束
+        if self.game_state.game_stage == "ended":
             self.end_game()
     
     def end_game(self):
@@ -33,7 +33,10 @@ class GameFlow:
     def print_game_result(self):
         """打印游戏结果"""
         print("\n游戏结束！")
-        print(f"赢家: {self.game_state.winner.name}")
+        if self.game_state.winner:
+            print(f"赢家: {self.game_state.winner.name}")
+        else:
+            print("流局")
         print(f"场风: {self.game_state.wind}")
         print(f"局数: {self.game_state.round_number}")
         
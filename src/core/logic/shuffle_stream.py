@@ -0,0 +1,65 @@
+"""预生成的洗牌排列流
+
+批量模拟时每局都要洗一次144张牌。ShuffleStream按块预先生成多个排列：
+安装了numpy时一块排列由一次向量化调用（Generator.permuted）生成，
+否则逐个用random.Random洗牌。排列直接传给GameState.initialize_game，
+发牌时整段切出手牌，不再创建初始牌组。
+
+同一种子下numpy与纯Python生成的排列不同，但各自可复现。
+"""
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ShuffleStream:
+    """按块生成牌编号排列"""
+
+    def __init__(self, tiles: bytes, block_size: int = 256, seed=None):
+        """
+        Args:
+            tiles: 初始牌组的牌编号（如rule.initial_tile_ids()）
+            block_size: 每块生成的排列数
+            seed: 随机种子
+        """
+        self.tiles = bytes(tiles)
+        self.block_size = block_size
+        if np is not None:
+            self._generator = np.random.default_rng(seed)
+            self._base = np.frombuffer(self.tiles, dtype=np.uint8)
+        else:
+            self._rng = random.Random(seed)
+        self._block = []
+        self._index = 0
+
+    def _fill(self) -> None:
+        """生成下一块排列"""
+        if np is not None:
+            block = self._generator.permuted(np.tile(self._base, (self.block_size, 1)), axis=1)
+            self._block = [row.tobytes() for row in block]
+        else:
+            shuffle = self._rng.shuffle
+            tiles = list(self.tiles)
+            block = []
+            for _ in range(self.block_size):
+                shuffle(tiles)
+                block.append(bytes(tiles))
+            self._block = block
+        self._index = 0
+
+    def next(self) -> bytes:
+        """获取下一个排列"""
+        if self._index >= len(self._block):
+            self._fill()
+        permutation = self._block[self._index]
+        self._index += 1
+        return permutation
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        return self.next()
@@ -1,10 +1,16 @@
 from src.core.data.action import Action
+from src.core.data.claim_index import CHOW_OFFSETS
+from src.core.data.decision import DecisionRequest
+from src.core.data.meld import Meld
+from src.core.logic.claim_resolver import ClaimResolver
 from src.core.logic.deck_manager import DeckManager, shuffle_and_deal
+from src.core.utils.instrument import instrumented
 
 class TurnHandler:
     """回合处理类"""
     
     @staticmethod
+    @instrumented
     def process_turn(game_state):
         """处理单个玩家的回合
         
@@ -14,47 +20,206 @@ class TurnHandler:
         Returns:
             玩家执行的操作
         """
-        current_player = game_state.current_player
-        rule = game_state.rule
+        steps = TurnHandler.turn_steps(game_state)
+        try:
+            request = next(steps)
+            while True:
+                request = steps.send(TurnHandler.answer(request, game_state))
+        except StopIteration as stop:
+            return stop.value
+    
+    @staticmethod
+    def turn_steps(game_state):
+        """单个玩家的回合（生成器形式）
         
-        # 1. 摸牌
-        drawn_card = DeckManager.draw_card(game_state)
-        current_player.drawn_card = drawn_card
+        需要玩家决策时产出DecisionRequest，由驱动方send回决策结果，
+        因此同一套回合逻辑既可以同步执行（process_turn），也可以由异步的
+        桌台服务等待远程玩家的操作。
         
-        # 2. 检查是否可以自摸胡牌
-        if rule.can_hu(current_player, drawn_card):
-            action = Action("hu", drawn_card)
-            TurnHandler.execute_action(action, current_player, game_state)
-            return action
+        Args:
+            game_state: 游戏状态实例
         
-        # 3. 获取有效操作列表
-        valid_actions = rule.get_valid_actions(current_player, game_state)
+        Returns:
+            玩家执行的操作（作为生成器的返回值）
+        """
+        current_player = game_state.current_player
+        rule = game_state.rule
         
-        # 4. AI决策或玩家输入
-        if current_player.is_ai:
-            from src.ai.decision import AI_Decision
-            ai_decision = AI_Decision(current_player.ai_strategy, rule)
-            action = ai_decision.make_decision(current_player, game_state, valid_actions)
+        # 1. 摸牌（吃碰后直接出牌，明杠后使用已补的牌）
+        if game_state.must_discard:
+            game_state.must_discard = False
+            drawn_card = current_player.drawn_card
         else:
-            from src.interface.game_api import get_player_input
-            action = get_player_input(current_player, game_state, valid_actions)
+            current_player.consecutive_gang_count = 0
+            current_player.last_action = "摸牌"
+            game_state.last_discarded_card = None
+            drawn_card = TurnHandler.draw(game_state, current_player)
+            if drawn_card is None:
+                return TurnHandler.end_in_draw(game_state)
+        
+        while True:
+            if drawn_card is not None:
+                # 2. 检查是否可以自摸胡牌
+                if rule.can_hu(current_player, drawn_card):
+                    action = Action(Action.HU, drawn_card)
+                    TurnHandler.execute_action(action, current_player, game_state)
+                    return action
+                current_player.hand.append(drawn_card)
+            
+            # 3. 获取有效操作列表
+            valid_actions = rule.get_valid_actions(current_player, game_state)
+            
+            # 4. AI决策或玩家输入
+            action = yield DecisionRequest(DecisionRequest.ACTION, current_player, valid_actions)
+            if action.op != Action.KONG:
+                break
+            
+            # 暗杠/补杠后补牌，继续本回合
+            TurnHandler.execute_action(action, current_player, game_state)
+            drawn_card = current_player.drawn_card
+            if drawn_card is None:
+                return TurnHandler.end_in_draw(game_state)
         
         # 5. 执行操作
         TurnHandler.execute_action(action, current_player, game_state)
         
-        # 6. 检查是否有其他玩家可以胡牌（如果是打牌操作）
-        if action.type == "discard" and rule.allow_other_hu:
-            for player in game_state.players:
-                if player != current_player and rule.can_hu(player, action.card):
-                    hu_action = Action("hu", action.card, current_player)
-                    TurnHandler.execute_action(hu_action, player, game_state)
-                    return hu_action
+        # 6. 其他玩家响应（胡、杠、碰、吃）
+        if action.op == Action.DISCARD:
+            claims = yield from ClaimResolver.resolve_steps(game_state, action)
+            if claims:
+                return TurnHandler.execute_claims(claims, game_state)
         
         # 7. 切换到下一个玩家
         TurnHandler.switch_player(game_state)
         
         return action
     
+    @staticmethod
+    def answer(request, game_state):
+        """同步回答决策请求（AI策略或本地玩家输入）
+        
+        Args:
+            request: DecisionRequest
+            game_state: 游戏状态实例
+        
+        Returns:
+            ACTION为Action，CLAIM为bool
+        """
+        if request.kind == DecisionRequest.CLAIM:
+            return TurnHandler.decide_claim(request.player, game_state, request.claim_type, request.card)
+        return TurnHandler.decide(request.player, game_state, request.valid_actions)
+    
+    @staticmethod
+    def decide(player, game_state, valid_actions):
+        """获取玩家的决策
+        
+        Args:
+            player: 当前玩家
+            game_state: 游戏状态实例
+            valid_actions: 有效操作列表
+        
+        Returns:
+            玩家选择的操作
+        """
+        if player.is_ai:
+            if player.ai_strategy is None:
+                # 没有配置策略时摸切
+                return Action(Action.DISCARD, player.hand[-1])
+            action_type, card, _ = player.ai_strategy.recommend_action(player, game_state)
+            return Action(action_type, card)
+        
+        from src.interface.game_api import get_player_input
+        return get_player_input(player, game_state, valid_actions)
+    
+    @staticmethod
+    def decide_claim(player, game_state, claim_type, card) -> bool:
+        """询问玩家是否响应别人打出的牌
+        
+        Args:
+            player: 可以响应的玩家
+            game_state: 游戏状态实例
+            claim_type: 响应类型（hu/kong/pong/chow）
+            card: 打出的牌
+        
+        Returns:
+            bool: 是否响应
+        """
+        if player.is_ai:
+            strategy = player.ai_strategy
+            if strategy is None or not hasattr(strategy, 'should_claim'):
+                return claim_type == "hu"
+            return strategy.should_claim(player, game_state, claim_type, card)
+        
+        from src.interface.game_api import get_claim_input
+        return get_claim_input(player, game_state, claim_type, card)
+    
+    @staticmethod
+    def execute_claims(claims, game_state):
+        """执行仲裁后的响应
+        
+        Args:
+            claims: (玩家, 响应操作) 列表，胡牌时可能有多个
+            game_state: 游戏状态实例
+        
+        Returns:
+            第一个响应操作
+        """
+        player, action = claims[0]
+        TurnHandler.execute_action(action, player, game_state)
+        
+        # 一炮多响：其余赢家使用同一张牌结算
+        for other, other_action in claims[1:]:
+            other.hand.append(other_action.card)
+            TurnHandler._settle_hu(other_action, other, game_state)
+        
+        if action.op == Action.KONG:
+            # 明杠后轮到杠牌者，使用补到的牌继续
+            if player.drawn_card is None:
+                TurnHandler.end_in_draw(game_state)
+            else:
+                game_state.must_discard = True
+        return action
+    
+    @staticmethod
+    def draw(game_state, player, replacement: bool = False):
+        """为玩家摸牌，摸到花牌时补花
+        
+        Args:
+            game_state: 游戏状态实例
+            player: 摸牌的玩家
+            replacement: 是否从牌墙另一端补牌（杠后补牌）
+        
+        Returns:
+            摸到的牌（牌墙已空时为None），尚未加入手牌
+        """
+        if replacement:
+            card = DeckManager.draw_replacement_card(game_state)
+        else:
+            card = DeckManager.draw_card(game_state)
+        
+        while card is not None and card.suit == '花':
+            player.hua_cards.append(card)
+            player.changed_flower_count += 1
+            player.last_action = "补花"
+            card = DeckManager.draw_replacement_card(game_state)
+        
+        player.drawn_card = card
+        return card
+    
+    @staticmethod
+    def end_in_draw(game_state):
+        """牌墙摸完，流局
+        
+        Args:
+            game_state: 游戏状态实例
+        
+        Returns:
+            流局操作
+        """
+        game_state.game_stage = "ended"
+        game_state.winner = None
+        return Action(Action.DRAW)
+    
     @staticmethod
     def execute_action(action, player, game_state):
         """执行玩家操作
@@ -64,33 +229,145 @@ class TurnHandler:
             player: 执行操作的玩家
             game_state: 游戏状态实例
         """
-        rule = game_state.rule
-        
-        if action.type == "draw":
+        if action.op == Action.DRAW:
             # 摸牌操作已经在process_turn中处理
             pass
-        elif action.type == "discard":
+        elif action.op == Action.DISCARD:
             # 打牌
             if action.card in player.hand:
-                player.hand.remove(action.card)
-                DeckManager.discard_card(game_state, action.card)
+                card = player.hand.take(action.card.tile_id)
+                DeckManager.discard_card(game_state, card, player)
                 action.from_player = player
-        elif action.type == "chow":
+                game_state.last_discarded_card = action
+                player.drawn_card = None
+        elif action.op == Action.CHOW:
             # 吃牌
-            # TODO: 实现吃牌逻辑
-            pass
-        elif action.type == "pong":
+            TurnHandler.handle_chow(action, player, game_state)
+        elif action.op == Action.PONG:
             # 碰牌
-            # TODO: 实现碰牌逻辑
-            pass
-        elif action.type == "kong":
+            TurnHandler.handle_pong(action, player, game_state)
+        elif action.op == Action.KONG:
             # 杠牌
-            # TODO: 实现杠牌逻辑
-            pass
-        elif action.type == "hu":
+            TurnHandler.handle_kong(action, player, game_state)
+        elif action.op == Action.HU:
             # 胡牌
             TurnHandler.handle_hu(action, player, game_state)
     
+    @staticmethod
+    def find_chow_partners(player, card):
+        """查找可以与被吃牌组成顺子的两张手牌
+        
+        Args:
+            player: 吃牌的玩家
+            card: 被吃的牌
+        
+        Returns:
+            tuple: 两张搭子的牌编号，无法吃牌时为None
+        """
+        tid = card.tile_id
+        if not 0 <= tid < 27:
+            return None
+        shapes = player.hand.claim_index().chow_shapes[tid]
+        for i, (low, high) in enumerate(CHOW_OFFSETS):
+            if shapes >> i & 1:
+                return tid + low, tid + high
+        return None
+    
+    @staticmethod
+    def handle_chow(action, player, game_state):
+        """处理吃牌
+        
+        Args:
+            action: 吃牌操作（card为被吃的牌，from_player为打出者）
+            player: 吃牌的玩家
+            game_state: 游戏状态实例
+        """
+        if action.cards:
+            partner_ids = [c.tile_id for c in action.cards]
+        else:
+            partner_ids = TurnHandler.find_chow_partners(player, action.card)
+            if partner_ids is None:
+                raise ValueError(f"{player.name}无法吃{action.card}")
+        
+        claimed = DeckManager.take_discard(game_state)
+        cards = [player.hand.take(tid) for tid in partner_ids]
+        cards.append(claimed)
+        cards.sort(key=lambda c: c.tile_id)
+        
+        TurnHandler._add_meld(player, game_state, Meld(Meld.CHOW, cards, action.from_player))
+        TurnHandler._claim_turn(player, game_state, "吃")
+    
+    @staticmethod
+    def handle_pong(action, player, game_state):
+        """处理碰牌
+        
+        Args:
+            action: 碰牌操作（card为被碰的牌，from_player为打出者）
+            player: 碰牌的玩家
+            game_state: 游戏状态实例
+        """
+        tid = action.card.tile_id
+        claimed = DeckManager.take_discard(game_state)
+        cards = [player.hand.take(tid), player.hand.take(tid), claimed]
+        
+        TurnHandler._add_meld(player, game_state, Meld(Meld.PONG, cards, action.from_player))
+        TurnHandler._claim_turn(player, game_state, "碰")
+    
+    @staticmethod
+    def handle_kong(action, player, game_state):
+        """处理杠牌（明杠、暗杠、补杠），杠后从牌墙另一端补牌
+        
+        Args:
+            action: 杠牌操作（明杠时from_player为打出者）
+            player: 杠牌的玩家
+            game_state: 游戏状态实例
+        """
+        tid = action.card.tile_id
+        hand = player.hand
+        
+        if action.from_player is not None:
+            # 明杠：手中有暗刻，杠别人打出的牌；接杠时继承打出者的连杠次数
+            claimed = DeckManager.take_discard(game_state)
+            cards = [hand.take(tid) for _ in range(3)]
+            cards.append(claimed)
+            TurnHandler._add_meld(player, game_state, Meld(Meld.MING_GANG, cards, action.from_player))
+            player.last_action = "明杠"
+            player.consecutive_gang_count = action.from_player.consecutive_gang_count + 1
+            game_state.current_player = player
+        elif hand.counts[tid] == 4:
+            # 暗杠
+            cards = [hand.take(tid) for _ in range(4)]
+            TurnHandler._add_meld(player, game_state, Meld(Meld.AN_GANG, cards))
+            player.last_action = "暗杠"
+            player.consecutive_gang_count += 1
+        else:
+            # 补杠：抓进与碰的明刻相同的牌
+            meld = player.melds.find(Meld.PONG, tid)
+            if meld is None or not hand.counts[tid]:
+                raise ValueError(f"{player.name}无法杠{action.card}")
+            hand.take(tid)
+            player.melds.upgrade(meld, Meld.MING_GANG)
+            player.last_action = "补杠"
+            player.consecutive_gang_count += 1
+        
+        TurnHandler.draw(game_state, player, replacement=True)
+    
+    @staticmethod
+    def _add_meld(player, game_state, meld):
+        """加入面子并更新该玩家的危险度向量"""
+        player.melds.append(meld)
+        game_state.danger_map.on_meld(player, meld)
+    
+    @staticmethod
+    def _claim_turn(player, game_state, last_action):
+        """吃碰后轮到该玩家直接出牌"""
+        player.last_action = last_action
+        player.drawn_card = None
+        game_state.current_player = player
+        game_state.must_discard = True
+        # 被吃碰的牌已在面子中，出牌时不再对它判定吃碰杠胡（与摸牌时相同）
+        game_state.last_discarded_card = None
+    
     @staticmethod
     def switch_player(game_state):
         """切换到下一个玩家
@@ -110,12 +387,25 @@ class TurnHandler:
             player: 胡牌的玩家
             game_state: 游戏状态实例
         """
+        # 将胡的牌加入手牌（点炮时从弃牌堆取走）
+        if action.from_player is not None and action.from_player is not player:
+            player.hand.append(DeckManager.take_discard(game_state))
+        elif action.card is not None:
+            player.hand.append(action.card)
+        
+        TurnHandler._settle_hu(action, player, game_state)
+    
+    @staticmethod
+    def _settle_hu(action, player, game_state):
+        """结束对局并为赢家计分（胡的牌已在手牌中）"""
         # 设置游戏结束
         game_state.game_stage = "ended"
-        game_state.winner = player
+        if game_state.winner is None:
+            game_state.winner = player
+        game_state.winners.append(player)
         
         # 计算分数
-        if action.type == "hu":
+        if action.op == Action.HU:
             score = game_state.rule.calculate_score(player, action.card)
             player.score += score
 
@@ -134,7 +424,7 @@ def init_game(rule_name: str, players_config: list):
     from src.rules.tencent_common.rule import TencentCommonRule
     
     # 1. 创建游戏状态
-    game_state = GameState(rule_name)
+    game_state = GameState(rule_name=rule_name)
     
     # 2. 加载规则
     # TODO: 实现规则加载逻辑，支持根据rule_name动态加载
@@ -153,14 +443,16 @@ def init_game(rule_name: str, players_config: list):
     for i, player in enumerate(game_state.players):
         player.position = positions[i]
         player.is_dealer = (i == 0)  # 第一个玩家为庄家
-        player.previous_player = game_state.players[(i - 1) % len(game_state.players)]
-        player.next_player = game_state.players[(i + 1) % len(game_state.players)]
+    game_state.assign_seats()
     
-    # 5. 洗牌和发牌
+    # 5. 洗牌和发牌，补花
     shuffle_and_deal(game_state)
+    for player in game_state.players:
+        DeckManager.replace_flowers(game_state, player)
     
     # 6. 设置游戏阶段为进行中
     game_state.current_player = game_state.players[0]  # 庄家先出牌
+    game_state.must_discard = rule.dealer_extra_tile  # 庄家已多发一张牌，首轮不摸牌
     game_state.game_stage = "playing"
     
     return game_state
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""预计算查找表
+
+表文件通过显式构建步骤生成（``python -m src.core.tables.builder``），
+运行时按需以内存映射方式加载，未使用查表的模块不会触发加载。
+"""
+from src.core.tables.store import get_table, table_path
+
+__all__ = ['get_table', 'table_path']
@@ -0,0 +1,163 @@
+"""查找表构建工具
+
+用法：
+    python -m src.core.tables.builder [--out PATH] [--verify]
+
+生成的表：
+    suit_hu:  单一花色序数牌计数（5进制编码，9位）-> 面子分解标志
+    honor_hu: 字牌计数（5进制编码，7位）-> 面子分解标志
+
+标志位：bit0 表示可完全分解为面子，bit1 表示可分解为面子+一对将牌。
+"""
+import argparse
+import os
+import struct
+import tempfile
+import zlib
+
+from src.core.tables.store import (ALIGN, ENTRY, FLAG_MELDS, FLAG_MELDS_PAIR, HEADER, MAGIC, VERSION,
+                                   TableStore, table_path)
+
+MAX_MELDS = 4
+
+
+def encode_counts(counts, start: int = 0, length: int = 9) -> int:
+    """将计数数组的一段编码为5进制整数
+
+    Args:
+        counts: 计数数组
+        start: 起始下标
+        length: 长度
+
+    Returns:
+        int: 编码值（低位对应起始下标）
+    """
+    key = 0
+    for i in range(start + length - 1, start - 1, -1):
+        key = key * 5 + counts[i]
+    return key
+
+
+def _build_decomposition_table(length: int, allow_sequences: bool) -> bytearray:
+    """枚举所有可分解的牌型并标记
+
+    Args:
+        length: 牌种数（序数牌9，字牌7）
+        allow_sequences: 是否允许顺子
+
+    Returns:
+        bytearray: 以5进制编码为下标的标志表
+    """
+    table = bytearray(5 ** length)
+    melds = []
+    if allow_sequences:
+        for i in range(length - 2):
+            melds.append((i, i + 1, i + 2))
+    for i in range(length):
+        melds.append((i, i, i))
+
+    counts = [0] * length
+
+    def mark():
+        table[encode_counts(counts, 0, length)] |= FLAG_MELDS
+        for i in range(length):
+            if counts[i] <= 2:
+                counts[i] += 2
+                table[encode_counts(counts, 0, length)] |= FLAG_MELDS_PAIR
+                counts[i] -= 2
+
+    def search(first: int, depth: int):
+        mark()
+        if depth == MAX_MELDS:
+            return
+        for m in range(first, len(melds)):
+            meld = melds[m]
+            for i in meld:
+                counts[i] += 1
+            if all(counts[i] <= 4 for i in meld):
+                search(m, depth + 1)
+            for i in meld:
+                counts[i] -= 1
+
+    search(0, 0)
+    return table
+
+
+def generate_tables() -> dict:
+    """生成所有查找表
+
+    Returns:
+        dict: 表名 -> 表数据
+    """
+    return {
+        'suit_hu': _build_decomposition_table(9, True),
+        'honor_hu': _build_decomposition_table(7, False),
+    }
+
+
+def write_tables(path: str, tables: dict) -> None:
+    """将表写入文件（先写临时文件再原子替换，多进程同时构建也安全）
+
+    Args:
+        path: 输出路径
+        tables: 表名 -> 表数据
+    """
+    names = sorted(tables)
+    offset = HEADER.size + ENTRY.size * len(names)
+    layout = []
+    for name in names:
+        offset = (offset + ALIGN - 1) // ALIGN * ALIGN
+        data = tables[name]
+        layout.append((name, offset, data))
+        offset += len(data)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(names)))
+            for name, offset, data in layout:
+                f.write(ENTRY.pack(name.encode('ascii'), offset, len(data), zlib.crc32(data)))
+            for name, offset, data in layout:
+                f.write(b'\0' * (offset - f.tell()))
+                f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def build_tables(path: str = None) -> str:
+    """构建查找表文件
+
+    Args:
+        path: 输出路径（默认为table_path()）
+
+    Returns:
+        str: 输出路径
+    """
+    path = path or table_path()
+    write_tables(path, generate_tables())
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="构建麻将查找表")
+    parser.add_argument('--out', default=None, help="输出路径（默认为包内路径或MAHJONG_TABLE_PATH）")
+    parser.add_argument('--verify', action='store_true', help="构建后重新加载并校验")
+    args = parser.parse_args(argv)
+
+    path = build_tables(args.out)
+    print(f"查找表已生成: {path} ({os.path.getsize(path)} 字节, 版本{VERSION})")
+
+    if args.verify:
+        store = TableStore(path)
+        for name in store.names():
+            print(f"  {name}: {len(store.get(name))} 字节, 校验通过")
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+"""花色对称的手牌规范化
+
+万、筒、条三种序数牌地位对称：交换花色后，胡牌判定、听牌、向听数以及
+绝大多数番型的结果不变（听牌等与牌编号有关的结果按同一置换变换）。
+将手牌的三种花色按固定顺序重排得到规范形式，以规范形式为缓存键，
+六种花色排列的手牌共用一个缓存项。
+
+置换perm为长度3的元组，perm[s]为原花色s（0万、1筒、2条）在规范形式中
+的位置。字牌和花牌不参与置换。
+
+只对特定花色成立的番型（如绿一色只能由条子组成）不满足对称性，
+计分规则将其标记为SUIT_SPECIFIC_FANS，在原始手牌上判定后并入缓存键。
+"""
+import threading
+from collections import OrderedDict
+
+NUM_SUITS = 3
+SUIT_SIZE = 9
+NUM_SUITED = NUM_SUITS * SUIT_SIZE
+NUM_TILES = 34
+SUIT_MASK = (1 << SUIT_SIZE) - 1
+IDENTITY = (0, 1, 2)
+
+
+def canonical_counts(counts) -> tuple:
+    """只按计数数组规范化（听牌、向听数等只与手牌有关的结果）
+
+    Args:
+        counts: 计数数组（前27种为序数牌，其余原样保留）
+
+    Returns:
+        tuple: (规范计数元组, perm)，规范计数元组可以直接作为计数数组使用
+    """
+    blocks = sorted(((tuple(counts[s * SUIT_SIZE:(s + 1) * SUIT_SIZE]), s) for s in range(NUM_SUITS)),
+                    reverse=True)
+    perm = [0] * NUM_SUITS
+    key = ()
+    for position, (block, suit) in enumerate(blocks):
+        perm[suit] = position
+        key += block
+    return key + tuple(counts[NUM_SUITED:]), tuple(perm)
+
+
+def canonicalize(counts, melds=(), tile: int = -1) -> tuple:
+    """规范化完整的胡牌局面（手牌计数、副露面子和胡的牌）
+
+    Args:
+        counts: 手牌计数数组
+        melds: 副露面子的 (面子类型, 基准牌编号) 序列
+        tile: 胡的牌的编号，-1为不指定
+
+    Returns:
+        tuple: (规范形式, perm)；规范形式可哈希，只用作缓存键
+    """
+    signatures = []
+    honors = []
+    for kind, t in melds:
+        if t >= NUM_SUITED:
+            honors.append((kind, t))
+    for s in range(NUM_SUITS):
+        base = s * SUIT_SIZE
+        signatures.append((
+            tuple(counts[base:base + SUIT_SIZE]),
+            tuple(sorted((kind, t - base) for kind, t in melds if base <= t < base + SUIT_SIZE)),
+            tile - base if base <= tile < base + SUIT_SIZE else -1,
+            s,
+        ))
+    signatures.sort(reverse=True)
+    perm = [0] * NUM_SUITS
+    for position, signature in enumerate(signatures):
+        perm[signature[3]] = position
+    key = (
+        tuple(signature[:3] for signature in signatures),
+        tuple(counts[NUM_SUITED:]),
+        tuple(sorted(honors)),
+        tile if tile >= NUM_SUITED else -1,
+    )
+    return key, tuple(perm)
+
+
+def invert(perm: tuple) -> tuple:
+    """逆置换（规范位置 -> 原花色）"""
+    inverse = [0] * NUM_SUITS
+    for suit, position in enumerate(perm):
+        inverse[position] = suit
+    return tuple(inverse)
+
+
+def to_canonical(tid: int, perm: tuple) -> int:
+    """将原始牌编号映射到规范形式"""
+    if 0 <= tid < NUM_SUITED:
+        return perm[tid // SUIT_SIZE] * SUIT_SIZE + tid % SUIT_SIZE
+    return tid
+
+
+def from_canonical(tid: int, perm: tuple) -> int:
+    """将规范形式中的牌编号映射回原始编号"""
+    if 0 <= tid < NUM_SUITED:
+        return invert(perm)[tid // SUIT_SIZE] * SUIT_SIZE + tid % SUIT_SIZE
+    return tid
+
+
+def mask_from_canonical(mask: int, perm: tuple) -> int:
+    """将规范形式下的牌编号位图（如听牌位图）映射回原始编号"""
+    result = mask >> NUM_SUITED << NUM_SUITED
+    for suit, position in enumerate(perm):
+        result |= (mask >> position * SUIT_SIZE & SUIT_MASK) << suit * SUIT_SIZE
+    return result
+
+
+class SymmetricCache:
+    """以规范形式为键的LRU缓存，记录命中次数
+
+    后台提示线程（HintWorker）与主线程共用规则和模块级缓存，读写都在锁内进行：
+    否则get找到的键可能在move_to_end之前被另一线程的put淘汰（KeyError）。
+    """
+    __slots__ = ('maxsize', 'hits', 'misses', '_data', '_lock')
+
+    def __init__(self, maxsize: int = 1 << 16):
+        """
+        Args:
+            maxsize: 最大缓存项数
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """查找缓存，未命中时返回None"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value) -> None:
+        """写入缓存，超出容量时淘汰最久未使用的项"""
+        with self._lock:
+            data = self._data
+            data[key] = value
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+_waits = SymmetricCache()
+_shanten = SymmetricCache()
+
+
+def waiting_mask(counts, compute) -> int:
+    """查询听牌位图，以规范手牌为键缓存
+
+    Args:
+        counts: 手牌计数数组
+        compute: compute(规范计数元组) -> int 缓存未命中时计算规范手牌的听牌位图
+
+    Returns:
+        int: 原始编号下的听牌位图
+    """
+    key, perm = canonical_counts(counts)
+    mask = _waits.get(key)
+    if mask is None:
+        mask = compute(key)
+        _waits.put(key, mask)
+    return mask if perm == IDENTITY else mask_from_canonical(mask, perm)
+
+
+def shanten(counts, declared: int = 0) -> int:
+    """计算向听数，以规范手牌为键缓存
+
+    Args:
+        counts: 手牌计数数组
+        declared: 已副露的面子数
+
+    Returns:
+        int: 向听数（-1为已胡牌，0为听牌）
+    """
+    key, _ = canonical_counts(counts[:NUM_TILES])
+    key = (key, declared)
+    value = _shanten.get(key)
+    if value is None:
+        from src.core.tables import kernels
+        value = kernels.shanten(kernels.as_counts(key[0]), declared)
+        _shanten.put(key, value)
+    return value
+
+
+def clear_caches() -> None:
+    """清空听牌位图和向听数缓存（基准测试在每轮之间调用，使各轮都从冷缓存开始）"""
+    _waits.clear()
+    _shanten.clear()
+
+
+def cache_stats() -> dict:
+    """各缓存的大小和命中率"""
+    return {name: {'size': len(cache), 'hits': cache.hits, 'misses': cache.misses}
+            for name, cache in (('waiting', _waits), ('shanten', _shanten))}
@@ -0,0 +1,326 @@
+"""手牌分析内核（可选numba加速）
+
+对34种牌的计数数组进行判定，提供：
+
+    is_standard_hu       标准胡牌型（n组面子+一对将牌）
+    is_seven_pairs       七对（七种不同的对子）
+    is_thirteen_orphans  十三幺
+    waiting_mask         听牌位图（第i位表示摸到编号i的牌后胡牌）
+    shanten              向听数（-1为已胡牌，0为听牌）
+
+导入时若安装了numba，这些函数会被编译为机器码，此时计数数组应为
+numpy的int8数组（使用as_counts转换）；未安装时使用纯Python实现，
+直接接受列表，结果完全相同。
+
+除向听数外，两种实现使用同一份源码（编译后的函数可通过py_func属性
+取得纯Python版本），函数体只使用numba支持的语法，不修改传入的数组。
+向听数的递归搜索在纯Python下过慢（清一色手牌需数十毫秒），因此纯Python
+版本改为按花色分组、以剩余牌型为键缓存子问题的搜索，结果与编译版本一致。
+"""
+from functools import lru_cache
+
+try:
+    import numba
+    import numpy as np
+    HAS_NUMBA = True
+except ImportError:
+    numba = None
+    np = None
+    HAS_NUMBA = False
+
+NUM_TILES = 34
+
+# 十三幺所需的幺九牌和字牌
+ORPHANS = (0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33)
+
+
+def _jit(fn):
+    """安装了numba时编译函数，否则原样返回"""
+    if HAS_NUMBA:
+        return numba.njit(cache=True)(fn)
+    return fn
+
+
+def as_counts(counts):
+    """将计数数组转换为内核使用的格式（只取前34种牌的副本）
+
+    Args:
+        counts: 计数数组（列表或Hand.counts）
+
+    Returns:
+        安装numba时为numpy.int8数组，否则为列表
+    """
+    if HAS_NUMBA:
+        return np.asarray(counts[:NUM_TILES], dtype=np.int8)
+    return list(counts[:NUM_TILES])
+
+
+@_jit
+def _is_melds(c, start, length, sequences):
+    """判断一组牌能否完全分解为面子（会修改c）
+
+    从最小的牌开始处理：该牌的数量除以3的余数部分只能组成顺子，
+    其余部分组成刻子（三个相同的顺子等价于三个刻子），因此贪心即可。
+    """
+    for i in range(length):
+        n = c[start + i]
+        if n == 0:
+            continue
+        r = n % 3
+        if r:
+            if not sequences or i + 2 >= length:
+                return False
+            if c[start + i + 1] < r or c[start + i + 2] < r:
+                return False
+            c[start + i + 1] -= r
+            c[start + i + 2] -= r
+        c[start + i] = 0
+    return True
+
+
+@_jit
+def _groups_are_melds(c):
+    """判断各花色能否完全分解为面子（会修改c）"""
+    return (_is_melds(c, 0, 9, True) and _is_melds(c, 9, 9, True)
+            and _is_melds(c, 18, 9, True) and _is_melds(c, 27, 7, False))
+
+
+@_jit
+def is_standard_hu(counts):
+    """判断是否构成标准胡牌型"""
+    total = 0
+    for i in range(NUM_TILES):
+        total += counts[i]
+    if total % 3 != 2:
+        return False
+    for pair in range(NUM_TILES):
+        if counts[pair] < 2:
+            continue
+        c = counts[:NUM_TILES].copy()
+        c[pair] -= 2
+        if _groups_are_melds(c):
+            return True
+    return False
+
+
+@_jit
+def is_seven_pairs(counts):
+    """判断是否构成七对（七种不同的牌各两张）"""
+    pairs = 0
+    for i in range(NUM_TILES):
+        n = counts[i]
+        if n == 2:
+            pairs += 1
+        elif n != 0:
+            return False
+    return pairs == 7
+
+
+@_jit
+def is_thirteen_orphans(counts):
+    """判断是否构成十三幺"""
+    total = 0
+    pair = False
+    for i in range(NUM_TILES):
+        total += counts[i]
+    if total != 14:
+        return False
+    for tid in ORPHANS:
+        n = counts[tid]
+        if n == 0 or n > 2:
+            return False
+        if n == 2:
+            pair = True
+    return pair
+
+
+@_jit
+def waiting_mask(counts, special):
+    """计算听牌位图
+
+    Args:
+        counts: 计数数组（张数除以3余1）
+        special: 是否包含七对和十三幺
+
+    Returns:
+        int: 第i位为1表示摸到编号i的牌后胡牌
+    """
+    mask = 0
+    c = counts[:NUM_TILES].copy()
+    for tid in range(NUM_TILES):
+        if c[tid] >= 4:
+            continue
+        c[tid] += 1
+        if is_standard_hu(c) or (special and (is_seven_pairs(c) or is_thirteen_orphans(c))):
+            mask |= 1 << tid
+        c[tid] -= 1
+    return mask
+
+
+@_jit
+def _standard_shanten(c, i, melds, partials, pair):
+    """递归搜索面子、搭子和将牌的最优组合（会临时修改c，返回前恢复）"""
+    while i < NUM_TILES and c[i] == 0:
+        i += 1
+    if i == NUM_TILES:
+        if melds + partials > 4:
+            partials = 4 - melds
+        return 8 - 2 * melds - partials - pair
+
+    best = 8
+    number = i < 27
+    rank = i % 9
+    # 面子和搭子合计超过4组后，再组搭子不会减少向听数
+    room = melds + partials < 4
+    if c[i] >= 3:
+        c[i] -= 3
+        best = min(best, _standard_shanten(c, i, melds + 1, partials, pair))
+        c[i] += 3
+    if number and rank <= 6 and c[i + 1] and c[i + 2]:
+        c[i] -= 1
+        c[i + 1] -= 1
+        c[i + 2] -= 1
+        best = min(best, _standard_shanten(c, i, melds + 1, partials, pair))
+        c[i] += 1
+        c[i + 1] += 1
+        c[i + 2] += 1
+    if c[i] >= 2:
+        c[i] -= 2
+        if not pair:
+            best = min(best, _standard_shanten(c, i, melds, partials, 1))
+        if room:
+            best = min(best, _standard_shanten(c, i, melds, partials + 1, pair))
+        c[i] += 2
+    if room and number and rank <= 7 and c[i + 1]:
+        c[i] -= 1
+        c[i + 1] -= 1
+        best = min(best, _standard_shanten(c, i, melds, partials + 1, pair))
+        c[i] += 1
+        c[i + 1] += 1
+    if room and number and rank <= 6 and c[i + 2]:
+        c[i] -= 1
+        c[i + 2] -= 1
+        best = min(best, _standard_shanten(c, i, melds, partials + 1, pair))
+        c[i] += 1
+        c[i + 2] += 1
+    # 作为孤张
+    c[i] -= 1
+    best = min(best, _standard_shanten(c, i, melds, partials, pair))
+    c[i] += 1
+    return best
+
+
+@_jit
+def _shanten_kernel(counts, declared):
+    """计算向听数（递归搜索，供numba编译）
+
+    Args:
+        counts: 手中暗牌的计数数组
+        declared: 已副露的面子数（吃、碰、杠）
+
+    Returns:
+        int: 向听数，-1表示已胡牌，0表示听牌
+    """
+    c = counts[:NUM_TILES].copy()
+    best = _standard_shanten(c, 0, declared, 0, 0)
+    if declared == 0:
+        # 七对：六对即听牌，不足七种牌时需要额外换牌
+        pairs = 0
+        kinds = 0
+        orphans = 0
+        orphan_pair = 0
+        for i in range(NUM_TILES):
+            if c[i]:
+                kinds += 1
+                if c[i] >= 2:
+                    pairs += 1
+        seven = 6 - pairs
+        if kinds < 7:
+            seven += 7 - kinds
+        best = min(best, seven)
+        for tid in ORPHANS:
+            if c[tid]:
+                orphans += 1
+                if c[tid] >= 2:
+                    orphan_pair = 1
+        best = min(best, 13 - orphans - orphan_pair)
+    return best
+
+
+@lru_cache(maxsize=1 << 16)
+def _group_options(c: tuple, sequences: bool) -> frozenset:
+    """一组牌（一种花色）可以拆出的 (面子数, 搭子数, 将牌数) 组合
+
+    Args:
+        c: 该组每种牌的数量
+        sequences: 是否可以组成顺子（字牌不能）
+
+    Returns:
+        frozenset: 面子数和搭子数均不超过4
+    """
+    i = 0
+    while i < len(c) and not c[i]:
+        i += 1
+    if i == len(c):
+        return frozenset({(0, 0, 0)})
+
+    options = set()
+
+    def take(offsets, melds, partials, pair):
+        rest = list(c)
+        for k in offsets:
+            rest[i + k] -= 1
+        for m, p, pr in _group_options(tuple(rest), sequences):
+            if pr + pair <= 1:
+                options.add((min(m + melds, 4), min(p + partials, 4), pr + pair))
+
+    seq = sequences and i + 2 < len(c)
+    if c[i] >= 3:
+        take((0, 0, 0), 1, 0, 0)
+    if seq and c[i + 1] and c[i + 2]:
+        take((0, 1, 2), 1, 0, 0)
+    if c[i] >= 2:
+        take((0, 0), 0, 0, 1)
+        take((0, 0), 0, 1, 0)
+    if sequences and i + 1 < len(c) and c[i + 1]:
+        take((0, 1), 0, 1, 0)
+    if seq and c[i + 2]:
+        take((0, 2), 0, 1, 0)
+    take((0,), 0, 0, 0)
+    return frozenset(options)
+
+
+def _shanten_python(counts, declared):
+    """计算向听数（按花色缓存子问题的纯Python实现）"""
+    combined = {(declared, 0, 0)}
+    for start, length in ((0, 9), (9, 9), (18, 9), (27, 7)):
+        group = tuple(counts[start:start + length])
+        if not any(group):
+            continue
+        options = _group_options(group, start < 27)
+        combined = {(min(m1 + m2, 4), min(p1 + p2, 4), pr1 + pr2)
+                    for m1, p1, pr1 in combined
+                    for m2, p2, pr2 in options
+                    if pr1 + pr2 <= 1}
+    best = min(8 - 2 * m - min(p, 4 - m) - pr for m, p, pr in combined)
+
+    if declared == 0:
+        kinds = pairs = 0
+        for n in counts[:NUM_TILES]:
+            if n:
+                kinds += 1
+                if n >= 2:
+                    pairs += 1
+        best = min(best, 6 - pairs + max(0, 7 - kinds))
+        orphans = sum(1 for tid in ORPHANS if counts[tid])
+        orphan_pair = any(counts[tid] >= 2 for tid in ORPHANS)
+        best = min(best, 13 - orphans - orphan_pair)
+    return best
+
+
+# shanten(counts, declared) -> int：向听数，declared为已副露的面子数
+shanten = _shanten_kernel if HAS_NUMBA else _shanten_python
+
+# group_options(c, sequences) -> frozenset：一组牌的 (面子数, 搭子数, 将牌数) 组合（纯Python，带缓存），
+# 供需要逐张增减手牌、只重算一个花色的调用方使用
+group_options = _group_options
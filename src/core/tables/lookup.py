@@ -0,0 +1,38 @@
+"""基于查找表的牌型判定"""
+from src.core.tables.store import FLAG_MELDS, FLAG_MELDS_PAIR, get_table
+
+
+def is_standard_hu(counts) -> bool:
+    """判断计数数组是否构成标准胡牌型（n组面子+一对将牌）
+
+    Args:
+        counts: 长度不小于34的计数数组（只看前34种牌）
+
+    Returns:
+        bool: 是否胡牌（某种牌超过4张或为负数时为False）
+    """
+    suit_table = get_table('suit_hu')
+    pair_found = False
+    for base in (0, 9, 18, 27):
+        length = 9 if base < 27 else 7
+        total = 0
+        key = 0
+        for i in range(base + length - 1, base - 1, -1):
+            c = counts[i]
+            if not 0 <= c <= 4:
+                return False  # 超出表的键范围，也不是合法的手牌
+            total += c
+            key = key * 5 + c
+        if total == 0:
+            continue
+        remainder = total % 3
+        if remainder == 1:
+            return False
+        table = suit_table if base < 27 else get_table('honor_hu')
+        if remainder == 2:
+            if pair_found or not table[key] & FLAG_MELDS_PAIR:
+                return False
+            pair_found = True
+        elif not table[key] & FLAG_MELDS:
+            return False
+    return pair_found
@@ -0,0 +1,165 @@
+"""查找表文件的格式定义与惰性加载
+
+文件格式（小端）：
+
+    头部:   magic(4s) version(H) table_count(H)
+    目录项: name(16s) offset(Q) length(Q) crc32(I)，每张表一项
+    数据:   各表数据块，按8字节对齐
+
+加载时只读取头部和目录，数据部分通过mmap映射，多个模拟进程之间
+通过操作系统页缓存共享同一份物理内存。打开文件时校验各表的crc32，
+文件缺失、版本不符或校验失败时自动重新构建一次。
+"""
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'MJTB'
+VERSION = 1
+HEADER = struct.Struct('<4sHH')
+ENTRY = struct.Struct('<16sQQI')
+ALIGN = 8
+
+# 分解表（suit_hu/honor_hu）的标志位
+FLAG_MELDS = 1        # 可完全分解为面子
+FLAG_MELDS_PAIR = 2   # 可分解为面子+一对将牌
+
+DEFAULT_FILENAME = 'mahjong_tables.bin'
+ENV_PATH = 'MAHJONG_TABLE_PATH'
+
+_lock = threading.Lock()
+_store = None
+
+
+class TableStore:
+    """已映射的表文件"""
+
+    def __init__(self, path: str):
+        """打开并映射表文件
+
+        Args:
+            path: 表文件路径
+
+        Raises:
+            ValueError: 文件格式或版本不匹配（空文件时由mmap抛出）
+            struct.error: 文件被截断，头部或目录不完整
+            OSError: 文件无法读取
+        """
+        self.path = path
+        self._entries = {}
+        self._views = {}
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        try:
+            self._read_directory()
+        except BaseException:
+            # 解析失败时释放映射，调用方可以直接覆盖文件重新构建
+            self.close()
+            raise
+
+    def _read_directory(self):
+        """读取并校验头部和目录"""
+        magic, version, count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"不是有效的查找表文件: {self.path}")
+        if version != VERSION:
+            raise ValueError(f"查找表版本不匹配: 文件为{version}，需要{VERSION}")
+
+        pos = HEADER.size
+        for _ in range(count):
+            name, offset, length, crc = ENTRY.unpack_from(self._mmap, pos)
+            self._entries[name.rstrip(b'\0').decode('ascii')] = (offset, length, crc)
+            pos += ENTRY.size
+
+    def names(self) -> list:
+        """获取文件中包含的表名"""
+        return list(self._entries)
+
+    def get(self, name: str) -> memoryview:
+        """获取表数据（首次访问时校验crc32）
+
+        Args:
+            name: 表名
+
+        Returns:
+            memoryview: 只读的表数据
+
+        Raises:
+            KeyError: 表不存在
+            ValueError: 校验和不匹配
+        """
+        view = self._views.get(name)
+        if view is None:
+            offset, length, crc = self._entries[name]
+            view = self._buffer[offset:offset + length]
+            if zlib.crc32(view) != crc:
+                view.release()
+                raise ValueError(f"查找表{name}校验失败: {self.path}")
+            self._views[name] = view
+        return view
+
+    def close(self):
+        """释放映射"""
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        self._buffer.release()
+        self._mmap.close()
+
+
+def table_path() -> str:
+    """获取表文件路径（可通过环境变量MAHJONG_TABLE_PATH覆盖）"""
+    return os.environ.get(ENV_PATH) or os.path.join(os.path.dirname(os.path.abspath(__file__)), DEFAULT_FILENAME)
+
+
+def _open_store() -> TableStore:
+    """打开表文件，不存在或已失效（格式、版本、校验不符或文件被截断）时构建一次"""
+    path = table_path()
+    if os.path.exists(path):
+        store = None
+        try:
+            store = TableStore(path)
+            for name in store.names():
+                store.get(name)
+            return store
+        except (ValueError, struct.error, OSError) as e:
+            if store is not None:
+                store.close()
+            logger.warning("查找表不可用，重新构建: %s", e)
+
+    from src.core.tables.builder import build_tables
+    logger.warning("正在构建查找表: %s（可预先运行 python -m src.core.tables.builder）", path)
+    build_tables(path)
+    return TableStore(path)
+
+
+def get_table(name: str) -> memoryview:
+    """获取指定的查找表（惰性加载）
+
+    Args:
+        name: 表名
+
+    Returns:
+        memoryview: 只读的表数据
+    """
+    global _store
+    if _store is None:
+        with _lock:
+            if _store is None:
+                _store = _open_store()
+    return _store.get(name)
+
+
+def reset():
+    """关闭已加载的表文件，下次访问时重新加载（主要用于测试）"""
+    global _store
+    with _lock:
+        if _store is not None:
+            _store.close()
+            _store = None
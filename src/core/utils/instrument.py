@@ -0,0 +1,166 @@
+"""热点路径埋点
+
+按调用位置统计调用次数、累计耗时和耗时直方图，可随时读取快照，
+也可以由后台线程定期输出。
+
+是否启用由环境变量MAHJONG_INSTRUMENT在导入时决定。未启用时
+instrumented装饰器直接返回原函数，被装饰的函数没有任何额外开销，
+因此埋点可以保留在正式版本中：
+
+    MAHJONG_INSTRUMENT=1 python cli_main.py
+
+启用后在进程退出时向标准错误输出一次快照；设置MAHJONG_INSTRUMENT_INTERVAL
+（秒）时还会定期输出。
+
+直方图按耗时（微秒）的二进制位数分桶：第k个桶统计耗时在
+[2^(k-1), 2^k) 微秒内的调用，第0个桶为不足1微秒的调用。
+"""
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+
+ENV_FLAG = 'MAHJONG_INSTRUMENT'
+ENABLED = os.environ.get(ENV_FLAG, '') not in ('', '0')
+ENV_INTERVAL = 'MAHJONG_INSTRUMENT_INTERVAL'
+
+HISTOGRAM_BUCKETS = 24
+
+_stats = {}
+
+
+class SiteStats:
+    """单个调用位置的统计数据"""
+    __slots__ = ('calls', 'total_ns', 'max_ns', 'histogram')
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def record(self, elapsed_ns: int) -> None:
+        """记录一次调用"""
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        bucket = (elapsed_ns // 1000).bit_length()
+        self.histogram[min(bucket, HISTOGRAM_BUCKETS - 1)] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            'calls': self.calls,
+            'total_ms': round(self.total_ns / 1e6, 3),
+            'mean_us': round(self.total_ns / self.calls / 1e3, 2) if self.calls else 0.0,
+            'max_us': round(self.max_ns / 1e3, 2),
+            'histogram': list(self.histogram),
+        }
+
+
+def site_name(fn) -> str:
+    """获取函数的调用位置名称（模块名.限定名）"""
+    return f"{fn.__module__}.{fn.__qualname__}"
+
+
+def wrap(fn, site: str = None):
+    """包装函数，统计其调用（不受ENABLED影响）
+
+    Args:
+        fn: 被包装的函数
+        site: 调用位置名称，默认为模块名.限定名
+
+    Returns:
+        function: 包装后的函数
+    """
+    stats = _stats.setdefault(site or site_name(fn), SiteStats())
+    perf = time.perf_counter_ns
+
+    def instrumented_call(*args, **kwargs):
+        start = perf()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            stats.record(perf() - start)
+
+    instrumented_call.__wrapped__ = fn
+    instrumented_call.__name__ = fn.__name__
+    instrumented_call.__qualname__ = fn.__qualname__
+    instrumented_call.__doc__ = fn.__doc__
+    return instrumented_call
+
+
+def instrumented(fn=None, *, site: str = None):
+    """埋点装饰器，未启用时原样返回被装饰的函数
+
+    可以直接使用 @instrumented，也可以指定名称 @instrumented(site="...")。
+    """
+    if fn is None:
+        return lambda f: instrumented(f, site=site)
+    if not ENABLED:
+        return fn
+    return wrap(fn, site)
+
+
+def snapshot() -> dict:
+    """获取当前统计数据的快照
+
+    Returns:
+        dict: 调用位置 -> 统计数据，未被调用过的位置不包含在内
+    """
+    return {site: stats.to_dict() for site, stats in sorted(_stats.items()) if stats.calls}
+
+
+def reset() -> None:
+    """清空统计数据（保留已注册的调用位置）"""
+    for stats in _stats.values():
+        stats.__init__()
+
+
+def dump(stream=None) -> None:
+    """以JSON格式输出统计快照
+
+    Args:
+        stream: 输出流，默认为标准错误
+    """
+    stream = stream or sys.stderr
+    stream.write(json.dumps(snapshot(), ensure_ascii=False) + '\n')
+    stream.flush()
+
+
+class PeriodicDumper:
+    """后台线程，定期输出统计快照"""
+
+    def __init__(self, interval: float, stream=None):
+        """
+        Args:
+            interval: 输出间隔（秒）
+            stream: 输出流，默认为标准错误
+        """
+        self.interval = interval
+        self.stream = stream
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='instrument-dump', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            dump(self.stream)
+
+    def start(self) -> 'PeriodicDumper':
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止输出，并输出最后一次快照"""
+        self._stop.set()
+        self._thread.join()
+        dump(self.stream)
+
+
+if ENABLED:
+    if os.environ.get(ENV_INTERVAL):
+        atexit.register(PeriodicDumper(float(os.environ[ENV_INTERVAL])).start().stop)
+    else:
+        atexit.register(dump)
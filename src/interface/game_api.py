@@ -0,0 +1,71 @@
+"""本地玩家的命令行输入
+
+TurnHandler.decide / decide_claim 对非AI玩家调用这里的函数，在终端中询问
+本地玩家的操作。回复的校验与异步桌台服务共用（table_host.parse_reply），
+输入结束（EOF）时使用同样的默认决策（打出刚摸到的牌 / 不响应）。
+"""
+from src.core.data.action import Action
+from src.core.data.decision import DecisionRequest
+from src.interface.table_host import default_reply, parse_reply
+
+CLAIM_LABELS = {'hu': '胡', 'kong': '杠', 'pong': '碰', 'chow': '吃'}
+
+
+def get_player_input(player, game_state, valid_actions, read=None):
+    """询问本地玩家回合内的操作
+
+    输入手牌序号打出该牌；可以杠时输入 "g 序号" 暗杠或补杠该牌。
+
+    Args:
+        player: 当前玩家
+        game_state: 游戏状态实例
+        valid_actions: 有效操作码列表
+        read: 读取一行输入的函数，None为input
+
+    Returns:
+        Action: 玩家选择的操作
+    """
+    read = read or input
+    request = DecisionRequest(DecisionRequest.ACTION, player, list(valid_actions or ()))
+    cards = list(player.hand)
+    print("手牌: " + ", ".join(f"{i}.{card.get_display_name()}" for i, card in enumerate(cards)))
+    can_kong = Action.KONG in request.valid_actions
+    prompt = "请输入要打出的牌的序号" + ("（杠牌输入 g 序号）" if can_kong else "") + ": "
+    while True:
+        try:
+            text = read(prompt).strip()
+        except EOFError:
+            return default_reply(request)
+        op = Action.DISCARD
+        if can_kong and text[:1].lower() == 'g':
+            op, text = Action.KONG, text[1:].strip()
+        if text.isdigit() and int(text) < len(cards):
+            action = parse_reply(request, {'op': op, 'tile': cards[int(text)].tile_id})
+            if action is not None:
+                return action
+        print("输入无效，请重新输入")
+
+
+def get_claim_input(player, game_state, claim_type, card, read=None) -> bool:
+    """询问本地玩家是否响应别人打出的牌
+
+    Args:
+        player: 可以响应的玩家
+        game_state: 游戏状态实例
+        claim_type: 响应类型（hu/kong/pong/chow）
+        card: 打出的牌
+        read: 读取一行输入的函数，None为input
+
+    Returns:
+        bool: 是否响应
+    """
+    read = read or input
+    prompt = f"是否{CLAIM_LABELS.get(claim_type, claim_type)}{card.get_display_name()}？(y/n): "
+    while True:
+        try:
+            text = read(prompt).strip().lower()
+        except EOFError:
+            return False
+        if text in ('y', 'n'):
+            return text == 'y'
+        print("输入无效，请输入 y 或 n")
@@ -0,0 +1,212 @@
+"""异步桌台服务：一个进程内同时运行多张桌台
+
+每张桌台是一个协程，按TurnHandler.turn_steps驱动回合：
+- AI玩家的决策默认在事件循环内直接计算；offload(request)为真时交给
+  执行器（线程池或进程池）计算，避免耗时的决策阻塞其他桌台
+- 人类玩家的决策通过Transport发给客户端并等待回复
+- 每次决策都有超时（move_timeout），超时、回复无效或连接出错时使用默认操作
+  （打出刚摸到的牌 / 不响应），对局继续；交给执行器的决策在局面副本上计算，
+  超时后仍在运行的任务不会修改实际对局
+
+用法：
+    host = TableHost(transport, move_timeout=15)
+    await host.run(game_states, concurrency=1000)
+    print(host.metrics())
+"""
+import asyncio
+import functools
+import time
+
+from src.core.data.action import Action
+from src.core.data.decision import DecisionRequest
+from src.core.data.meld import MeldType
+from src.core.logic.turn_handler import TurnHandler
+
+
+def default_reply(request):
+    """超时或回复无效时的默认决策
+
+    Args:
+        request: DecisionRequest
+
+    Returns:
+        CLAIM为False；ACTION为打出刚摸到的牌（已不在手牌中时打出最后一张）
+    """
+    if request.kind == DecisionRequest.CLAIM:
+        return False
+    player = request.player
+    card = player.drawn_card
+    if card is None or card not in player.hand:
+        card = player.hand[-1]
+    return Action(Action.DISCARD, card)
+
+
+def parse_reply(request, reply):
+    """将客户端回复转换为决策
+
+    Args:
+        request: DecisionRequest
+        reply: 回复消息 {"claim": bool} 或 {"op": 操作码, "tile": 牌编号}
+
+    Returns:
+        决策结果；回复无效时返回None
+    """
+    if not isinstance(reply, dict):
+        return None
+    if request.kind == DecisionRequest.CLAIM:
+        claim = reply.get('claim')
+        return claim if isinstance(claim, bool) else None
+
+    player = request.player
+    op = reply.get('op')
+    tile = reply.get('tile')
+    if not isinstance(tile, int) or not 0 <= tile < len(player.hand.counts) or not player.hand.counts[tile]:
+        return None
+    card = next(c for c in reversed(player.hand) if c.tile_id == tile)
+    if op == Action.DISCARD:
+        return Action(Action.DISCARD, card)
+    if op == Action.KONG:
+        # 暗杠需要四张，补杠需要已碰出的刻子
+        if player.hand.counts[tile] == 4 or player.melds.find(MeldType.PONG, tile) is not None:
+            return Action(Action.KONG, card)
+    return None
+
+
+class TableHost:
+    """异步桌台服务"""
+
+    def __init__(self, transport=None, move_timeout: float = 30.0, executor=None, offload=None):
+        """
+        Args:
+            transport: 人类玩家的传输层（Transport），全部为AI时可为None
+            move_timeout: 每次决策的超时秒数
+            executor: AI决策卸载使用的执行器，None为事件循环的默认线程池
+            offload: offload(request) -> bool 判断AI决策是否交给执行器，None为全部直接计算
+        """
+        self.transport = transport
+        self.move_timeout = move_timeout
+        self.executor = executor
+        self.offload = offload
+        self.tables = 0
+        self.moves = 0
+        self.timeouts = 0
+        self.invalid = 0
+        self.errors = 0
+        self.latencies = []
+        self.elapsed = 0.0
+
+    async def run(self, game_states, concurrency: int = None) -> list:
+        """同时运行多张桌台直到全部结束
+
+        Args:
+            game_states: 已初始化的游戏状态列表
+            concurrency: 同时进行的桌台数上限，None为不限制
+
+        Returns:
+            list: 各桌台的游戏状态
+        """
+        start = time.perf_counter()
+        if concurrency:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def limited(table_id, state):
+                async with semaphore:
+                    return await self.run_table(table_id, state)
+            tasks = [limited(i, state) for i, state in enumerate(game_states)]
+        else:
+            tasks = [self.run_table(i, state) for i, state in enumerate(game_states)]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+    async def run_table(self, table_id, game_state):
+        """运行一张桌台直到对局结束
+
+        Args:
+            table_id: 桌号（发给客户端用于区分桌台）
+            game_state: 已初始化的游戏状态
+
+        Returns:
+            游戏状态
+        """
+        while game_state.game_stage == "playing":
+            steps = TurnHandler.turn_steps(game_state)
+            try:
+                request = next(steps)
+                while True:
+                    request = steps.send(await self._decide(table_id, request, game_state))
+            except StopIteration:
+                pass
+            # 每回合让出一次事件循环，AI对AI的桌台也不会独占
+            await asyncio.sleep(0)
+        self.tables += 1
+        return game_state
+
+    async def _decide(self, table_id, request, game_state):
+        """获取一次决策，统计耗时，超时、回复无效或连接出错时使用默认决策"""
+        start = time.perf_counter()
+        try:
+            if request.player.is_ai:
+                result = await self._decide_ai(request, game_state)
+            else:
+                reply = await asyncio.wait_for(
+                    self.transport.request(table_id, request), self.move_timeout)
+                result = parse_reply(request, reply)
+                if result is None:
+                    self.invalid += 1
+                    result = default_reply(request)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            result = default_reply(request)
+        except OSError:
+            # 连接断开等传输层错误只影响这一次决策，不中断其他桌台
+            self.errors += 1
+            result = default_reply(request)
+        self.moves += 1
+        self.latencies.append(time.perf_counter() - start)
+        return result
+
+    async def _decide_ai(self, request, game_state):
+        """AI决策：直接计算或交给执行器
+
+        交给执行器时在局面副本上计算：wait_for超时后执行器中的任务无法取消，
+        仍在运行的任务只会修改副本，实际对局按默认决策继续。
+        """
+        if self.offload is None or not self.offload(request):
+            return TurnHandler.answer(request, game_state)
+        snapshot = game_state.clone()
+        player = snapshot.players[game_state.players.index(request.player)]
+        valid_actions = list(request.valid_actions) if request.valid_actions is not None else None
+        job = DecisionRequest(request.kind, player, valid_actions, request.claim_type, request.card)
+        loop = asyncio.get_running_loop()
+        call = functools.partial(TurnHandler.answer, job, snapshot)
+        return await asyncio.wait_for(loop.run_in_executor(self.executor, call), self.move_timeout)
+
+    def metrics(self) -> dict:
+        """吞吐量和决策延迟统计
+
+        Returns:
+            dict: 桌台数、决策数、超时数、无效回复数、连接错误数、耗时、每秒决策数、
+                  每秒桌台数、决策延迟p50/p99（毫秒）
+        """
+        latencies = sorted(self.latencies)
+        elapsed = self.elapsed or 1e-9
+
+        def percentile(q):
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 3)
+
+        return {
+            'tables': self.tables,
+            'moves': self.moves,
+            'timeouts': self.timeouts,
+            'invalid': self.invalid,
+            'errors': self.errors,
+            'elapsed': round(self.elapsed, 3),
+            'moves_per_sec': round(self.moves / elapsed, 1),
+            'tables_per_sec': round(self.tables / elapsed, 2),
+            'p50_ms': percentile(0.50),
+            'p99_ms': percentile(0.99),
+        }
@@ -0,0 +1,166 @@
+"""桌台服务与人类玩家之间的传输层
+
+TableHost需要人类玩家决策时调用Transport.request，等待玩家的回复。
+StreamTransport在一条asyncio流连接上以JSON行传输，用请求编号区分
+同时进行的多张桌台；本地测试可以用local_socket_pair得到一对相连的
+socket，另一端由run_scripted_client按给定规则自动回复。
+
+请求消息：
+    {"id": 1, "table": 桌号, "seat": 座位, "kind": "action",
+     "valid": [操作码...], "hand": [牌编号...], "drawn": 牌编号}
+    {"id": 2, "table": 桌号, "seat": 座位, "kind": "claim",
+     "claim": "pong", "tile": 牌编号}
+
+回复消息：
+    {"id": 1, "op": 操作码, "tile": 牌编号}
+    {"id": 2, "claim": true}
+"""
+import asyncio
+import itertools
+import json
+import socket
+
+from src.core.data.decision import DecisionRequest
+
+
+def encode_request(table_id, request) -> dict:
+    """将决策请求编码为消息（立即复制手牌和有效操作，之后不再引用请求中的缓冲区）"""
+    player = request.player
+    message = {'table': table_id, 'seat': player.seat}
+    if request.kind == DecisionRequest.CLAIM:
+        message['kind'] = 'claim'
+        message['claim'] = request.claim_type
+        message['tile'] = request.card.tile_id
+    else:
+        message['kind'] = 'action'
+        message['valid'] = list(request.valid_actions or ())
+        message['hand'] = [card.tile_id for card in player.hand]
+        drawn = player.drawn_card
+        message['drawn'] = drawn.tile_id if drawn is not None else -1
+    return message
+
+
+class Transport:
+    """传输层接口"""
+
+    async def request(self, table_id, request) -> dict:
+        """发送决策请求并等待回复
+
+        Args:
+            table_id: 桌号
+            request: DecisionRequest
+
+        Returns:
+            dict: 回复消息
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """关闭连接"""
+
+
+class StreamTransport(Transport):
+    """基于asyncio流的JSON行传输，多张桌台共用一条连接"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._reader_task = None
+
+    def _ensure_reader(self):
+        """启动读取回复的任务；任务已结束（连接关闭或读取出错）时抛出ConnectionError"""
+        if self._reader_task is None:
+            self._reader_task = asyncio.ensure_future(self._read_replies())
+        elif self._reader_task.done():
+            raise ConnectionError("连接已关闭")
+
+    async def _read_replies(self):
+        """读取回复并交给等待中的请求（超时后才到达的回复、无法解析的行被丢弃）"""
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                try:
+                    reply = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(reply, dict):
+                    continue
+                future = self._pending.pop(reply.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(reply)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("连接已关闭"))
+            self._pending.clear()
+
+    async def request(self, table_id, request) -> dict:
+        self._ensure_reader()
+        message = encode_request(table_id, request)
+        message['id'] = request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self.writer.write(json.dumps(message).encode() + b'\n')
+            await self.writer.drain()
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+        self.writer.close()
+
+
+async def local_socket_pair():
+    """创建一对相连的本地socket流
+
+    Returns:
+        tuple: (StreamTransport, 客户端reader, 客户端writer)
+    """
+    server_sock, client_sock = socket.socketpair()
+    server_reader, server_writer = await asyncio.open_connection(sock=server_sock)
+    client_reader, client_writer = await asyncio.open_connection(sock=client_sock)
+    return StreamTransport(server_reader, server_writer), client_reader, client_writer
+
+
+async def run_scripted_client(reader, writer, respond, delay: float = 0.0) -> int:
+    """按规则自动回复请求的客户端（测试和压测用的人类玩家替身）
+
+    Args:
+        reader: 客户端reader
+        writer: 客户端writer
+        respond: respond(message) -> dict 生成回复内容，返回None时不回复
+        delay: 每次回复前等待的秒数（模拟思考时间）
+
+    Returns:
+        int: 回复的消息数
+    """
+    replies = 0
+    while True:
+        line = await reader.readline()
+        if not line:
+            return replies
+        message = json.loads(line)
+        reply = respond(message)
+        if reply is None:
+            continue
+        if delay:
+            await asyncio.sleep(delay)
+        reply['id'] = message['id']
+        writer.write(json.dumps(reply).encode() + b'\n')
+        await writer.drain()
+        replies += 1
+
+
+def tsumogiri(message) -> dict:
+    """最简单的回复规则：打出刚摸到的牌（没有时打出最后一张），不响应"""
+    if message['kind'] == 'claim':
+        return {'claim': False}
+    tile = message['drawn'] if message['drawn'] >= 0 else message['hand'][-1]
+    return {'op': 1, 'tile': tile}
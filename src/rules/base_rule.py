@@ -12,6 +12,7 @@ class BaseRule:
         self.allow_kong = True
         self.allow_self_hu = True
         self.allow_other_hu = True
+        self.multiple_hu_policy = "first"  # 多人胡同一张牌：first截胡，all一炮多响
     
     def can_chow(self, player: 'Player', card: 'Card', from_player) -> bool:
         """判断是否可以吃牌"""
@@ -39,4 +40,12 @@ class BaseRule:
     
     def create_initial_deck(self) -> list:
         """创建初始牌组"""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+    
+    def initial_tile_ids(self) -> bytes:
+        """初始牌组的牌编号序列（由create_initial_deck得到，只计算一次）"""
+        tiles = getattr(self, '_initial_tile_ids', None)
+        if tiles is None:
+            tiles = bytes(card.tile_id for card in self.create_initial_deck())
+            self._initial_tile_ids = tiles
+        return tiles
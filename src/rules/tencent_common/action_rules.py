@@ -1,41 +1,31 @@
+from src.core.data.action import Action
+from src.core.data.tile import FLOWER_BASE, NUM_ALL_TILE_TYPES
+
 class TencentActionRules:
     """腾讯大众麻将动作规则"""
     
     def __init__(self, rule):
         self.rule = rule
+        self._valid_actions = []  # get_valid_actions复用的结果缓冲区
     
     def can_chow(self, player, card, from_player) -> bool:
         """判断是否可以吃牌
         
         条件：
         1. 必须是上家打出的牌
-        2. 只能吃同种花色的牌
-        3. 必须是连续的三张牌
+        2. 只能吃序数牌
+        3. 手中有能与该牌组成顺子的两张牌
         """
         # 检查是否是上家
-        if player.next_player != from_player:
+        if player.previous_player is not from_player:
             return False
         
-        # 检查花色是否相同（只能吃序数牌）
-        if card.suit not in ['万', '筒', '条'] or any(c.suit != card.suit for c in player.hand):
+        tid = card.tile_id
+        if not 0 <= tid < 27:
             return False
         
-        # 检查是否能组成顺子
-        current_rank = int(card.rank)
-        needed_combinations = [
-            {str(current_rank - 2), str(current_rank - 1)},  # 吃前两张
-            {str(current_rank - 1), str(current_rank + 1)},  # 吃中间
-            {str(current_rank + 1), str(current_rank + 2)}   # 吃后两张
-        ]
-        
-        # 检查手牌中是否有对应的组合
-        hand_ranks = {c.rank for c in player.hand if c.suit == card.suit}
-        
-        for combo in needed_combinations:
-            if combo.issubset(hand_ranks):
-                return True
-        
-        return False
+        # 查询手牌维护的可吃位图
+        return bool(player.hand.claim_index().chow >> tid & 1)
     
     def can_pong(self, player, card, from_player) -> bool:
         """判断是否可以碰牌
@@ -43,9 +33,10 @@ class TencentActionRules:
         条件：
         1. 手牌中有至少两张相同的牌
         """
-        # 检查手牌中是否有至少两张相同的牌
-        count = sum(1 for c in player.hand if c == card)
-        return count >= 2
+        tid = card.tile_id
+        if tid < 0:
+            return False
+        return bool(player.hand.claim_index().pong >> tid & 1)
     
     def can_kong(self, player, card, from_player) -> bool:
         """判断是否可以杠牌
@@ -54,17 +45,16 @@ class TencentActionRules:
         1. 手牌中有三张相同的牌（明杠）
         2. 或者手牌中有四张相同的牌（暗杠）
         """
-        count = sum(1 for c in player.hand if c == card)
+        tid = card.tile_id
+        if tid < 0:
+            return False
         
         # 明杠：手牌中有三张，别人打出一张
-        if from_player is not None and count == 3:
-            return True
+        if from_player is not None:
+            return bool(player.hand.claim_index().kong >> tid & 1)
         
         # 暗杠：手牌中有四张
-        if from_player is None and count == 4:
-            return True
-        
-        return False
+        return player.hand.counts[tid] == 4
     
     def can_flower(self, player) -> bool:
         """判断是否可以补花
@@ -72,18 +62,25 @@ class TencentActionRules:
         条件：
         1. 手牌中有花牌
         """
-        return any(card.suit == '花' for card in player.hand)
+        return any(player.hand.counts[FLOWER_BASE:NUM_ALL_TILE_TYPES])
     
     def get_valid_actions(self, player, game_state) -> list:
-        """获取当前玩家的有效操作"""
-        valid_actions = []
+        """获取当前玩家的有效操作
+        
+        Returns:
+            list: 操作码列表（Action.DISCARD等）。返回的是复用的缓冲区，
+                  下次调用时会被覆盖，需要保留时请复制
+        """
+        valid_actions = self._valid_actions
+        valid_actions.clear()
+        rule = self.rule
         
         # 检查是否可以补花
         if self.can_flower(player):
-            valid_actions.append("flower")
+            valid_actions.append(Action.FLOWER)
         
         # 摸牌后的基本操作：胡（如果可以）或打牌
-        valid_actions.append("discard")
+        valid_actions.append(Action.DISCARD)
         
         # 如果有上一张打出的牌，检查是否可以吃碰杠胡
         if game_state.last_discarded_card:
@@ -91,29 +88,24 @@ class TencentActionRules:
             last_player = game_state.last_discarded_card.from_player
             
             # 检查是否可以吃牌
-            if self.rule.allow_chow and self.can_chow(player, last_card, last_player):
-                valid_actions.append("chow")
+            if rule.allow_chow and self.can_chow(player, last_card, last_player):
+                valid_actions.append(Action.CHOW)
             
             # 检查是否可以碰牌
-            if self.rule.allow_pong and self.can_pong(player, last_card, last_player):
-                valid_actions.append("pong")
+            if rule.allow_pong and self.can_pong(player, last_card, last_player):
+                valid_actions.append(Action.PONG)
             
             # 检查是否可以杠牌
-            if self.rule.allow_kong and self.can_kong(player, last_card, last_player):
-                valid_actions.append("kong")
+            if rule.allow_kong and self.can_kong(player, last_card, last_player):
+                valid_actions.append(Action.KONG)
             
             # 检查是否可以胡牌（点炮）
-            if self.rule.allow_other_hu:
-                from src.rules.tencent_common.hu_rules import TencentHuRules
-                hu_rules = TencentHuRules(self.rule)
-                if hu_rules.can_hu(player, last_card):
-                    valid_actions.append("hu")
+            if rule.allow_other_hu and rule.hu_rules.can_hu(player, last_card):
+                valid_actions.append(Action.HU)
         
         # 检查是否可以自摸胡牌（如果当前是摸牌阶段）
-        if player.drawn_card and self.rule.allow_self_hu:
-            from src.rules.tencent_common.hu_rules import TencentHuRules
-            hu_rules = TencentHuRules(self.rule)
-            if hu_rules.can_hu(player, player.drawn_card):
-                valid_actions.append("hu")
+        if player.drawn_card and rule.allow_self_hu:
+            if rule.hu_rules.can_hu(player, player.drawn_card):
+                valid_actions.append(Action.HU)
         
-        return valid_actions
\ No newline at end of file
+        return valid_actions
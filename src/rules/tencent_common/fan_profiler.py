@@ -0,0 +1,140 @@
+"""番型判定函数的性能剖析
+
+在TencentScoreRules实例上临时替换所有_is_*判定函数，统计每个判定的
+调用次数、累计耗时和命中率（返回真值的比例），用于找出最耗时、
+最少命中的判定，决定优化和调整检查顺序的方向。
+
+耗时为包含子调用的时间：一个判定内部调用其他判定时，被调用者的
+耗时同时计入双方。
+
+    with rule.score_rules.profile() as profiler:
+        ...  # 运行模拟
+    profiler.print_report()
+"""
+import sys
+import time
+
+
+class PredicateStats:
+    """单个判定函数的统计数据"""
+    __slots__ = ('calls', 'hits', 'total_ns')
+
+    def __init__(self):
+        self.calls = 0
+        self.hits = 0
+        self.total_ns = 0
+
+
+class FanProfiler:
+    """番型判定剖析器"""
+
+    PREFIX = '_is_'
+
+    def __init__(self, score_rules):
+        """
+        Args:
+            score_rules: 要剖析的TencentScoreRules实例
+        """
+        self.score_rules = score_rules
+        self.stats = {}
+        self._installed = []
+        self._cache = None
+
+    def predicates(self) -> list:
+        """获取计分规则中所有判定函数的名称"""
+        cls = type(self.score_rules)
+        return sorted(name for name in dir(cls)
+                      if name.startswith(self.PREFIX) and callable(getattr(cls, name)))
+
+    def install(self) -> 'FanProfiler':
+        """在实例上安装计时包装（实例属性覆盖类方法）"""
+        if self._installed:
+            return self
+        # 剖析期间关闭番数缓存，使每次计分都实际调用各判定函数
+        self._cache = self.score_rules.fan_cache
+        self.score_rules.fan_cache = None
+        for name in self.predicates():
+            stats = self.stats.setdefault(name, PredicateStats())
+            setattr(self.score_rules, name, self._wrap(getattr(self.score_rules, name), stats))
+            self._installed.append(name)
+        return self
+
+    def uninstall(self) -> None:
+        """移除计时包装，恢复类方法"""
+        if not self._installed:
+            return
+        for name in self._installed:
+            delattr(self.score_rules, name)
+        self._installed = []
+        self.score_rules.fan_cache = self._cache
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
+
+    @staticmethod
+    def _wrap(method, stats):
+        perf = time.perf_counter_ns
+
+        def profiled(*args, **kwargs):
+            start = perf()
+            result = method(*args, **kwargs)
+            stats.total_ns += perf() - start
+            stats.calls += 1
+            if result:
+                stats.hits += 1
+            return result
+
+        return profiled
+
+    def reset(self) -> None:
+        """清空统计数据"""
+        for stats in self.stats.values():
+            stats.__init__()
+
+    def report(self, sort_by: str = 'total') -> list:
+        """生成排序后的统计表
+
+        Args:
+            sort_by: 排序依据，'total'为累计耗时，'calls'为调用次数，'hit_rate'为命中率（升序）
+
+        Returns:
+            list: 每行为dict（predicate, calls, hits, hit_rate, total_ms, mean_us）
+        """
+        rows = []
+        for name, stats in self.stats.items():
+            if not stats.calls:
+                continue
+            rows.append({
+                'predicate': name,
+                'calls': stats.calls,
+                'hits': stats.hits,
+                'hit_rate': stats.hits / stats.calls,
+                'total_ms': stats.total_ns / 1e6,
+                'mean_us': stats.total_ns / stats.calls / 1e3,
+            })
+        if sort_by == 'hit_rate':
+            rows.sort(key=lambda row: (row['hit_rate'], -row['total_ms']))
+        elif sort_by == 'calls':
+            rows.sort(key=lambda row: -row['calls'])
+        else:
+            rows.sort(key=lambda row: -row['total_ms'])
+        return rows
+
+    def print_report(self, sort_by: str = 'total', limit: int = None, stream=None) -> None:
+        """打印排序后的统计表
+
+        Args:
+            sort_by: 排序依据，同report
+            limit: 最多打印的行数
+            stream: 输出流，默认为标准输出
+        """
+        stream = stream or sys.stdout
+        rows = self.report(sort_by)
+        total_ms = sum(row['total_ms'] for row in rows) or 1.0
+        stream.write(f"{'排名':<6}{'判定':<32}{'调用次数':>10}{'命中率':>9}{'累计(ms)':>11}{'平均(us)':>10}{'占比':>8}\n")
+        for rank, row in enumerate(rows[:limit], 1):
+            stream.write(f"{rank:<6}{row['predicate']:<32}{row['calls']:>10}{row['hit_rate']:>9.1%}"
+                         f"{row['total_ms']:>11.2f}{row['mean_us']:>10.2f}{row['total_ms'] / total_ms:>8.1%}\n")
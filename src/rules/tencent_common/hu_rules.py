@@ -1,9 +1,12 @@
+from src.core.utils.instrument import instrumented
+
 class TencentHuRules:
     """腾讯大众麻将胡牌规则"""
     
     def __init__(self, rule):
         self.rule = rule
     
+    @instrumented
     def can_hu(self, player, card) -> bool:
         """判断是否可以胡牌
         
@@ -94,20 +97,15 @@ class TencentHuRules:
         """检查是否有其他番型"""
         # 这里需要调用计分规则中的番数计算逻辑
         # 暂时实现一些基本番型检查
-        from src.rules.tencent_common.score_rules import TencentScoreRules
-        score_rules = TencentScoreRules(self.rule)
-        return score_rules._calculate_fans(player, card) > 0
+        return self.rule.score_rules._calculate_fans(player, card) > 0
     
     def _is_ji_hu(self, player, card) -> bool:
         """判断是否是鸡胡
         
         鸡胡：没有特殊番型，只有基本番数的胡牌
         """
-        from src.rules.tencent_common.score_rules import TencentScoreRules
-        score_rules = TencentScoreRules(self.rule)
-        
         # 计算番数
-        fans = score_rules._calculate_fans(player, card)
+        fans = self.rule.score_rules._calculate_fans(player, card)
         
         # 鸡胡的情况：
         # 1. 如果是自摸，番数为1（只有自摸的1番）
@@ -118,26 +116,20 @@ class TencentHuRules:
             return fans == 0
     
     def _check_basic_hu_condition(self, player, card) -> bool:
-        """检查基本胡牌条件：将牌+四组面子"""
-        # 临时组合手牌用于检查
-        temp_hand = player.hand.copy()
-        temp_hand.append(card)
-        
-        # 按照花色和点数排序，便于检查
-        sorted_hand = self._sort_hand(temp_hand)
-        
-        # 尝试找出将牌（对子）
-        for i in range(len(sorted_hand) - 1):
-            if sorted_hand[i] == sorted_hand[i + 1]:
-                # 假设这对是将牌，移除后检查剩余的牌是否能组成面子
-                temp = sorted_hand.copy()
-                del temp[i + 1]
-                del temp[i]
-                
-                if self._check_melds(temp):
-                    return True
+        """检查基本胡牌条件：将牌+四组面子（查表判定）"""
+        from src.core.data.tile import NUM_TILE_TYPES
+        from src.core.tables.lookup import is_standard_hu
+        
+        counts = [0] * NUM_TILE_TYPES
+        for c in player.hand:
+            if not 0 <= c.tile_id < NUM_TILE_TYPES:
+                return False  # 花牌不能参与胡牌
+            counts[c.tile_id] += 1
+        if not 0 <= card.tile_id < NUM_TILE_TYPES:
+            return False
+        counts[card.tile_id] += 1
         
-        return False
+        return is_standard_hu(counts)
     
     def _sort_hand(self, hand) -> list:
         """将手牌按照花色和点数排序"""
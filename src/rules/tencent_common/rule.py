@@ -1,7 +1,4 @@
 from src.rules.base_rule import BaseRule
-from src.rules.tencent_common.hu_rules import TencentHuRules
-from src.rules.tencent_common.action_rules import TencentActionRules
-from src.rules.tencent_common.score_rules import TencentScoreRules
 
 class TencentCommonRule(BaseRule):
     """腾讯大众麻将规则实现"""
@@ -15,10 +12,34 @@ class TencentCommonRule(BaseRule):
         self.max_fans = 10      # 最大番数
         self.mandatory_discard = True  # 必须有一张牌可以打出
         
-        # 加载子规则
-        self.hu_rules = TencentHuRules(self)
-        self.action_rules = TencentActionRules(self)
-        self.score_rules = TencentScoreRules(self)
+        # 子规则在首次使用时加载（计分规则模块较大，只显示提示时无需加载）
+        self._hu_rules = None
+        self._action_rules = None
+        self._score_rules = None
+    
+    @property
+    def hu_rules(self):
+        """胡牌规则"""
+        if self._hu_rules is None:
+            from src.rules.tencent_common.hu_rules import TencentHuRules
+            self._hu_rules = TencentHuRules(self)
+        return self._hu_rules
+    
+    @property
+    def action_rules(self):
+        """动作规则"""
+        if self._action_rules is None:
+            from src.rules.tencent_common.action_rules import TencentActionRules
+            self._action_rules = TencentActionRules(self)
+        return self._action_rules
+    
+    @property
+    def score_rules(self):
+        """计分规则"""
+        if self._score_rules is None:
+            from src.rules.tencent_common.score_rules import TencentScoreRules
+            self._score_rules = TencentScoreRules(self)
+        return self._score_rules
     
     def can_chow(self, player, card, from_player) -> bool:
         """腾讯大众麻将吃牌规则"""
@@ -1,11 +1,33 @@
 from collections import Counter, defaultdict
 from src.core.data.card import Card
+from src.core.data.hand import Hand
+from src.core.data.meld import MeldList
+from src.core.data.tile import TILE_NAMES
+from src.core.tables.canonical import SymmetricCache, canonicalize
+from src.core.utils.instrument import instrumented
 
 class TencentScoreRules:
     """腾讯大众麻将计分规则"""
     
+    # 只对特定花色成立的番型：不满足花色对称性，在原始手牌上判定后并入番数缓存的键
+    SUIT_SPECIFIC_FANS = ('_is_lv_yi_se', '_is_tui_bu_dao', '_is_yi_se_si_bu_gao')
+    
+    # 可以逐步做成的番型的番数（AI规划高番目标时按番型名读取）
+    FAN_VALUES = {'清一色': 32, '碰碰胡': 12, '混一色': 8}
+    
     def __init__(self, rule):
         self.rule = rule
+        # 番数缓存（以花色规范化后的局面为键），为None时不缓存
+        self.fan_cache = SymmetricCache()
+    
+    def profile(self):
+        """创建番型判定剖析器（用作上下文管理器，退出时恢复）
+
+        Returns:
+            FanProfiler: 统计各_is_*判定的调用次数、耗时和命中率
+        """
+        from src.rules.tencent_common.fan_profiler import FanProfiler
+        return FanProfiler(self)
     
     def calculate_score(self, player, winning_card) -> int:
         """计算胡牌分数
@@ -50,9 +72,12 @@ class TencentScoreRules:
         
         return final_score
     
+    @instrumented
     def _calculate_fans(self, player, winning_card) -> int:
         """计算番数
         
+        花色置换后相同的局面番数相同，以规范化后的局面为键缓存。
+        
         Args:
             player: 胡牌玩家
             winning_card: 胡牌的牌
@@ -60,6 +85,33 @@ class TencentScoreRules:
         Returns:
             番数（最大不超过规则设定的max_fans）
         """
+        cache = self.fan_cache
+        if cache is None or not isinstance(player.hand, Hand):
+            return self._compute_fans(player, winning_card)
+        key = self._fan_key(player, winning_card)
+        fans = cache.get(key)
+        if fans is None:
+            fans = self._compute_fans(player, winning_card)
+            cache.put(key, fans)
+        return fans
+    
+    def _fan_key(self, player, winning_card) -> tuple:
+        """番数缓存的键：规范化的手牌、面子和胡的牌，加上番型判定用到的其他状态"""
+        melds = [MeldList._key(meld) for meld in player.melds]
+        tile = getattr(winning_card, 'tile_id', -1)
+        hand_key, _ = canonicalize(player.hand.counts, melds, tile)
+        return (
+            hand_key,
+            winning_card == player.drawn_card,
+            getattr(player, 'chang_feng', None),
+            getattr(player, 'men_feng', None),
+            getattr(player, 'huapai_count', None),
+            len(getattr(player, 'hua_cards', ())),
+            tuple(getattr(self, name)(player) for name in self.SUIT_SPECIFIC_FANS),
+        )
+    
+    def _compute_fans(self, player, winning_card) -> int:
+        """逐项判定番型计算番数"""
         total_fans = 0
         
         # 88番
@@ -226,7 +278,7 @@ class TencentScoreRules:
         
         # 清一色
         if self._is_pure_suit(player):
-            fans += 32
+            fans += self.FAN_VALUES['清一色']
         
         # 全双刻
         if self._is_quan_shuang_ke(player):
@@ -324,7 +376,7 @@ class TencentScoreRules:
         
         # 碰碰胡
         if self._is_all_pairs(player):
-            fans += 12
+            fans += self.FAN_VALUES['碰碰胡']
         
         # 双箭刻
         if self._is_shuang_jian_ke(player):
@@ -374,7 +426,7 @@ class TencentScoreRules:
         
         # 混一色
         if self._is_mixed_suit(player):
-            fans += 8
+            fans += self.FAN_VALUES['混一色']
         
         # 花龙
         if self._is_hua_long(player):
@@ -615,7 +667,7 @@ class TencentScoreRules:
         if not hasattr(player, 'melds'):
             return False
         
-        return len([meld for meld in player.melds if meld.type in ['明杠', '暗杠']]) == 4
+        return player.melds.kongs == 4
     
     def _is_lian_qi_dui(self, player) -> bool:
         """判断是否是连七对"""
@@ -675,7 +727,7 @@ class TencentScoreRules:
         if not hasattr(player, 'melds'):
             return False
         
-        return len([meld for meld in player.melds if meld.type in ['暗刻', '暗杠']]) == 4
+        return player.melds.concealed_pungs == 4
     
     def _is_yi_se_shuang_long_hui(self, player) -> bool:
         """判断是否是一色双龙会"""
@@ -757,7 +809,7 @@ class TencentScoreRules:
         if not hasattr(player, 'melds'):
             return False
         
-        return len([meld for meld in player.melds if meld.type in ['明杠', '暗杠']]) == 3
+        return player.melds.kongs == 3
     
     def _is_hun_yao_jiu(self, player) -> bool:
         """判断是否是混幺九"""
@@ -896,7 +948,7 @@ class TencentScoreRules:
         if not hasattr(player, 'melds'):
             return False
         
-        return len([meld for meld in player.melds if meld.type in ['暗刻', '暗杠']]) >= 3
+        return player.melds.concealed_pungs >= 3
     
     def _is_qi_xing_bu_kao(self, player) -> bool:
         """判断是否是七星不靠"""
@@ -971,7 +1023,7 @@ class TencentScoreRules:
         if not hasattr(player, 'melds'):
             return False
         
-        return len([meld for meld in player.melds if meld.type == '暗杠']) >= 2
+        return player.melds.concealed_kongs >= 2
     
     def _is_shuang_jian_ke(self, player) -> bool:
         """判断是否是双箭刻"""
@@ -1089,11 +1141,10 @@ class TencentScoreRules:
         
         # 检查吃碰杠中的刻子
         if hasattr(player, 'melds'):
-            for meld in player.melds:
-                if meld.type in ['明刻', '暗刻', '明杠', '暗杠']:
-                    # 取刻子/杠中的第一张牌的花色和点数
-                    card = meld.cards[0]
-                    triplets.append((card.suit, int(card.rank)))
+            for tid in self._meld_pung_tiles(player):
+                if tid < 27:
+                    suit, rank = TILE_NAMES[tid]
+                    triplets.append((suit, int(rank)))
         
         # 检查是否有三种不同花色的刻子，且点数依次递增一位
         if len(triplets) < 3:
@@ -1126,7 +1177,7 @@ class TencentScoreRules:
         if not hasattr(player, 'melds'):
             return False
         
-        return len([meld for meld in player.melds if meld.type in ['暗刻', '暗杠']]) >= 2
+        return player.melds.concealed_pungs >= 2
     
     def _is_jin_gou_diao(self, player) -> bool:
         """判断是否是金钩钓"""
@@ -1250,7 +1301,7 @@ class TencentScoreRules:
         if not hasattr(player, 'melds'):
             return False
         
-        return len([meld for meld in player.melds if meld.type == '暗杠']) >= 1
+        return player.melds.concealed_kongs >= 1
     
     def _is_si_gui_yi(self, player) -> bool:
         """判断是否是四归一"""
@@ -1264,7 +1315,7 @@ class TencentScoreRules:
         if not hasattr(player, 'melds'):
             return True
         
-        return all(meld.type in ['暗杠'] for meld in player.melds)
+        return player.melds.open_melds == 0
     
     def _is_shuang_tong_ke(self, player) -> bool:
         """判断是否是双同刻"""
@@ -1281,11 +1332,9 @@ class TencentScoreRules:
         
         # 检查吃碰杠中的刻子
         if hasattr(player, 'melds'):
-            for meld in player.melds:
-                if meld.type in ['明刻', '暗刻', '明杠', '暗杠']:
-                    card = meld.cards[0]
-                    rank = card.rank
-                    rank_counts[rank] = rank_counts.get(rank, 0) + 1
+            for tid in self._meld_pung_tiles(player):
+                rank = TILE_NAMES[tid][1]
+                rank_counts[rank] = rank_counts.get(rank, 0) + 1
         
         # 检查是否有至少2副序数相同的刻子
         return any(count >= 2 for count in rank_counts.values())
@@ -1306,7 +1355,7 @@ class TencentScoreRules:
         if not hasattr(player, 'melds'):
             return False
         
-        return len([m for m in player.melds if m.type == '明杠']) >= 1
+        return player.melds.exposed_kongs >= 1
     
     def _is_zi_mo(self, player, winning_card) -> bool:
         """判断是否是自摸"""
@@ -1382,13 +1431,21 @@ class TencentScoreRules:
             return True
         
         # 检查明刻、明杠、暗杠
-        if hasattr(player, 'melds'):
-            for meld in player.melds:
-                if meld.type in ['明刻', '明杠', '暗刻', '暗杠'] and any(c == card for c in meld.cards):
-                    return True
+        if hasattr(player, 'melds') and card.tile_id >= 0:
+            return player.melds.has_pung(card.tile_id)
         
         return False
     
+    def _meld_pung_tiles(self, player) -> list:
+        """吃碰杠中有刻子或杠子的牌编号"""
+        mask = player.melds.pung_mask
+        tiles = []
+        while mask:
+            low = mask & -mask
+            tiles.append(low.bit_length() - 1)
+            mask ^= low
+        return tiles
+    
     def _has_wind_pair(self, player) -> bool:
         """判断是否有风牌对子"""
         wind_counts = {}
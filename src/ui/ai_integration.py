@@ -1,14 +1,80 @@
-from src.ai.strategy.advanced_strategy import AdvancedStrategy
-from src.rules.tencent_common.rule import TencentCommonRule
+import threading
+from collections import OrderedDict
+
+from src.core.data.zobrist import player_key, tiles_key
 
 class AIDecisionManager:
-    """AI决策管理器，负责AI策略的初始化和管理"""
+    """AI决策管理器，负责AI策略的初始化和管理
+    
+    界面每次重绘都会查询推荐出牌和危险牌。两者在一次遍历中一起计算，
+    以影响结果的局面部分（各家手牌和面子、弃牌、牌墙剩余）的哈希为键缓存，
+    局面未变化时直接返回缓存结果。
+    """
     
-    def __init__(self):
-        # 初始化腾讯大众麻将规则
-        self.rule = TencentCommonRule()
+    def __init__(self, rule=None, cache_size: int = 128):
+        """
+        Args:
+            rule: 规则实例（由调用方注入以共享同一实例，为空时创建腾讯大众麻将规则）
+            cache_size: 缓存的分析结果数
+        """
+        if rule is None:
+            from src.rules.tencent_common.rule import TencentCommonRule
+            rule = TencentCommonRule()
+        self.rule = rule
         # 初始化高级AI策略
+        from src.ai.strategy.advanced_strategy import AdvancedStrategy
         self.strategy = AdvancedStrategy(self.rule)
+        self.cache_size = cache_size
+        self._analyses = OrderedDict()
+        self._lock = threading.Lock()  # 后台提示线程（HintWorker）也会写入缓存
+    
+    @staticmethod
+    def analysis_key(player, game_state) -> tuple:
+        """出牌分析的缓存键
+        
+        只包含分析用到的状态：各家手牌和面子、弃牌、牌墙位置，以及分析的玩家；
+        轮到谁、是否需要直接出牌等变化不会使缓存失效。
+        """
+        return tiles_key(game_state), player.seat, player_key(player)
+    
+    def analyze(self, player, game_state):
+        """推荐出牌和危险牌分析（局面未变化时返回缓存结果）
+        
+        Args:
+            player: 当前玩家
+            game_state: 当前游戏状态
+        
+        Returns:
+            tuple: (推荐牌, 推荐理由, 危险牌字典)
+        """
+        key = self.analysis_key(player, game_state)
+        analysis = self._get(key)
+        if analysis is None:
+            analysis = self.strategy.analyze_discards(player, game_state)
+            self._put(key, analysis)
+        return analysis
+    
+    def peek(self, player, game_state):
+        """只查询缓存，没有缓存结果时返回None"""
+        return self._get(self.analysis_key(player, game_state))
+    
+    def _get(self, key):
+        with self._lock:
+            analysis = self._analyses.get(key)
+            if analysis is not None:
+                self._analyses.move_to_end(key)
+            return analysis
+    
+    def _put(self, key, analysis) -> None:
+        with self._lock:
+            self._analyses[key] = analysis
+            if len(self._analyses) > self.cache_size:
+                self._analyses.popitem(last=False)
+    
+    def invalidate(self) -> None:
+        """清空缓存（更换策略或在缓存键之外修改了局面时调用）"""
+        with self._lock:
+            self._analyses.clear()
     
     def get_best_action(self, player, game_state):
         """获取最佳行动
@@ -32,7 +98,8 @@ class AIDecisionManager:
         Returns:
             tuple: (推荐牌, 推荐理由)
         """
-        return self.strategy.recommend_discard(player, game_state)
+        best_card, reason, _ = self.analyze(player, game_state)
+        return best_card, reason
     
     def analyze_danger_cards(self, player, game_state):
         """分析危险牌
@@ -44,14 +111,8 @@ class AIDecisionManager:
         Returns:
             dict: 危险牌分析结果，键为牌，值为危险等级
         """
-        danger_cards = {}
-        for card in player.hand:
-            risk = self.strategy.risk_evaluator.evaluate_card_risk(card, player, game_state)
-            danger_cards[card] = risk
-        
-        # 按危险等级排序
-        sorted_danger_cards = dict(sorted(danger_cards.items(), key=lambda item: item[1], reverse=True))
-        return sorted_danger_cards
+        # 返回副本，调用方修改不影响缓存
+        return dict(self.analyze(player, game_state)[2])
     
     def get_hand_evaluation(self, player, game_state):
         """获取手牌评估
@@ -0,0 +1,228 @@
+"""后台预先计算AI提示
+
+人类玩家思考时（等待input或界面事件），后台线程在局面副本上推演接下来
+可能出现的局面，提前算好AI提示：
+
+- 摸到每种可能的牌后的推荐出牌和危险牌分析
+- 对手打出每种可响应的牌时，是否响应（胡/杠/碰/吃）以及响应后的推荐出牌
+
+轮到该玩家时discard_hint/claim_hint直接返回预先算好的结果。
+局面变化后再次调用speculate（或调用cancel）会作废尚未完成的推演。
+
+摸牌提示先写入AIDecisionManager的缓存（摸牌前局面没有其他变化时精确命中），
+同时按手牌记录一份：其间有其他玩家打牌时，牌墙剩余数和弃牌与推演时不同，
+风险项会略有偏差，但手牌相同，提示仍可立即显示。
+"""
+import queue
+import threading
+
+from src.core.data.meld import Meld, MeldType
+from src.core.data.tile import NUM_TILE_TYPES, card_from_id
+from src.core.data.zobrist import player_key, state_key
+
+
+class HintWorker:
+    """后台提示线程"""
+
+    def __init__(self, manager):
+        """
+        Args:
+            manager: AIDecisionManager实例（共享策略和分析缓存）
+        """
+        self.manager = manager
+        self.strategy = manager.strategy
+        self.draw_hints = {}    # (座位, 摸牌后的玩家哈希) -> 分析结果
+        self.claim_hints = {}   # (座位, 玩家哈希, 响应类型, 牌编号) -> (是否响应, 响应后的分析结果)
+        self.hits = 0
+        self.misses = 0
+        self._generation = 0
+        self._last_key = None
+        self._jobs = queue.Queue()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = None
+
+    def speculate(self, player, game_state) -> None:
+        """作废之前的推演，在当前局面的副本上开始新的推演
+
+        局面与上次推演时相同时不做任何事。
+
+        Args:
+            player: 需要提示的玩家
+            game_state: 当前游戏状态（在调用线程中复制，之后不再访问）
+        """
+        key = (state_key(game_state), player.seat)
+        if key == self._last_key:
+            return
+        self._last_key = key
+        self._generation += 1
+        snapshot = game_state.clone()
+        seat = game_state.players.index(player)
+        with self._lock:
+            self._pending += 1
+            self._idle.clear()
+        self._jobs.put((self._generation, snapshot, seat))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="hint-worker", daemon=True)
+            self._thread.start()
+
+    def cancel(self) -> None:
+        """作废尚未完成的推演"""
+        self._generation += 1
+        self._last_key = None
+
+    def wait(self, timeout: float = None) -> bool:
+        """等待当前推演完成（测试用）
+
+        Returns:
+            bool: 是否在超时前完成
+        """
+        return self._idle.wait(timeout)
+
+    def close(self) -> None:
+        """作废推演并结束后台线程"""
+        self.cancel()
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def discard_hint(self, player, game_state):
+        """获取推荐出牌和危险牌分析（预先算好的结果）
+
+        Args:
+            player: 当前玩家
+            game_state: 当前游戏状态
+
+        Returns:
+            tuple: (推荐牌, 推荐理由, 危险牌字典)，没有预先算好的结果时为None
+        """
+        analysis = self.manager.peek(player, game_state)
+        if analysis is None:
+            analysis = self.draw_hints.get((player.seat, player_key(player)))
+        if analysis is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return analysis
+
+    def claim_hint(self, player, claim_type: str, card):
+        """获取是否响应别人打出的牌的提示
+
+        Args:
+            player: 可以响应的玩家
+            claim_type: 响应类型（hu/kong/pong/chow）
+            card: 打出的牌
+
+        Returns:
+            tuple: (是否响应, 响应后的分析结果或None)，没有预先算好的结果时为None
+        """
+        hint = self.claim_hints.get((player.seat, player_key(player), claim_type, card.tile_id))
+        if hint is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return hint
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            generation, state, seat = job
+            try:
+                if generation == self._generation:
+                    self._speculate(generation, state, state.players[seat])
+            finally:
+                with self._lock:
+                    self._pending -= 1
+                    if not self._pending:
+                        self._idle.set()
+
+    def _stale(self, generation: int) -> bool:
+        return generation != self._generation
+
+    def _speculate(self, generation, state, player):
+        """在局面副本上推演（每算完一个假设局面检查一次是否已作废）"""
+        self.draw_hints.clear()
+        self.claim_hints.clear()
+        hand = player.hand
+
+        if len(hand) % 3 == 2:
+            # 轮到该玩家出牌：先算当前局面的提示，再假设按提示打出推荐牌
+            best_card = self.manager.analyze(player, state)[0]
+            if best_card is None or self._stale(generation):
+                return
+            from src.core.logic.deck_manager import DeckManager
+            DeckManager.discard_card(state, hand.take(best_card.tile_id))
+
+        # 对手打出可响应的牌
+        for claim_type, tid in self._claimable(player):
+            if self._stale(generation):
+                return
+            self._speculate_claim(state, player, claim_type, tid)
+
+        # 摸到每种可能的牌：未见张数多的先算
+        unseen = self._unseen(state, player)
+        for tid in sorted(range(NUM_TILE_TYPES), key=lambda t: -unseen[t]):
+            if not unseen[tid] or not state.deck or self._stale(generation):
+                continue
+            hand.append(card_from_id(tid))
+            wall = state.deck
+            wall.tail -= 1
+            try:
+                analysis = self.manager.analyze(player, state)
+                self.draw_hints[(player.seat, player_key(player))] = analysis
+            finally:
+                wall.tail += 1
+                hand.take(tid)
+
+    def _claimable(self, player):
+        """手牌可以响应的 (响应类型, 牌编号)"""
+        index = player.hand.claim_index()
+        for claim_type, mask in (("hu", index.win), ("kong", index.kong),
+                                 ("pong", index.pong), ("chow", index.chow)):
+            while mask:
+                low = mask & -mask
+                yield claim_type, low.bit_length() - 1
+                mask ^= low
+
+    def _speculate_claim(self, state, player, claim_type, tid):
+        """推演对手打出tid时的响应决定，以及碰、吃后的推荐出牌"""
+        card = card_from_id(tid)
+        key = (player.seat, player_key(player), claim_type, tid)
+        claim = self.strategy.should_claim(player, state, claim_type, card)
+        follow_up = None
+        if claim and claim_type in ("pong", "chow"):
+            from src.core.logic.turn_handler import TurnHandler
+            if claim_type == "pong":
+                taken, meld = [tid, tid], Meld(MeldType.PONG, tile=tid)
+            else:
+                taken = list(TurnHandler.find_chow_partners(player, card))
+                meld = Meld(MeldType.CHOW, tile=min(taken + [tid]))
+            for t in taken:
+                player.hand.take(t)
+            player.melds.append(meld)
+            try:
+                follow_up = self.strategy.analyze_discards(player, state)
+            finally:
+                player.melds.remove(meld)
+                for t in taken:
+                    player.hand.append(card_from_id(t))
+        self.claim_hints[key] = (claim, follow_up)
+
+    @staticmethod
+    def _unseen(state, player) -> list:
+        """从该玩家的角度每种牌未见的张数"""
+        unseen = [4] * NUM_TILE_TYPES
+        for tid in range(NUM_TILE_TYPES):
+            unseen[tid] -= player.hand.counts[tid]
+        for other in state.players:
+            for tid, n in enumerate(other.melds.counts):
+                unseen[tid] -= n
+        for card in state.discard_pile:
+            if 0 <= card.tile_id < NUM_TILE_TYPES:
+                unseen[card.tile_id] -= 1
+        return [max(n, 0) for n in unseen]
@@ -0,0 +1,52 @@
+import random
+
+from src.ai.evaluation.fan_planner import FanPlanner, QING_YI_SE, HUN_YI_SE, PENG_PENG_HU
+from src.core.data.meld import Meld, MeldType
+from src.core.data.tile import card_from_id
+from src.rules.tencent_common.rule import TencentCommonRule
+
+def counts_of(*tids):
+    counts = [0] * 34
+    for tid in tids:
+        counts[tid] += 1
+    return counts
+
+def test_target_distances():
+    """测试各目标牌型的距离"""
+    # 1123456789万 + 5筒 + 东东东：打5筒即混一色听牌；清一色要换进四张万子，至少摸四次才能和
+    hand = counts_of(0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 13, 27, 27, 27)
+    targets = {name: (fans, distance) for name, fans, distance in FanPlanner().targets(hand)}
+    assert targets[HUN_YI_SE] == (1, 0)          # 没有规则时每个目标记为1番
+    assert targets[QING_YI_SE] == (1, 3)
+    # 11万 22筒 33条 东东 南南 西 北北：七对不作为目标，碰碰胡要把四个对子都摸成刻子
+    pairs = counts_of(0, 0, 10, 10, 20, 20, 27, 27, 28, 28, 29, 30, 30)
+    targets = {name: distance for name, _, distance in FanPlanner().targets(pairs)}
+    assert set(targets) == {QING_YI_SE, HUN_YI_SE, PENG_PENG_HU}
+    assert targets[PENG_PENG_HU] == 3
+    assert FanPlanner().targets(pairs, [Meld(MeldType.PONG, [card_from_id(31)] * 3)]) == []
+
+def test_discards_match_targets():
+    """测试逐个候选增量计算的目标与打出后重新计算的结果一致"""
+    rng = random.Random(5)
+    pool = [t for t in range(34) for _ in range(4)]
+    planner = FanPlanner(decay=0.5)
+    for _ in range(100):
+        hand = counts_of(*rng.sample(pool, 14))
+        shantens = {tid: 1 for tid in range(34) if hand[tid]}
+        results = planner.evaluate_discards(hand, shantens)
+        for tid in shantens:
+            hand[tid] -= 1
+            expected = max(fans * 0.5 ** max(distance - 1, 0)
+                           for _, fans, distance in planner.targets(hand))
+            hand[tid] += 1
+            assert abs(results[tid][2] - expected) < 1e-12
+
+def test_rule_cap_and_draws():
+    """测试番数从规则读取并按规则封顶，剩余摸牌次数不足的目标不计入"""
+    hand = counts_of(0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 13, 27, 27, 27)
+    rule = TencentCommonRule()
+    planner = FanPlanner(rule)
+    assert planner.fans == {QING_YI_SE: 10, HUN_YI_SE: rule.score_rules.FAN_VALUES[HUN_YI_SE], PENG_PENG_HU: 10}
+    results = planner.evaluate_discards(hand, {13: 0, 0: 1})
+    assert results[13] == (HUN_YI_SE, 0, 8)     # 清一色封顶10番，但距离3，期望只有10 × 0.3^3
+    assert planner.evaluate_discards(hand, {13: 0}, draws=0)[13] == (None, None, 0.0)
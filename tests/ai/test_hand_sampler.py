@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from src.ai.evaluation.hand_sampler import HandSampler, discard_weights
+from src.core.data.game_state import GameState
+from src.core.data.player import Player
+from src.core.logic.turn_handler import TurnHandler
+from src.rules.tencent_common.rule import TencentCommonRule
+
+def _midgame(seed=5, turns=20):
+    random.seed(seed)
+    players = [Player(name) for name in ("东家", "南家", "西家", "北家")]
+    state = GameState(players, TencentCommonRule(), seed=seed)
+    state.initialize_game()
+    for _ in range(turns):
+        if state.game_stage != "playing":
+            break
+        TurnHandler.process_turn(state)
+    return state
+
+def test_samples_consistent_with_visible_information():
+    """测试抽样结果的张数与可见信息一致：每种牌的总数等于初始牌组中的张数"""
+    state = _midgame()
+    viewer = state.players[0]
+    sampler = HandSampler(state, viewer, rng=random.Random(1))
+    initial = [0] * 42
+    for tid in state.rule.initial_tile_ids():
+        initial[tid] += 1
+    for _ in range(50):
+        hands = sampler.sample(with_wall=True)
+        total = list(viewer.hand.counts)
+        for player in state.players:
+            for tid, n in enumerate(player.melds.counts):
+                total[tid] += n
+            for card in player.hua_cards:
+                total[card.tile_id] += 1
+        for card in state.discard_pile:
+            total[card.tile_id] += 1
+        for counts, size in zip(hands, sampler.sizes):
+            assert sum(counts) == size
+            for tid, n in enumerate(counts):
+                total[tid] += n
+        for tid in sampler.wall:
+            total[tid] += 1
+        assert total == initial
+    assert sampler.sizes == [len(p.hand) for p in state.players[1:]]
+    assert len(sampler.wall) == len(state.deck)
+
+def test_samples_never_exceed_unseen():
+    """测试对手手牌中每种牌的张数之和不超过未见的张数"""
+    state = _midgame(turns=40)
+    viewer = state.players[2]
+    unseen = HandSampler.unseen_counts(state, viewer)
+    sampler = HandSampler(state, viewer, rng=random.Random(2))
+    assert sampler.seats == [0, 1, 3]
+    for hands in sampler.samples(200):
+        for tid in range(34):
+            assert sum(counts[tid] for counts in hands) <= unseen[tid]
+
+def test_discard_history_biases_sample():
+    """测试对手打过的牌被抽到的频率降低"""
+    state = _midgame(turns=0)
+    viewer = state.players[0]
+    tid = max(range(34), key=lambda t: HandSampler.unseen_counts(state, viewer)[t])
+    plain = HandSampler(state, viewer, rng=random.Random(3)).holding_frequency(2000)
+    biased = HandSampler(state, viewer, rng=random.Random(3),
+                         discards={1: [tid, tid]}).holding_frequency(2000)
+    assert biased[0][tid] < plain[0][tid] * 0.6
+    assert abs(biased[1][tid] - plain[1][tid]) < 0.1
+    assert discard_weights([tid, tid], 0.5)[tid] == 0.25
+
+def test_inconsistent_state_rejected():
+    """测试可见信息与手牌张数矛盾时报错"""
+    state = _midgame(turns=0)
+    state.players[1].hand.extend(list(state.players[0].hand) * 10)
+    with pytest.raises(ValueError):
+        HandSampler(state, state.players[0])
+
+def test_samples_reuse_buffers():
+    """测试连续抽样的次数和每组手牌的张数，各次抽样复用同一组数组（吞吐量见benchmarks.bench_rules）"""
+    state = _midgame()
+    sampler = HandSampler(state, state.players[0], rng=random.Random(4))
+    count = 0
+    for hands in sampler.samples(2000):
+        assert hands is sampler.hands
+        assert [sum(counts) for counts in hands] == list(sampler.sizes)
+        count += 1
+    assert count == 2000
@@ -0,0 +1,109 @@
+import random
+from functools import lru_cache
+
+from src.ai.evaluation.tile_efficiency import TileEfficiency
+
+def counts_of(*tids):
+    counts = [0] * 34
+    for tid in tids:
+        counts[tid] += 1
+    return counts
+
+def unseen_for(counts):
+    return [4 - n for n in counts]
+
+@lru_cache(maxsize=None)
+def _search(counts, melds, partials, pair):
+    """穷举拆分：从编号最小的牌开始，依次作为刻子、顺子、将牌、搭子或孤张"""
+    i = next((t for t in range(34) if counts[t]), None)
+    if i is None:
+        return 8 - 2 * melds - min(partials, 4 - melds) - pair
+    suited = i < 27
+    rank = i % 9
+
+    def take(*tiles):
+        rest = list(counts)
+        for t in tiles:
+            rest[t] -= 1
+        return tuple(rest)
+
+    best = _search(take(i), melds, partials, pair)
+    if counts[i] >= 3:
+        best = min(best, _search(take(i, i, i), melds + 1, partials, pair))
+    if suited and rank <= 6 and counts[i + 1] and counts[i + 2]:
+        best = min(best, _search(take(i, i + 1, i + 2), melds + 1, partials, pair))
+    if counts[i] >= 2:
+        if not pair:
+            best = min(best, _search(take(i, i), melds, partials, 1))
+        best = min(best, _search(take(i, i), melds, partials + 1, pair))
+    if suited and rank <= 7 and counts[i + 1]:
+        best = min(best, _search(take(i, i + 1), melds, partials + 1, pair))
+    if suited and rank <= 6 and counts[i + 2]:
+        best = min(best, _search(take(i, i + 2), melds, partials + 1, pair))
+    return best
+
+def reference_shanten(counts):
+    """穷举拆分得到的标准型向听数（与被测的按花色组合的实现相互独立）"""
+    return _search(tuple(counts), 0, 0, 0)
+
+# 3579万 7万 234筒 667筒 345条：打9万和打7筒一步进张数相同（16张）
+TIE = counts_of(2, 4, 6, 6, 8, 10, 11, 12, 14, 14, 15, 19, 20, 21)
+
+def test_acceptance_matches_shanten():
+    """测试按花色增量得到的向听数和有效进张与逐张计算标准型向听数一致"""
+    rng = random.Random(3)
+    calc = TileEfficiency()
+    pool = [t for t in range(34) for _ in range(4)]
+    hands = [counts_of(*rng.sample(pool, 13)) for _ in range(100)]
+    hands += [counts_of(*rng.sample(pool[:36], 13)) for _ in range(50)]    # 清一色
+    for hand in hands:
+        shanten, mask = calc.acceptance(tuple(hand))
+        assert shanten == reference_shanten(hand)
+        expected = 0
+        for t in range(34):
+            if hand[t] < 4:
+                hand[t] += 1
+                if reference_shanten(hand) < shanten:
+                    expected |= 1 << t
+                hand[t] -= 1
+        assert mask == expected
+
+def test_seven_pairs_not_counted():
+    """测试与规则的和牌判定一致，七对的形状不计入向听数和进张"""
+    # 11万 99万 22筒 22条 东东 西 中 北：七对一向听，标准型三向听；摸西只对七对有用
+    hand = counts_of(0, 0, 8, 8, 10, 10, 19, 19, 27, 27, 29, 31, 33)
+    shanten, mask = TileEfficiency().acceptance(tuple(hand))
+    assert shanten == 3
+    assert not mask >> 29 & 1
+
+def test_second_order_breaks_ties():
+    """测试一步进张数相同时，两步进张数区分进张后的形状"""
+    results = TileEfficiency().evaluate(TIE, unseen_for(TIE))
+    assert results[8][:2] == results[15][:2] == (1, 16)
+    assert results[8][2] > results[15][2] > 0
+
+def test_second_order_only_for_best_candidates():
+    """测试退向听的打法和听牌的手牌不计算两步进张数"""
+    calc = TileEfficiency()
+    results = calc.evaluate(TIE, unseen_for(TIE))
+    assert results[11][0] == 2 and results[11][2] == 0
+    # 123万 456万 789筒 东东东 5条 + 北：打北听5条
+    tenpai = counts_of(0, 1, 2, 3, 4, 5, 15, 16, 17, 27, 27, 27, 22, 30)
+    results = calc.evaluate(tenpai, unseen_for(tenpai))
+    assert results[30] == (0, 3, 0)
+    assert all(second == 0 for _, _, second in results.values())
+
+def test_cache_independent_of_unseen():
+    """测试缓存只依赖手牌：换一组未见张数后结果与新建的计算器相同"""
+    calc = TileEfficiency()
+    calc.evaluate(TIE, unseen_for(TIE))
+    unseen = unseen_for(TIE)
+    unseen[7] = unseen[13] = 0
+    assert calc.evaluate(TIE, unseen) == TileEfficiency().evaluate(TIE, unseen)
+    # 跨回合：摸到一张牌后再打出，中间手牌大部分已缓存
+    hand = list(TIE)
+    hand[8] -= 1
+    hand[13] += 1
+    size = len(calc._accept)
+    assert calc.evaluate(hand, unseen_for(hand)) == TileEfficiency().evaluate(hand, unseen_for(hand))
+    assert len(calc._accept) - size < size
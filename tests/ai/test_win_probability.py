@@ -0,0 +1,87 @@
+from src.ai.evaluation.win_probability import WinProbability, own_draws
+from src.core.data.game_state import GameState
+from src.core.data.player import Player
+from src.core.data.tile import card_from_id
+from src.rules.tencent_common.rule import TencentCommonRule
+
+def counts_of(*tids):
+    counts = [0] * 34
+    for tid in tids:
+        counts[tid] += 1
+    return counts
+
+def unseen_for(counts):
+    return [4 - n for n in counts]
+
+# 123万 456万 789筒 东东东 5条 + 北：打北听5条单骑
+TENPAI = counts_of(0, 1, 2, 3, 4, 5, 15, 16, 17, 27, 27, 27, 22, 30)
+
+def test_tenpai_matches_closed_form():
+    """测试听牌时和牌概率等于 1 - (1 - w)^d"""
+    unseen = unseen_for(TENPAI)
+    results = WinProbability().evaluate_counts(TENPAI, unseen, 3)
+    w = 3 / sum(unseen)
+    prob, value = results[card_from_id(30)]
+    assert abs(prob - (1 - (1 - w) ** 3)) < 1e-12
+    assert value == prob                      # 没有规则时每次和牌记为1番
+    assert results[card_from_id(0)] == (0.0, 0.0)   # 拆面子退向听
+    assert prob == max(p for p, _ in results.values())
+
+def test_only_standard_waits():
+    """测试与规则的和牌判定一致，七对听牌不计为听牌"""
+    # 11万 22筒 33条 东东 南南 西西 北 + 发：七对听牌，标准型不听
+    hand = counts_of(0, 0, 10, 10, 20, 20, 27, 27, 28, 28, 29, 29, 30, 32)
+    results = WinProbability().evaluate_counts(hand, unseen_for(hand), 2)
+    assert results[card_from_id(32)] == (0.0, 0.0)
+
+def test_draws_bound_and_lookahead():
+    """测试一向听时一次摸牌无法和牌，两次摸牌概率为正且随摸牌次数增加"""
+    hand = counts_of(0, 1, 2, 3, 4, 5, 15, 16, 17, 27, 27, 22, 25, 33)
+    unseen = unseen_for(hand)
+    calc = WinProbability()
+    assert max(p for p, _ in calc.evaluate_counts(hand, unseen, 1).values()) == 0.0
+    two = calc.evaluate_counts(hand, unseen, 2)[card_from_id(33)][0]
+    four = calc.evaluate_counts(hand, unseen, 4)[card_from_id(33)][0]
+    assert 0 < two < four < 1
+
+def test_depletion_of_drawn_tiles():
+    """测试已见的牌越多，和牌概率越低"""
+    unseen = unseen_for(TENPAI)
+    calc = WinProbability()
+    full = calc.evaluate_counts(TENPAI, unseen, 2)[card_from_id(30)][0]
+    unseen[22] = 1
+    fewer = calc.evaluate_counts(TENPAI, unseen, 2)[card_from_id(30)][0]
+    unseen[22] = 0
+    none = calc.evaluate_counts(TENPAI, unseen, 2)[card_from_id(30)][0]
+    assert full > fewer > none == 0.0
+
+def test_expected_fans_with_rule():
+    """测试有规则时期望番数由番数计算得到"""
+    rule = TencentCommonRule()
+    player = Player("东家")
+    player.hand = [card_from_id(t) for t in range(34) for _ in range(TENPAI[t])]
+    calc = WinProbability(rule)
+    prob, value = calc.evaluate_counts(TENPAI, unseen_for(TENPAI), 2, player)[card_from_id(30)]
+    player.hand.take(30)
+    player.hand.append(card_from_id(22))
+    player.drawn_card = card_from_id(22)
+    fans = rule.score_rules._calculate_fans(player, card_from_id(22))
+    assert prob > 0 and abs(value - prob * fans) < 1e-9
+
+def test_evaluate_from_game_state():
+    """测试从局面计算一向听的全部候选，同一局面再次计算时复用子问题（耗时见benchmarks.bench_rules）"""
+    players = [Player(name) for name in ("东家", "南家", "西家", "北家")]
+    state = GameState(players, TencentCommonRule())
+    state.assign_seats()
+    state.deck = [card_from_id(t) for t in range(16)]
+    player = players[0]
+    player.hand = [card_from_id(t) for t in (0, 1, 2, 3, 4, 5, 15, 16, 17, 27, 27, 22, 25, 33)]
+    assert own_draws(player, state) == 4
+    calc = WinProbability()
+    results = calc.evaluate(player, state)
+    assert set(results) == set(player.hand)
+    assert results[card_from_id(33)][0] > 0
+    assert results[card_from_id(0)] == (0.0, 0.0)
+    solved = len(calc._memo)
+    assert calc.evaluate(player, state) == results
+    assert len(calc._memo) == solved
@@ -0,0 +1,36 @@
+from src.core.data.action import Action
+from src.core.data.card import Card
+from src.core.data.game_state import GameState
+from src.core.data.player import Player
+from src.rules.tencent_common.rule import TencentCommonRule
+
+def test_action_fields():
+    """测试操作码、牌编号和来源座位"""
+    source = Player("上家")
+    source.seat = 2
+    action = Action("pong", Card("箭", "中"), source)
+    assert action.op == Action.PONG and action.type == "pong"
+    assert action.tile == 31 and action.seat == 2
+    assert Action(Action.DRAW).tile == -1 and Action(Action.DRAW).seat == -1
+    assert not hasattr(action, "__dict__")
+
+def test_timestamp_only_when_recording():
+    """测试只有开启记录时才记录时间戳"""
+    assert Action(Action.DISCARD).timestamp is None
+    Action.set_recording(True)
+    try:
+        assert Action(Action.DISCARD).timestamp is not None
+    finally:
+        Action.set_recording(False)
+
+def test_valid_actions_buffer():
+    """测试有效操作为操作码，且复用同一个缓冲区"""
+    rule = TencentCommonRule()
+    player = Player("测试玩家")
+    player.hand = [Card("万", "1"), Card("花", "梅")]
+    state = GameState([player], rule)
+    first = rule.get_valid_actions(player, state)
+    assert first == [Action.FLOWER, Action.DISCARD]
+    player.hand = [Card("万", "1")]
+    second = rule.get_valid_actions(player, state)
+    assert second is first and second == [Action.DISCARD]
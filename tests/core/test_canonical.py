@@ -0,0 +1,116 @@
+import itertools
+import random
+import threading
+
+from src.core.data.claim_index import ClaimIndex
+from src.core.data.meld import Meld, MeldType
+from src.core.data.player import Player
+from src.core.data.tile import card_from_id
+from src.core.tables import canonical, kernels
+from src.rules.tencent_common.rule import TencentCommonRule
+
+def permute(tiles, order):
+    """交换花色：原花色s变为order[s]"""
+    return [order[t // 9] * 9 + t % 9 if t < 27 else t for t in tiles]
+
+def counts_of(tiles):
+    counts = [0] * 34
+    for t in tiles:
+        counts[t] += 1
+    return counts
+
+def random_hand(rng, size):
+    wall = [t for t in range(34) for _ in range(4)]
+    rng.shuffle(wall)
+    return wall[:size]
+
+def test_permuted_hands_share_canonical_form():
+    """测试六种花色排列得到同一规范形式，置换能映射回原编号"""
+    rng = random.Random(1)
+    for _ in range(50):
+        tiles = random_hand(rng, 14)
+        melds = [(MeldType.PONG, rng.randrange(27)), (MeldType.CHOW, 3)]
+        forms = set()
+        for order in itertools.permutations(range(3)):
+            counts = counts_of(permute(tiles, order))
+            moved = [(kind, permute([t], order)[0]) for kind, t in melds]
+            key, perm = canonical.canonicalize(counts, moved, permute([tiles[0]], order)[0])
+            forms.add(key)
+            ckey, cperm = canonical.canonical_counts(counts)
+            for tid in range(34):
+                assert canonical.from_canonical(canonical.to_canonical(tid, cperm), cperm) == tid
+                assert ckey[canonical.to_canonical(tid, cperm)] == counts[tid]
+        assert len(forms) == 1
+
+def test_waiting_mask_maps_back():
+    """测试规范化缓存的听牌位图与直接计算一致"""
+    rng = random.Random(2)
+    for _ in range(200):
+        counts = counts_of(random_hand(rng, 13))
+        expected = ClaimIndex._compute_win_mask(counts)
+        assert canonical.waiting_mask(counts, ClaimIndex._compute_win_mask) == expected
+    # 一万至九万的九莲宝灯换成条子
+    tiles = permute([0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 8, 8], (2, 0, 1))
+    assert ClaimIndex._win_mask(counts_of(tiles)) == 0x1FF << 18
+
+def test_shanten_cached():
+    """测试向听数缓存结果与内核一致"""
+    rng = random.Random(3)
+    for _ in range(100):
+        counts = counts_of(random_hand(rng, 13))
+        assert canonical.shanten(counts) == kernels.shanten(kernels.as_counts(counts), 0)
+
+def test_symmetric_cache_thread_safe():
+    """测试多个线程同时读写容量很小的缓存（频繁淘汰）时不出错"""
+    cache = canonical.SymmetricCache(maxsize=4)
+    errors = []
+
+    def work(offset):
+        try:
+            for i in range(20000):
+                key = (offset + i) % 8
+                if cache.get(key) is None:
+                    cache.put(key, i)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors and len(cache) <= 4
+    assert cache.hits + cache.misses == 80000
+
+def _winner(tiles, melds=()):
+    player = Player("测试")
+    player.hand = [card_from_id(t) for t in tiles]
+    player.melds = [Meld(kind, tile=t) for kind, t in melds]
+    return player
+
+def test_fan_cache_shared_across_suits():
+    """测试番数缓存在花色置换之间共用，结果与不缓存时一致"""
+    score_rules = TencentCommonRule().score_rules
+    tiles = [0, 1, 2, 3, 4, 5, 6, 7, 8, 10, 11, 12, 27, 27]
+    results = set()
+    for order in itertools.permutations(range(3)):
+        player = _winner(permute(tiles, order))
+        winning = player.hand[0]
+        fans = score_rules._calculate_fans(player, winning)
+        assert fans == score_rules._compute_fans(player, winning)
+        results.add(fans)
+    assert len(results) == 1
+    assert score_rules.fan_cache.hits == 5
+
+def test_suit_specific_fans_bypass_symmetry():
+    """测试绿一色等花色特定番型不被花色置换后的缓存结果掩盖"""
+    rule = TencentCommonRule()
+    rule.max_fans = 1000
+    score_rules = rule.score_rules
+    # 绿一色：234条 234条 666条 888条 发发；换成万子后不是绿一色
+    green = [19, 20, 21, 19, 20, 21, 23, 23, 23, 25, 25, 25, 32, 32]
+    player = _winner(permute(green, (2, 1, 0)))
+    assert score_rules._calculate_fans(player, player.hand[0]) < 88
+    player = _winner(green)
+    assert score_rules._calculate_fans(player, player.hand[0]) >= 88
+    assert score_rules.fan_cache.hits == 0
@@ -0,0 +1,74 @@
+import random
+from src.core.data.card import Card
+from src.core.data.claim_index import ClaimIndex
+from src.core.data.hand import Hand
+from src.core.data.player import Player
+from src.core.data.tile import card_from_id, tile_id
+from src.rules.tencent_common.rule import TencentCommonRule
+
+def _bit(suit, rank):
+    return 1 << tile_id(suit, rank)
+
+def test_incremental_matches_rebuild():
+    """测试增量更新的位图与重新计算的结果一致"""
+    rng = random.Random(3)
+    hand = Hand()
+    for _ in range(500):
+        if len(hand) < 14 and (not hand or rng.random() < 0.55):
+            tid = rng.randrange(34)
+            if hand.counts[tid] < 4:
+                hand.append(card_from_id(tid))
+        else:
+            hand.pop(rng.randrange(len(hand)))
+        
+        index = hand.claim_index()
+        fresh = ClaimIndex(list(hand.counts))
+        assert (index.pong, index.kong, index.chow, index.chow_shapes) == \
+               (fresh.pong, fresh.kong, fresh.chow, fresh.chow_shapes)
+        assert index.win == fresh.win
+
+def test_chow_shapes():
+    """测试可吃搭子组合"""
+    hand = Hand([Card("万", "3"), Card("万", "4"), Card("万", "6")])
+    index = hand.claim_index()
+    w5 = tile_id("万", "5")
+    assert index.chow_shapes[w5] == 0b011  # 34吃5、46吃5
+    assert index.chow_shapes[tile_id("万", "2")] == 0b100
+    assert index.chow_shapes[tile_id("万", "7")] == 0
+    assert not index.chow & _bit("筒", "5")
+
+def test_win_mask():
+    """测试听牌位图"""
+    hand = Hand([Card("万", r) for r in "1112345678999"])
+    assert hand.claim_index().win == sum(_bit("万", str(r)) for r in range(1, 10))
+    
+    hand = Hand([Card("万", r) for r in "123456789"] + [Card("筒", "1")] * 3 + [Card("条", "7")])
+    assert hand.claim_index().win == _bit("条", "7")
+
+def test_can_chow_from_previous_player_with_mixed_hand():
+    """测试吃上家的牌，手牌含其他花色时也可以吃"""
+    rule = TencentCommonRule()
+    players = [Player("上家"), Player("玩家"), Player("下家")]
+    upstream, player, downstream = players
+    player.previous_player, player.next_player = upstream, downstream
+    player.hand = [Card("万", "4"), Card("万", "6"), Card("筒", "1"), Card("风", "东")]
+    
+    assert rule.can_chow(player, Card("万", "5"), upstream)
+    assert not rule.can_chow(player, Card("万", "5"), downstream)
+    assert not rule.can_chow(player, Card("筒", "2"), upstream)
+    assert not rule.can_chow(player, Card("风", "东"), upstream)
+
+def test_can_pong_and_kong():
+    """测试碰杠判断"""
+    rule = TencentCommonRule()
+    player = Player("玩家")
+    other = Player("对手")
+    player.hand = [Card("箭", "中")] * 3 + [Card("万", "1")] * 2
+    
+    assert rule.can_pong(player, Card("箭", "中"), other)
+    assert rule.can_pong(player, Card("万", "1"), other)
+    assert rule.can_kong(player, Card("箭", "中"), other)
+    assert not rule.can_kong(player, Card("万", "1"), other)
+    assert not rule.can_kong(player, Card("箭", "中"), None)
+    player.hand.append(Card("箭", "中"))
+    assert rule.can_kong(player, Card("箭", "中"), None)
@@ -0,0 +1,112 @@
+import pytest
+from src.core.data.action import Action
+from src.core.data.card import Card
+from src.core.data.game_state import GameState
+from src.core.data.player import Player
+from src.core.logic.claim_resolver import ClaimResolver
+from src.core.logic.turn_handler import TurnHandler
+from src.rules.tencent_common.rule import TencentCommonRule
+
+NINE_GATES = [Card("万", r) for r in "1112345678999"]
+
+@pytest.fixture
+def game_state():
+    """创建四人对局"""
+    players = [Player(f"玩家{i}") for i in range(4)]
+    state = GameState(players, TencentCommonRule())
+    state.assign_seats()
+    for player in players:
+        player.hand = [Card("风", "东"), Card("箭", "白"), Card("条", "1"), Card("筒", "9")]
+    state.current_player = players[0]
+    state.game_stage = "playing"
+    return state
+
+def _discard(state, player, card):
+    """让玩家打出一张牌，返回打牌操作"""
+    action = Action("discard", card)
+    player.hand.append(card)
+    TurnHandler.execute_action(action, player, state)
+    return action
+
+def _accept_all(player, claim_type, card):
+    return True
+
+def test_no_claim(game_state):
+    """测试无人可以响应"""
+    action = _discard(game_state, game_state.players[0], Card("万", "5"))
+    assert ClaimResolver.resolve(game_state, action, _accept_all) == []
+
+def test_hu_beats_pong(game_state):
+    """测试胡牌优先于碰牌"""
+    p0, p1, _, p3 = game_state.players
+    p1.hand = [Card("万", "5"), Card("万", "5"), Card("风", "东")]
+    p3.hand = NINE_GATES
+    action = _discard(game_state, p0, Card("万", "5"))
+    
+    claims = ClaimResolver.resolve(game_state, action, _accept_all)
+    assert [(p, a.type) for p, a in claims] == [(p3, "hu")]
+    assert claims[0][1].from_player is p0
+
+def test_declined_hu_falls_back_to_pong(game_state):
+    """测试放弃胡牌后其他玩家可以碰"""
+    p0, p1, _, p3 = game_state.players
+    p1.hand = [Card("万", "5"), Card("万", "5"), Card("风", "东")]
+    p3.hand = NINE_GATES
+    action = _discard(game_state, p0, Card("万", "5"))
+    
+    claims = ClaimResolver.resolve(game_state, action, lambda p, t, c: t != "hu")
+    assert [(p, a.type) for p, a in claims] == [(p1, "pong")]
+
+def test_multiple_hu_policy(game_state):
+    """测试截胡与一炮多响"""
+    p0, _, p2, p3 = game_state.players
+    p2.hand = list(NINE_GATES)
+    p3.hand = list(NINE_GATES)
+    action = _discard(game_state, p0, Card("万", "5"))
+    
+    claims = ClaimResolver.resolve(game_state, action, _accept_all)
+    assert [p for p, _ in claims] == [p2]
+    
+    game_state.rule.multiple_hu_policy = "all"
+    claims = ClaimResolver.resolve(game_state, action, _accept_all)
+    assert [p for p, _ in claims] == [p2, p3]
+
+def test_kong_claim(game_state):
+    """测试明杠响应"""
+    p0, _, p2, _ = game_state.players
+    p2.hand = [Card("箭", "中")] * 3 + [Card("万", "1")]
+    action = _discard(game_state, p0, Card("箭", "中"))
+    
+    claims = ClaimResolver.resolve(game_state, action, _accept_all)
+    assert [(p, a.type) for p, a in claims] == [(p2, "kong")]
+
+def test_execute_claims_multiple_winners(game_state):
+    """测试一炮多响时所有赢家都得分"""
+    game_state.rule.multiple_hu_policy = "all"
+    p0, _, p2, p3 = game_state.players
+    p2.hand = list(NINE_GATES)
+    p3.hand = list(NINE_GATES)
+    action = _discard(game_state, p0, Card("万", "5"))
+    
+    claims = ClaimResolver.resolve(game_state, action, _accept_all)
+    TurnHandler.execute_claims(claims, game_state)
+    assert game_state.game_stage == "ended"
+    assert game_state.winners == [p2, p3]
+    assert game_state.winner is p2
+    assert len(p2.hand) == len(p3.hand) == 14
+    assert p2.score > 0 and p3.score > 0
+    assert not game_state.discard_pile
+
+def test_chow_only_from_previous_player(game_state):
+    """测试只有下家可以吃"""
+    p0, p1, p2, _ = game_state.players
+    p1.hand = [Card("万", "4"), Card("万", "6"), Card("筒", "1")]
+    p2.hand = [Card("万", "4"), Card("万", "6"), Card("筒", "1")]
+    action = _discard(game_state, p0, Card("万", "5"))
+    
+    claims = ClaimResolver.resolve(game_state, action, _accept_all)
+    assert [(p, a.type) for p, a in claims] == [(p1, "chow")]
+    
+    TurnHandler.execute_claims(claims, game_state)
+    assert [c.id for c in p1.melds[0].cards] == ["万4", "万5", "万6"]
+    assert game_state.current_player is p1
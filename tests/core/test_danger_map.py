@@ -0,0 +1,80 @@
+import random
+
+from src.core.data.danger_map import GENBUTSU_FACTOR, SUJI_FACTOR, DangerMap
+from src.ai.evaluation.risk_evaluator import RiskEvaluator
+from src.core.data.game_state import GameState
+from src.core.data.meld import Meld, MeldType
+from src.core.data.player import Player
+from src.core.data.tile import card_from_id
+from src.core.logic.deck_manager import DeckManager
+from src.core.logic.turn_handler import TurnHandler
+from src.rules.tencent_common.rule import TencentCommonRule
+
+def _state():
+    players = [Player(name) for name in ("东家", "南家", "西家", "北家")]
+    state = GameState(players, TencentCommonRule(), seed=3)
+    state.initialize_game()
+    return state
+
+def test_discard_marks_genbutsu_and_suji():
+    """测试打出4万后该座位4万为现物、1万和7万为筋牌，其他座位不受影响"""
+    state = _state()
+    south = state.players[1]
+    DeckManager.discard_card(state, card_from_id(3), south)
+    danger = state.danger_map.seat(1)
+    assert danger.danger(3) == GENBUTSU_FACTOR
+    assert danger.danger(0) == danger.danger(6) == SUJI_FACTOR
+    assert danger.danger(4) == 1.0
+    assert state.danger_map.seat(2).danger(3) == 1.0
+    assert state.discard_counts[3] == 1
+    DeckManager.take_discard(state)
+    assert state.discard_counts[3] == 0
+
+def test_meld_suit_tendency():
+    """测试面子集中在一个花色时该花色更危险、其他花色更安全"""
+    danger_map = DangerMap()
+    player = Player("南家")
+    player.seat = 1
+    for tile in (0, 4, 6):
+        danger_map.on_meld(player, Meld(MeldType.PONG, tile=tile))
+    danger = danger_map.seat(1)
+    assert danger.danger(1) > 1.0 > danger.danger(10)
+    assert danger.danger(10) == danger.danger(20)
+
+def test_danger_map_follows_play_and_clone():
+    """测试对局过程中的打牌都记录到对应座位，局面副本互不影响"""
+    random.seed(5)
+    state = _state()
+    for _ in range(30):
+        if state.game_stage != "playing":
+            break
+        TurnHandler.process_turn(state)
+    seats = state.danger_map.seats
+    assert sum(d.discards for d in seats.values()) >= len(state.discard_pile)
+    copy = state.clone()
+    DeckManager.discard_card(copy, card_from_id(33), copy.players[2])
+    assert copy.danger_map.seat(2).discards == state.danger_map.seat(2).discards + 1
+
+def test_risk_lower_for_safe_tiles():
+    """测试对全部对手都是现物的牌风险低于只是部分对手的现物"""
+    state = _state()
+    viewer = state.players[0]
+    for _ in range(40):
+        state.deck.draw_id()
+    for other in state.players[1:]:
+        DeckManager.discard_card(state, card_from_id(27), other)
+    for seat in (0, 1, 2):
+        DeckManager.discard_card(state, card_from_id(28), state.players[seat])
+    combined = state.danger_map.combined_danger
+    all_safe = combined(27, viewer, state.players, 0.25)
+    partly_safe = combined(28, viewer, state.players, 0.25)
+    assert 0 < all_safe < partly_safe < combined(29, viewer, state.players, 0.25)
+    # 西家之后打出的南风北家见过而没有胡
+    assert combined(28, viewer, state.players, 0.25, state.rivers) < partly_safe
+    
+    evaluator = RiskEvaluator(state.rule)
+    for tid in (27, 28):
+        expected = evaluator._calculate_card_probability(card_from_id(tid), viewer, state) \
+            * combined(tid, viewer, state.players, evaluator._game_progress(state),
+                       state.rivers) * 1.5
+        assert abs(evaluator.evaluate_card_risk(card_from_id(tid), viewer, state) - expected) < 1e-12
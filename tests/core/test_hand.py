@@ -0,0 +1,49 @@
+import copy
+import pickle
+from src.core.data.card import Card
+from src.core.data.hand import Hand
+from src.core.data.player import Player
+from src.core.data.tile import tile_id
+
+def test_counts_follow_list_operations():
+    """测试手牌计数随列表操作同步更新"""
+    hand = Hand([Card("万", "1"), Card("万", "1"), Card("筒", "5")])
+    w1 = tile_id("万", "1")
+    t5 = tile_id("筒", "5")
+    assert hand.counts[w1] == 2
+    
+    hand.append(Card("筒", "5"))
+    hand.remove(Card("万", "1"))
+    assert hand.counts[w1] == 1
+    assert hand.counts[t5] == 2
+    
+    hand.pop(0)
+    del hand[0]
+    hand.extend([Card("条", "9")])
+    hand[0] = Card("箭", "中")
+    assert sum(hand.counts) == len(hand) == 2
+    assert hand.count(Card("箭", "中")) == 1
+    assert Card("条", "9") in hand
+    assert Card("万", "1") not in hand
+
+def test_take_removes_by_tile_id():
+    """测试按编号取牌"""
+    hand = Hand([Card("万", "1"), Card("万", "2"), Card("万", "1")])
+    card = hand.take(tile_id("万", "1"))
+    assert card == Card("万", "1")
+    assert len(hand) == 2
+    assert hand.counts[tile_id("万", "1")] == 1
+
+def test_player_hand_assignment_wraps_list():
+    """测试给玩家手牌赋值普通列表时自动包装"""
+    player = Player("测试玩家")
+    player.hand = [Card("万", "3"), Card("万", "3")]
+    assert isinstance(player.hand, Hand)
+    assert player.hand.counts[tile_id("万", "3")] == 2
+
+def test_copy_and_pickle_keep_counts():
+    """测试复制和序列化后计数保持一致"""
+    hand = Hand([Card("万", "3"), Card("风", "东")])
+    for clone in (copy.deepcopy(hand), pickle.loads(pickle.dumps(hand))):
+        assert isinstance(clone, Hand)
+        assert clone.counts == hand.counts
@@ -0,0 +1,80 @@
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.core.utils import instrument
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    instrument.reset()
+    yield
+    instrument.reset()
+
+def test_disabled_returns_original(monkeypatch):
+    """测试未启用时装饰器原样返回函数"""
+    monkeypatch.setattr(instrument, "ENABLED", False)
+    def f(x):
+        return x
+    assert instrument.instrumented(f) is f
+    assert instrument.instrumented(site="test.f")(f) is f
+
+def test_enabled_records_calls(monkeypatch):
+    """测试启用时统计调用次数、耗时和直方图"""
+    monkeypatch.setattr(instrument, "ENABLED", True)
+    @instrument.instrumented(site="test.double")
+    def double(x):
+        """翻倍"""
+        return x * 2
+
+    assert [double(i) for i in range(5)] == [0, 2, 4, 6, 8]
+    assert double.__doc__ == "翻倍"
+    stats = instrument.snapshot()["test.double"]
+    assert stats["calls"] == 5
+    assert sum(stats["histogram"]) == 5
+    assert stats["max_us"] >= stats["mean_us"] >= 0
+
+    instrument.reset()
+    assert "test.double" not in instrument.snapshot()
+
+def test_exceptions_are_counted():
+    """测试抛出异常的调用同样被统计"""
+    def fail():
+        raise ValueError
+    wrapped = instrument.wrap(fail, "test.fail")
+    with pytest.raises(ValueError):
+        wrapped()
+    assert instrument.snapshot()["test.fail"]["calls"] == 1
+
+def test_dump_and_periodic():
+    """测试输出快照与定期输出"""
+    instrument.wrap(lambda: None, "test.noop")()
+    stream = io.StringIO()
+    instrument.dump(stream)
+    assert json.loads(stream.getvalue())["test.noop"]["calls"] == 1
+
+    stream = io.StringIO()
+    instrument.PeriodicDumper(0.01, stream).start().stop()
+    assert stream.getvalue().strip()
+
+def test_hot_paths_instrumented_when_enabled():
+    """测试通过环境变量启用后热点函数被埋点"""
+    code = (
+        "from src.core.logic.turn_handler import TurnHandler\n"
+        "from src.rules.tencent_common.hu_rules import TencentHuRules\n"
+        "from src.rules.tencent_common.score_rules import TencentScoreRules\n"
+        "from src.ai.evaluation.risk_evaluator import RiskEvaluator\n"
+        "from src.ai.strategy.advanced_strategy import AdvancedStrategy\n"
+        "fns = [TurnHandler.process_turn, TencentHuRules.can_hu, TencentScoreRules._calculate_fans,\n"
+        "       RiskEvaluator.evaluate_card_risk, AdvancedStrategy.recommend_discard]\n"
+        "print(all(hasattr(f, '__wrapped__') for f in fns))\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    for flag, expected in (("1", "True"), ("0", "False")):
+        env = dict(os.environ, MAHJONG_INSTRUMENT=flag)
+        out = subprocess.run([sys.executable, "-c", code], cwd=root, env=env,
+                             capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == expected
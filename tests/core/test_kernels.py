@@ -0,0 +1,71 @@
+import random
+
+import pytest
+from src.core.data.claim_index import ClaimIndex
+from src.core.tables import kernels
+from src.core.tables.lookup import is_standard_hu
+
+def py(fn):
+    """取得内核的纯Python版本"""
+    return getattr(fn, "py_func", fn)
+
+def counts_of(tiles):
+    counts = [0] * 34
+    for t in tiles:
+        counts[t] += 1
+    return counts
+
+def random_hands(n, size, seed, tiles=range(34)):
+    rng = random.Random(seed)
+    wall = [t for t in tiles for _ in range(4)]
+    for _ in range(n):
+        rng.shuffle(wall)
+        yield counts_of(wall[:size])
+
+@pytest.mark.parametrize("tiles", [range(34), range(9)])
+def test_standard_hu_matches_tables(tiles):
+    """测试标准胡牌判定与查找表一致"""
+    for counts in random_hands(300, 14, seed=1, tiles=tiles):
+        assert py(kernels.is_standard_hu)(counts) == is_standard_hu(counts)
+    nine_gates = counts_of([0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 8, 8, 4])
+    assert kernels.is_standard_hu(kernels.as_counts(nine_gates))
+
+def test_special_hands():
+    """测试七对与十三幺"""
+    seven_pairs = counts_of([t for t in (0, 4, 9, 13, 20, 27, 33) for _ in range(2)])
+    assert py(kernels.is_seven_pairs)(seven_pairs)
+    assert not py(kernels.is_seven_pairs)(counts_of([0] * 4 + [t for t in (4, 9, 13, 20, 27) for _ in range(2)]))
+    orphans = counts_of(list(kernels.ORPHANS) + [33])
+    assert py(kernels.is_thirteen_orphans)(orphans)
+    assert not py(kernels.is_thirteen_orphans)(counts_of(list(kernels.ORPHANS[:-1]) + [33, 1]))
+
+def test_waiting_mask():
+    """测试听牌位图与ClaimIndex一致，并包含七对的听牌"""
+    for counts in random_hands(200, 13, seed=2, tiles=range(18)):
+        assert py(kernels.waiting_mask)(counts, False) == ClaimIndex._win_mask(counts)
+    six_pairs = counts_of([t for t in (0, 4, 9, 13, 20, 27) for _ in range(2)] + [33])
+    assert py(kernels.waiting_mask)(six_pairs, True) == 1 << 33
+
+@pytest.mark.parametrize("tiles,seed,n", [(range(34), 3, 60), (range(9), 4, 10), (range(18), 5, 30)])
+def test_shanten_implementations_agree(tiles, seed, n):
+    """测试两种向听数实现结果一致"""
+    for size in (14, 13, 11, 8):
+        for counts in random_hands(n, size, seed, tiles):
+            declared = (14 - size) // 3
+            assert kernels._shanten_python(counts, declared) == py(kernels._shanten_kernel)(counts, declared)
+
+def test_shanten_values():
+    """测试典型手牌的向听数"""
+    nine_gates = counts_of([0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 8, 8])
+    assert kernels.shanten(kernels.as_counts(nine_gates), 0) == 0
+    nine_gates[4] += 1
+    assert kernels.shanten(kernels.as_counts(nine_gates), 0) == -1
+    seven_pairs = counts_of([t for t in (0, 4, 9, 13, 20, 27, 33) for _ in range(2)])
+    assert kernels.shanten(kernels.as_counts(seven_pairs), 0) == -1
+    assert kernels.shanten(kernels.as_counts(counts_of(list(kernels.ORPHANS))), 0) == 0
+    assert kernels.shanten(kernels.as_counts(counts_of([0, 1, 2, 9, 10, 11, 5, 5])), 2) == -1
+    # 向听数为0的手牌一定有听牌
+    for counts in random_hands(200, 13, seed=6, tiles=range(9)):
+        counts = kernels.as_counts(counts)
+        if kernels.waiting_mask(counts, True):
+            assert kernels.shanten(counts, 0) == 0
@@ -0,0 +1,57 @@
+import pytest
+from src.core.data.card import Card
+from src.core.data.meld import Meld, MeldList, MeldType
+from src.core.data.player import Player
+
+def test_meld_record():
+    """测试面子只记录类型和基准牌"""
+    meld = Meld("顺子", [Card("条", "5"), Card("条", "3"), Card("条", "4")])
+    assert meld.type == MeldType.CHOW and meld.type.label == "顺子"
+    assert meld.tile == 20
+    assert [c.id for c in meld.cards] == ["条3", "条4", "条5"]
+    assert len(Meld(MeldType.AN_GANG, tile=31)) == 4
+    assert not hasattr(meld, "__dict__")
+    with pytest.raises(ValueError):
+        MeldType.parse("七对")
+
+def test_source_seat():
+    """测试记录来源座位"""
+    source = Player("上家")
+    source.seat = 3
+    assert Meld(Meld.PONG, tile=0, from_player=source).from_seat == 3
+    assert Meld(Meld.AN_GANG, tile=0).from_seat == -1
+
+def test_counters_follow_changes():
+    """测试增删和补杠时汇总计数随之更新"""
+    melds = MeldList()
+    pong = Meld(Meld.PONG, tile=4)
+    melds.append(pong)
+    melds.append(Meld(Meld.AN_GANG, tile=27))
+    melds.append(Meld(Meld.CHOW, tile=9))
+    assert melds.has_pung(4) and melds.has_pung(27) and not melds.has_pung(9)
+    assert (melds.kongs, melds.concealed_kongs, melds.concealed_pungs, melds.open_melds) == (1, 1, 1, 2)
+    assert melds.counts[4] == 3 and melds.counts[27] == 4 and melds.counts[10] == 1
+
+    melds.upgrade(pong, Meld.MING_GANG)
+    assert melds.find(Meld.MING_GANG, 4) is pong
+    assert (melds.kongs, melds.exposed_kongs, melds.counts[4]) == (2, 1, 4)
+
+    melds.remove(pong)
+    assert not melds.has_pung(4) and melds.counts[4] == 0 and melds.kongs == 1
+    melds.clear()
+    assert melds.open_melds == 0 and melds.pung_mask == 0
+
+def test_player_wraps_melds():
+    """测试玩家的面子列表自动包装，兼容只有type和cards的面子对象"""
+    class PlainMeld:
+        def __init__(self, type, cards):
+            self.type = type
+            self.cards = cards
+    player = Player("测试玩家")
+    player.melds = [PlainMeld("暗刻", [Card("万", "1")] * 3), PlainMeld("暗杠", [Card("箭", "中")] * 4)]
+    assert isinstance(player.melds, MeldList)
+    assert player.melds.concealed_pungs == 2
+    assert player.melds.has_pung(31)
+    copy = player.clone()
+    assert [(m.type, m.tile) for m in copy.melds] == [(MeldType.AN_KE, 0), (MeldType.AN_GANG, 31)]
+    assert copy.melds.concealed_pungs == 2
@@ -0,0 +1,51 @@
+import random
+
+from src.core.data.game_state import GameState
+from src.core.data.player import Player
+from src.core.data.river import DiscardRivers
+from src.core.data.tile import card_from_id
+from src.core.logic.deck_manager import DeckManager
+from src.core.logic.turn_handler import TurnHandler
+
+def test_river_records_owner_turn_and_call():
+    """测试弃牌河记录打牌的座位、序号和是否被取走"""
+    players = [Player(name) for name in ("东家", "南家", "西家")]
+    state = GameState(players)
+    state.assign_seats()
+    DeckManager.discard_card(state, card_from_id(5), players[0])
+    DeckManager.discard_card(state, card_from_id(27), players[1])
+    DeckManager.take_discard(state)
+    DeckManager.discard_card(state, card_from_id(5), players[1])
+    assert list(state.rivers[0]) == [(5, 0, False)]
+    assert list(state.rivers[1]) == [(27, 1, True), (5, 2, False)]
+    assert state.rivers[1].has_discarded(27) and not state.rivers[0].has_discarded(27)
+    assert state.rivers[1].counts[5] == 1
+    assert state.rivers[1].last_turn == 2
+
+def test_passed_tiles():
+    """测试对手上次打牌后别人打出的牌记为见过而没有胡"""
+    rivers = DiscardRivers()
+    rivers.record(0, 3)
+    rivers.record(1, 8)
+    rivers.record(2, 3)
+    assert rivers.passed(0, 3) and rivers.passed(0, 8) and rivers.passed(1, 3)
+    assert not rivers.passed(1, 8)      # 自己打的牌
+    assert not rivers.passed(2, 3)
+    assert not rivers.passed(3, 3)      # 还没打过牌
+    rivers.record(0, 20)
+    assert not rivers.passed(0, 3)      # 之后手牌已经变化
+
+def test_rivers_match_discard_pile_during_play():
+    """测试对局过程中各座位弃牌河中未被取走的牌与弃牌堆一致"""
+    random.seed(9)
+    players = [Player(name) for name in ("东家", "南家", "西家", "北家")]
+    state = GameState(players, seed=9)
+    state.initialize_game()
+    while state.game_stage == "playing":
+        TurnHandler.process_turn(state)
+    entries = sorted((turn, tid) for river in state.rivers.rivers.values()
+                     for tid, turn, called in river if not called)
+    assert [tid for _, tid in entries] == [c.tile_id for c in state.discard_pile]
+    copy = state.clone()
+    copy.rivers.record(0, 1)
+    assert len(copy.rivers[0]) == len(state.rivers[0]) + 1
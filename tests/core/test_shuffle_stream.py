@@ -0,0 +1,32 @@
+from src.core.data.game_state import GameState
+from src.core.data.player import Player
+from src.core.data.tile import to_counts
+from src.core.logic.shuffle_stream import ShuffleStream
+from src.rules.tencent_common.rule import TencentCommonRule
+
+def test_stream_is_deterministic_permutations():
+    """测试排列可复现，且每个都是初始牌组的置换"""
+    tiles = TencentCommonRule().initial_tile_ids()
+    a = ShuffleStream(tiles, block_size=4, seed=9)
+    b = ShuffleStream(tiles, block_size=4, seed=9)
+    perms = [a.next() for _ in range(10)]  # 跨越多个块
+    assert perms == [next(b) for _ in range(10)]
+    assert len(set(perms)) == 10
+    assert all(sorted(p) == sorted(tiles) for p in perms)
+
+def test_initialize_game_with_permutation():
+    """测试按排列整段发牌"""
+    rule = TencentCommonRule()
+    permutation = ShuffleStream(rule.initial_tile_ids(), seed=1).next()
+    players = [Player(str(i)) for i in range(4)]
+    state = GameState(players, rule)
+    state.initialize_game(permutation)
+
+    # 第一位玩家的手牌为排列末尾的13张（补花前）
+    first = list(permutation[-13:])
+    flowers = [t for t in first if t >= 34]
+    hand = to_counts(players[0].hand)
+    for tid in set(first) - set(flowers):
+        assert hand[tid] >= first.count(tid)
+    assert all(len(p.hand) == 13 for p in players)
+    assert sum(len(p.hand) + len(p.hua_cards) for p in players) + len(state.deck) == 144
@@ -0,0 +1,103 @@
+import struct
+
+import pytest
+from src.core.data.card import Card
+from src.core.data.tile import to_counts
+from src.core.tables import store
+from src.core.tables.builder import build_tables
+from src.core.tables.lookup import is_standard_hu
+
+@pytest.fixture
+def table_file(tmp_path, monkeypatch):
+    """在临时目录中构建查找表"""
+    path = str(tmp_path / "tables.bin")
+    monkeypatch.setenv(store.ENV_PATH, path)
+    store.reset()
+    yield path
+    store.reset()
+
+def _counts(spec):
+    """将 "万123 筒55" 形式的描述转换为计数数组"""
+    cards = []
+    for group in spec.split():
+        cards.extend(Card(group[0], rank) for rank in group[1:])
+    return to_counts(cards)
+
+def test_build_and_load(table_file):
+    """测试构建后可以加载并校验"""
+    build_tables(table_file)
+    loaded = store.TableStore(table_file)
+    assert sorted(loaded.names()) == ["honor_hu", "suit_hu"]
+    assert len(loaded.get("suit_hu")) == 5 ** 9
+    assert len(loaded.get("honor_hu")) == 5 ** 7
+    loaded.close()
+
+def test_lazy_build_on_first_use(table_file):
+    """测试首次访问时自动构建表文件"""
+    import os
+    assert not os.path.exists(table_file)
+    assert is_standard_hu(_counts("万123456789 筒111 条22"))
+    assert os.path.exists(table_file)
+
+def test_checksum_mismatch_detected(table_file):
+    """测试数据损坏时校验失败"""
+    build_tables(table_file)
+    loaded = store.TableStore(table_file)
+    offset = loaded._entries["suit_hu"][0]
+    loaded.close()
+    with open(table_file, "r+b") as f:
+        f.seek(offset + 12345)
+        byte = f.read(1)
+        f.seek(offset + 12345)
+        f.write(bytes([byte[0] ^ 0xFF]))
+    
+    corrupted = store.TableStore(table_file)
+    with pytest.raises(ValueError):
+        corrupted.get("suit_hu")
+    corrupted.close()
+    
+    # 通过get_table访问时会自动重建
+    assert is_standard_hu(_counts("万123456789 筒111 条22"))
+
+def test_version_mismatch_rejected(table_file):
+    """测试版本不匹配时拒绝加载"""
+    build_tables(table_file)
+    with open(table_file, "r+b") as f:
+        f.seek(4)
+        f.write((store.VERSION + 1).to_bytes(2, "little"))
+    with pytest.raises(ValueError):
+        store.TableStore(table_file)
+
+def test_truncated_header_rebuilt(table_file):
+    """测试头部被截断的文件：直接打开时报错，通过get_table访问时自动重建"""
+    with open(table_file, "wb") as f:
+        f.write(store.MAGIC[:3])
+    with pytest.raises(struct.error):
+        store.TableStore(table_file)
+    assert is_standard_hu(_counts("万123456789 筒111 条22"))
+
+def test_truncated_directory_rebuilt(table_file):
+    """测试目录被截断的文件：直接打开时报错，通过get_table访问时自动重建"""
+    build_tables(table_file)
+    with open(table_file, "r+b") as f:
+        f.truncate(store.HEADER.size + store.ENTRY.size // 2)
+    with pytest.raises(struct.error):
+        store.TableStore(table_file)
+    assert is_standard_hu(_counts("万123456789 筒111 条22"))
+    rebuilt = store.TableStore(table_file)
+    assert len(rebuilt.names()) == 2
+    rebuilt.close()
+
+def test_is_standard_hu(table_file):
+    """测试查表胡牌判定"""
+    assert is_standard_hu(_counts("万123456789 筒111 条22"))
+    assert is_standard_hu(_counts("万111222333 筒99 风东东东"))
+    assert is_standard_hu(_counts("万1112345678999 万5"))
+    assert is_standard_hu(_counts("箭中中"))
+    assert not is_standard_hu(_counts("万123456789 筒112 条22"))
+    assert not is_standard_hu(_counts("万11 筒22 条33 风东东 箭中中 万55 筒77"))  # 七对不是标准型
+    assert not is_standard_hu(_counts("风东南西 万11"))
+    assert not is_standard_hu(_counts("万11 筒22"))
+    over = _counts("万123456789 筒111 条22")
+    over[8] = 5
+    assert not is_standard_hu(over)  # 超过4张时不越界
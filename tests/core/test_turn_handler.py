@@ -0,0 +1,157 @@
+import pytest
+from src.core.data.action import Action
+from src.core.data.card import Card
+from src.core.data.game_state import GameState
+from src.core.data.meld import Meld
+from src.core.data.player import Player
+from src.core.data.tile import tile_id
+from src.core.logic.turn_handler import TurnHandler
+from src.rules.tencent_common.rule import TencentCommonRule
+
+@pytest.fixture
+def game_state():
+    """创建四人对局，牌墙为固定内容"""
+    players = [Player(f"玩家{i}") for i in range(4)]
+    state = GameState(players, TencentCommonRule())
+    state.assign_seats()
+    state.deck = [Card("条", "1"), Card("条", "2"), Card("条", "3"), Card("条", "4")]
+    state.current_player = players[0]
+    state.game_stage = "playing"
+    return state
+
+def _discard(state, player, card):
+    """让玩家打出一张牌"""
+    player.hand.append(card)
+    TurnHandler.execute_action(Action("discard", card), player, state)
+
+def test_discard(game_state):
+    """测试打牌"""
+    p0 = game_state.players[0]
+    p0.hand = [Card("万", "1"), Card("万", "2")]
+    TurnHandler.execute_action(Action("discard", Card("万", "1")), p0, game_state)
+    assert game_state.discard_pile == [Card("万", "1")]
+    assert game_state.last_discarded_card.from_player is p0
+    assert game_state.last_discarded_card.seat == p0.seat
+    assert p0.hand.counts[tile_id("万", "1")] == 0
+
+def test_chow(game_state):
+    """测试吃上家的牌"""
+    p0, p1 = game_state.players[0], game_state.players[1]
+    p1.hand = [Card("万", "4"), Card("万", "6"), Card("筒", "1")]
+    _discard(game_state, p0, Card("万", "5"))
+    
+    TurnHandler.execute_action(Action("chow", Card("万", "5"), p0), p1, game_state)
+    
+    assert [c.id for c in p1.melds[0].cards] == ["万4", "万5", "万6"]
+    assert p1.melds[0].type == Meld.CHOW
+    assert p1.melds[0].from_player is p0
+    assert list(p1.hand) == [Card("筒", "1")]
+    assert not game_state.discard_pile
+    assert game_state.current_player is p1
+    assert game_state.must_discard
+
+def test_chow_with_chosen_partners(game_state):
+    """测试吃牌时指定搭子"""
+    p0, p1 = game_state.players[0], game_state.players[1]
+    p1.hand = [Card("万", "3"), Card("万", "4"), Card("万", "6"), Card("万", "7")]
+    _discard(game_state, p0, Card("万", "5"))
+    
+    action = Action("chow", Card("万", "5"), p0, cards=[Card("万", "6"), Card("万", "7")])
+    TurnHandler.execute_action(action, p1, game_state)
+    assert [c.id for c in p1.melds[0].cards] == ["万5", "万6", "万7"]
+    assert sorted(c.id for c in p1.hand) == ["万3", "万4"]
+
+def test_pong(game_state):
+    """测试碰牌"""
+    p0, p2 = game_state.players[0], game_state.players[2]
+    p2.hand = [Card("箭", "中"), Card("箭", "中"), Card("万", "1")]
+    _discard(game_state, p0, Card("箭", "中"))
+    
+    TurnHandler.execute_action(Action("pong", Card("箭", "中"), p0), p2, game_state)
+    
+    assert p2.melds[0].type == Meld.PONG
+    assert len(p2.melds[0].cards) == 3
+    assert p2.hand.counts[tile_id("箭", "中")] == 0
+    assert game_state.current_player is p2
+    assert game_state.last_discarded_card is None
+
+def test_ming_gang_draws_replacement_and_inherits_gang_count(game_state):
+    """测试明杠后补牌，并继承打出者的连杠次数（接杠）"""
+    p0, p3 = game_state.players[0], game_state.players[3]
+    p0.consecutive_gang_count = 1
+    p3.hand = [Card("风", "东")] * 3
+    _discard(game_state, p0, Card("风", "东"))
+    
+    TurnHandler.execute_action(Action("kong", Card("风", "东"), p0), p3, game_state)
+    
+    assert p3.melds[0].type == Meld.MING_GANG
+    assert len(p3.melds[0].cards) == 4
+    assert p3.last_action == "明杠"
+    assert p3.consecutive_gang_count == 2
+    # 补牌来自牌墙另一端
+    assert p3.drawn_card == Card("条", "1")
+    assert len(game_state.deck) == 3
+
+def test_an_gang(game_state):
+    """测试暗杠"""
+    p0 = game_state.players[0]
+    p0.hand = [Card("万", "9")] * 4 + [Card("万", "1")]
+    
+    TurnHandler.execute_action(Action("kong", Card("万", "9")), p0, game_state)
+    
+    assert p0.melds[0].type == Meld.AN_GANG
+    assert p0.melds[0].from_player is None
+    assert list(p0.hand) == [Card("万", "1")]
+    assert p0.consecutive_gang_count == 1
+    assert p0.drawn_card == Card("条", "1")
+
+def test_bu_gang_upgrades_pong(game_state):
+    """测试补杠把明刻升级为明杠"""
+    p0, p1 = game_state.players[0], game_state.players[1]
+    p1.melds = [Meld(Meld.PONG, [Card("筒", "2")] * 3, p0)]
+    p1.hand = [Card("筒", "2"), Card("万", "1")]
+    
+    TurnHandler.execute_action(Action("kong", Card("筒", "2")), p1, game_state)
+    
+    assert p1.melds[0].type == Meld.MING_GANG
+    assert len(p1.melds[0].cards) == 4
+    assert p1.last_action == "补杠"
+    assert list(p1.hand) == [Card("万", "1")]
+
+def test_invalid_kong_rejected(game_state):
+    """测试无法杠牌时报错"""
+    p0 = game_state.players[0]
+    p0.hand = [Card("万", "9")] * 2
+    with pytest.raises(ValueError):
+        TurnHandler.execute_action(Action("kong", Card("万", "9")), p0, game_state)
+
+def test_replacement_draw_replaces_flowers(game_state):
+    """测试杠后补到花牌时继续补花"""
+    p0 = game_state.players[0]
+    game_state.deck = [Card("花", "梅"), Card("条", "5")]
+    p0.hand = [Card("万", "9")] * 4
+    
+    TurnHandler.execute_action(Action("kong", Card("万", "9")), p0, game_state)
+    
+    assert p0.hua_cards == [Card("花", "梅")]
+    assert p0.drawn_card == Card("条", "5")
+
+def test_process_turn_plays_full_game():
+    """测试AI对局可以完整进行到结束"""
+    import random
+    from src.ai.strategy.advanced_strategy import AdvancedStrategy
+    from src.core.logic.turn_handler import init_game
+    
+    random.seed(7)
+    state = init_game("tencent_common", [{"name": f"玩家{i}", "is_ai": True} for i in range(4)])
+    for player in state.players:
+        player.ai_strategy = AdvancedStrategy(state.rule)
+    
+    for _ in range(200):
+        if state.game_stage != "playing":
+            break
+        TurnHandler.process_turn(state)
+        for player in state.players:
+            assert sum(player.hand.counts) == len(player.hand)
+            assert not any(card.suit == "花" for card in player.hand)
+    assert state.game_stage == "ended"
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+from src.core.data.card import Card
+from src.core.data.game_state import GameState
+from src.core.data.player import Player
+from src.core.data.wall import Wall
+from src.core.logic.deck_manager import DeckManager
+from src.rules.tencent_common.rule import TencentCommonRule
+
+def test_draw_from_both_ends():
+    """测试摸牌从尾端、补牌从另一端"""
+    wall = Wall.from_cards([Card("万", "1"), Card("万", "2"), Card("万", "3")])
+    assert len(wall) == 3
+    assert wall.draw() == Card("万", "3")
+    assert wall.draw_replacement() == Card("万", "1")
+    assert len(wall) == 1 and wall
+    assert wall.pop() == Card("万", "2")
+    assert not wall
+    assert wall.draw() is None and wall.draw_replacement() is None
+    assert wall.draw_id() == -1
+    with pytest.raises(IndexError):
+        wall.pop()
+
+def test_shuffle_is_seeded_permutation():
+    """测试洗牌是对剩余牌的原地置换，且由随机数生成器决定"""
+    deck = TencentCommonRule().create_initial_deck()
+    a = Wall.from_cards(deck)
+    b = Wall.from_cards(deck)
+    a.draw_replacement()
+    a.shuffle(random.Random(5))
+    b.draw_replacement()
+    b.shuffle(random.Random(5))
+    assert a.tiles == b.tiles
+    assert a.tiles[0] == Wall.from_cards(deck).tiles[0]  # 已补出的牌不参与洗牌
+    assert sorted(a.tiles) == sorted(Wall.from_cards(deck).tiles)
+
+def test_snapshot_restore():
+    """测试快照与恢复"""
+    wall = Wall(range(10))
+    wall.draw()
+    wall.draw_replacement()
+    snapshot = wall.snapshot()
+    copy = Wall.restore(snapshot)
+    assert [c.tile_id for c in copy] == list(range(1, 9))
+    wall.draw()
+    assert len(copy) == 8 and len(wall) == 7
+
+def test_game_state_uses_wall():
+    """测试游戏状态的牌墙自动包装并使用本局随机数生成器"""
+    state = GameState(seed=3)
+    state.deck = [Card("条", "1"), Card("条", "2")]
+    assert isinstance(state.deck, Wall)
+    assert DeckManager.draw_card(state) == Card("条", "2")
+    assert DeckManager.draw_replacement_card(state) == Card("条", "1")
+    assert DeckManager.draw_card(state) is None
+
+    hands = []
+    for _ in range(2):
+        state = GameState([Player(str(i)) for i in range(4)], TencentCommonRule(), seed=11)
+        state.initialize_game()
+        hands.append([list(p.hand) for p in state.players])
+    assert hands[0] == hands[1]
+    assert len(state.deck) + sum(len(p.hand) + len(p.hua_cards) for p in state.players) == 144
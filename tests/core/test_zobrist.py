@@ -0,0 +1,86 @@
+import random
+
+from src.core.data.game_state import GameState
+from src.core.data.hand import Hand
+from src.core.data.meld import Meld, MeldList, MeldType
+from src.core.data.player import Player
+from src.core.data.tile import card_from_id
+from src.core.logic.deck_manager import DeckManager
+from src.core.logic.turn_handler import TurnHandler
+
+def cards(*tids):
+    return [card_from_id(t) for t in tids]
+
+def test_hand_hash_is_order_independent():
+    """测试手牌哈希与顺序无关，增删后与重新构造一致"""
+    hand = Hand(cards(0, 0, 5, 9, 33))
+    assert hand.zobrist == Hand(cards(33, 9, 0, 5, 0)).zobrist
+    before = hand.zobrist
+    hand.append(card_from_id(5))
+    assert hand.zobrist != before
+    assert hand.zobrist == Hand(cards(0, 0, 5, 5, 9, 33)).zobrist
+    hand.take(5)
+    assert hand.zobrist == before
+    hand[0] = card_from_id(1)
+    assert hand.zobrist == Hand(cards(1, 0, 5, 9, 33)).zobrist
+    hand.clear()
+    assert hand.zobrist == Hand().zobrist == 0
+
+def test_meld_hash_handles_duplicates_and_upgrade():
+    """测试相同面子不会相互抵消，补杠后与直接构造一致"""
+    chow = lambda: Meld(MeldType.CHOW, tile=0)
+    melds = MeldList([chow()])
+    melds.append(chow())
+    assert melds.zobrist not in (0, MeldList([chow()]).zobrist)
+    assert melds.zobrist == MeldList([chow(), chow()]).zobrist
+    melds.pop(0)
+    assert melds.zobrist == MeldList([chow()]).zobrist
+
+    pong = Meld(MeldType.PONG, tile=27)
+    melds.append(pong)
+    melds.upgrade(pong, MeldType.MING_GANG)
+    assert melds.zobrist == MeldList([chow(), Meld(MeldType.MING_GANG, tile=27)]).zobrist
+
+def test_discard_hash_tracks_pile():
+    """测试打出和取走弃牌时增量更新，与赋值重新计算一致"""
+    state = GameState()
+    for tid in (3, 3, 30):
+        DeckManager.discard_card(state, card_from_id(tid))
+    taken = DeckManager.take_discard(state)
+    assert taken.tile_id == 30
+    incremental = state.discard_hash
+    state.discard_pile = cards(3, 3)
+    assert state.discard_hash == incremental
+
+def _recomputed(state):
+    """从头重新构造各部分后计算的局面哈希"""
+    for player in state.players:
+        player.hand = Hand(list(player.hand))
+        player.melds = MeldList(list(player.melds))
+    state.discard_pile = list(state.discard_pile)
+    return state.zobrist
+
+def test_state_hash_matches_recomputation_during_play():
+    """测试对局过程中增量维护的局面哈希与重新计算一致"""
+    random.seed(7)
+    players = [Player(name) for name in ("东家", "南家", "西家", "北家")]
+    state = GameState(players, seed=7)
+    state.initialize_game()
+    seen = set()
+    while state.game_stage == "playing":
+        TurnHandler.process_turn(state)
+        incremental = state.zobrist
+        assert _recomputed(state) == incremental
+        seen.add(incremental)
+    assert len(seen) > 10
+
+def test_state_hash_depends_on_seat():
+    """测试交换两名玩家的手牌后局面哈希不同"""
+    players = [Player("甲"), Player("乙")]
+    state = GameState(players)
+    state.assign_seats()
+    players[0].hand = cards(0, 1, 2)
+    players[1].hand = cards(27, 28, 29)
+    before = state.zobrist
+    players[0].hand, players[1].hand = players[1].hand, players[0].hand
+    assert state.zobrist != before
@@ -0,0 +1,39 @@
+from src.core.data.action import Action
+from src.core.data.player import Player
+from src.core.data.tile import card_from_id
+from src.core.logic.turn_handler import TurnHandler
+from src.interface.game_api import get_claim_input, get_player_input
+
+def _reader(*lines):
+    """按顺序返回给定的输入，用完后视为EOF"""
+    lines = list(lines)
+
+    def read(prompt=""):
+        if not lines:
+            raise EOFError
+        return lines.pop(0)
+    return read
+
+def _player():
+    player = Player("玩家", is_ai=False)
+    player.hand = [card_from_id(t) for t in (0, 0, 0, 0, 5, 9)]
+    player.drawn_card = card_from_id(9)
+    return player
+
+def test_player_input_discard_and_kong():
+    """测试按序号打牌、g 序号杠牌，无效输入重新询问"""
+    player = _player()
+    action = get_player_input(player, None, [Action.DISCARD], _reader("9", "g 0", "4"))
+    assert action.op == Action.DISCARD and action.tile == 5
+    action = get_player_input(player, None, [Action.DISCARD, Action.KONG], _reader("g 4", "g 0"))
+    assert action.op == Action.KONG and action.tile == 0
+    assert get_player_input(player, None, [Action.DISCARD], _reader()).tile == 9   # EOF时摸切
+
+def test_claim_input_through_turn_handler(monkeypatch):
+    """测试人类玩家的响应通过TurnHandler.decide_claim询问"""
+    player = _player()
+    assert get_claim_input(player, None, "pong", card_from_id(5), _reader("x", "y")) is True
+    assert get_claim_input(player, None, "pong", card_from_id(5), _reader()) is False
+
+    monkeypatch.setattr('builtins.input', _reader("n"))
+    assert TurnHandler.decide_claim(player, None, "pong", card_from_id(5)) is False
@@ -0,0 +1,108 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.bench_server import new_tables
+from src.core.data.action import Action
+from src.core.data.decision import DecisionRequest
+from src.core.data.player import Player
+from src.core.data.tile import card_from_id
+from src.core.logic.turn_handler import TurnHandler
+from src.interface.table_host import TableHost, default_reply, parse_reply
+from src.interface.transport import Transport, local_socket_pair, run_scripted_client, tsumogiri
+
+def _host_with_client(states, respond, **kwargs):
+    """在本地socket对上运行桌台，返回TableHost"""
+    async def main():
+        transport, reader, writer = await local_socket_pair()
+        client = asyncio.ensure_future(run_scripted_client(reader, writer, respond))
+        host = TableHost(transport, **kwargs)
+        try:
+            await host.run(states, concurrency=4)
+        finally:
+            await transport.close()
+            writer.close()
+            client.cancel()
+        return host
+    return asyncio.run(main())
+
+def test_ai_tables_complete():
+    """测试全部为AI的桌台并发运行直到结束"""
+    states = new_tables(6, seed=3, human_seat=None)
+    host = TableHost()
+    asyncio.run(host.run(states))
+    assert all(state.game_stage == "ended" for state in states)
+    metrics = host.metrics()
+    assert metrics['tables'] == 6
+    assert metrics['moves'] > 0 and metrics['timeouts'] == 0
+    assert metrics['p50_ms'] <= metrics['p99_ms']
+
+def test_human_seat_over_socket():
+    """测试人类座位通过本地socket回复"""
+    states = new_tables(4, seed=4)
+    host = _host_with_client(states, tsumogiri, move_timeout=5)
+    assert all(state.game_stage == "ended" for state in states)
+    assert host.timeouts == 0 and host.invalid == 0
+
+def test_silent_client_times_out():
+    """测试客户端不回复时超时并使用默认操作，对局照常结束"""
+    states = new_tables(1, seed=5)
+    host = _host_with_client(states, lambda message: None, move_timeout=0.001)
+    assert states[0].game_stage == "ended"
+    assert host.timeouts > 0
+
+def test_invalid_reply_uses_default():
+    """测试无效回复计数并使用默认操作"""
+    states = new_tables(2, seed=6)
+    host = _host_with_client(states, lambda message: {'op': Action.DISCARD, 'tile': 99}, move_timeout=5)
+    assert all(state.game_stage == "ended" for state in states)
+    assert host.invalid > 0 and host.timeouts == 0
+
+def test_connection_error_uses_default():
+    """测试连接出错时使用默认操作，其他桌台不受影响"""
+    class BrokenTransport(Transport):
+        async def request(self, table_id, request):
+            raise ConnectionError("连接已关闭")
+
+    states = new_tables(3, seed=8)
+    host = TableHost(BrokenTransport(), move_timeout=5)
+    asyncio.run(host.run(states))
+    assert all(state.game_stage == "ended" for state in states)
+    assert host.metrics()['errors'] > 0 and host.timeouts == 0
+
+def test_offload_to_executor():
+    """测试AI决策交给线程池计算，任务只拿到局面副本"""
+    states = new_tables(3, seed=7, human_seat=None)
+    seen = []
+    original = TurnHandler.answer
+
+    def answer(request, game_state):
+        if request.kind == DecisionRequest.ACTION:
+            seen.append(game_state)
+        return original(request, game_state)
+
+    TurnHandler.answer = staticmethod(answer)
+    try:
+        with ThreadPoolExecutor(2) as executor:
+            host = TableHost(executor=executor, offload=lambda request: request.kind == DecisionRequest.ACTION)
+            asyncio.run(host.run(states))
+    finally:
+        TurnHandler.answer = staticmethod(original)
+    assert all(state.game_stage == "ended" for state in states)
+    assert seen and not any(state in states for state in seen)
+
+def test_parse_reply():
+    """测试回复校验：只能打出手牌中的牌，杠需要四张"""
+    player = Player("玩家", is_ai=False)
+    player.hand = [card_from_id(t) for t in (0, 0, 0, 0, 5, 9)]
+    player.drawn_card = card_from_id(9)
+    request = DecisionRequest(DecisionRequest.ACTION, player, [Action.DISCARD, Action.KONG])
+    assert parse_reply(request, {'op': Action.DISCARD, 'tile': 5}).tile == 5
+    assert parse_reply(request, {'op': Action.DISCARD, 'tile': 6}) is None
+    assert parse_reply(request, {'op': Action.KONG, 'tile': 0}).op == Action.KONG
+    assert parse_reply(request, {'op': Action.KONG, 'tile': 5}) is None
+    assert default_reply(request).tile == 9
+
+    claim = DecisionRequest(DecisionRequest.CLAIM, player, claim_type="pong", card=card_from_id(5))
+    assert parse_reply(claim, {'claim': True}) is True
+    assert parse_reply(claim, {'claim': 'yes'}) is None
+    assert default_reply(claim) is False
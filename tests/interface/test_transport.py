@@ -0,0 +1,51 @@
+import asyncio
+import json
+
+import pytest
+
+from src.core.data.decision import DecisionRequest
+from src.core.data.player import Player
+from src.core.data.tile import card_from_id
+from src.interface.transport import local_socket_pair
+
+def _claim_request():
+    player = Player("玩家", is_ai=False)
+    player.seat = 1
+    return DecisionRequest(DecisionRequest.CLAIM, player, claim_type="pong", card=card_from_id(5))
+
+def test_garbage_line_skipped():
+    """测试无法解析的回复行被跳过，连接上之后的请求照常得到回复"""
+    async def client(reader, writer):
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            message = json.loads(line)
+            writer.write(b"not json\n[1, 2]\n")
+            writer.write(json.dumps({'id': message['id'], 'claim': True}).encode() + b"\n")
+            await writer.drain()
+
+    async def main():
+        transport, reader, writer = await local_socket_pair()
+        task = asyncio.ensure_future(client(reader, writer))
+        try:
+            for _ in range(3):
+                reply = await asyncio.wait_for(transport.request(0, _claim_request()), 1.0)
+                assert reply['claim'] is True
+        finally:
+            await transport.close()
+            writer.close()
+            task.cancel()
+    asyncio.run(main())
+
+def test_closed_connection_fails_fast():
+    """测试连接关闭后请求立即抛出ConnectionError，不等待超时"""
+    async def main():
+        transport, reader, writer = await local_socket_pair()
+        writer.close()
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(transport.request(0, _claim_request()), 1.0)
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(transport.request(0, _claim_request()), 1.0)
+        await transport.close()
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+import io
+
+import pytest
+from src.core.data.card import Card
+from src.core.data.player import Player
+from src.rules.tencent_common.rule import TencentCommonRule
+
+@pytest.fixture
+def score_rules():
+    """创建评分规则实例"""
+    return TencentCommonRule().score_rules
+
+@pytest.fixture
+def player():
+    """创建一个持有七对的玩家"""
+    player = Player(1, "测试玩家")
+    player.hand = [Card("万", str(r)) for r in (1, 1, 3, 3, 5, 5, 7, 7)] + \
+                  [Card("条", str(r)) for r in (2, 2, 4, 4, 6, 6)]
+    player.melds = []
+    return player
+
+def test_profile_counts_predicates(player, score_rules):
+    """测试统计每个判定的调用次数和命中率"""
+    with score_rules.profile() as profiler:
+        score_rules._is_seven_pairs(player)
+        score_rules._is_seven_pairs(player)
+        score_rules._is_da_si_xi(player)
+
+    rows = {row["predicate"]: row for row in profiler.report()}
+    assert rows["_is_seven_pairs"]["calls"] == 2
+    assert rows["_is_seven_pairs"]["hit_rate"] == 1.0
+    assert rows["_is_da_si_xi"]["hits"] == 0
+    assert "_is_lv_yi_se" not in rows  # 未调用的判定不出现在表中
+
+def test_uninstall_restores_methods(player, score_rules):
+    """测试退出后恢复原方法"""
+    with score_rules.profile():
+        assert "_is_seven_pairs" in vars(score_rules)
+    assert "_is_seven_pairs" not in vars(score_rules)
+
+def test_ranked_report(player, score_rules):
+    """测试计算番数后输出排序表"""
+    with score_rules.profile() as profiler:
+        score_rules._calculate_fans(player, player.hand[-1])
+
+    rows = profiler.report()
+    assert len(rows) > 10
+    assert [r["total_ms"] for r in rows] == sorted((r["total_ms"] for r in rows), reverse=True)
+    hit_rates = [r["hit_rate"] for r in profiler.report("hit_rate")]
+    assert hit_rates == sorted(hit_rates)
+
+    stream = io.StringIO()
+    profiler.print_report(limit=5, stream=stream)
+    assert len(stream.getvalue().splitlines()) == 6
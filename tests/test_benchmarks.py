@@ -0,0 +1,48 @@
+from benchmarks.corpus import KINDS, build_corpus
+from benchmarks.harness import compare, measure
+from src.core.data.tile import to_counts
+from src.core.tables.lookup import is_standard_hu
+
+def test_corpus_is_deterministic():
+    """测试相同种子生成相同语料"""
+    a = build_corpus(20, seed=1)
+    b = build_corpus(20, seed=1)
+    assert set(a) == set(KINDS)
+    assert all([s.tiles for s in a[k]] == [s.tiles for s in b[k]] for k in KINDS)
+
+def test_corpus_shapes():
+    """测试语料牌型符合类别"""
+    corpus = build_corpus(20, seed=2)
+    for kind in KINDS:
+        for sample in corpus[kind]:
+            assert len(sample.tiles) == 14
+            assert max(to_counts(sample.full_hand)) <= 4
+    assert all(is_standard_hu(to_counts(s.full_hand)) for s in corpus["ready"])
+    assert all(len({t // 9 for t in s.tiles}) == 1 for s in corpus["pure_suit"])
+    assert all(sorted(set(to_counts(s.full_hand)) - {0}) == [2] for s in corpus["seven_pairs"])
+
+def test_measure_and_compare():
+    """测试计时与回归比较"""
+    stats = measure(lambda x: x * 2, list(range(100)), repeat=2)
+    assert stats["calls"] == 200
+    assert stats["p50_us"] <= stats["p99_us"]
+    
+    baseline = {"results": {"a": {"ops_per_sec": 100.0}, "b": {"ops_per_sec": 100.0}}}
+    current = {"results": {"a": {"ops_per_sec": 80.0}, "b": {"ops_per_sec": 95.0}}}
+    assert [r[0] for r in compare(baseline, current, threshold=0.1)] == ["a"]
+
+def test_game_benchmark_phases():
+    """测试端到端基准的阶段统计，且计时包装在结束后被移除"""
+    from benchmarks.bench_games import PHASES, PhaseProfiler, play_games
+    from src.core.logic.turn_handler import TurnHandler
+    original = TurnHandler.__dict__["draw"]
+
+    profiler = PhaseProfiler()
+    with profiler.installed():
+        totals = play_games(2, seed=3)
+    assert TurnHandler.__dict__["draw"] is original
+
+    assert totals["games"] == 2 and totals["turns"] > 0
+    assert profiler.calls["deal"] == 2
+    assert profiler.calls["draw"] > 0 and profiler.calls["decision"] > 0
+    assert all(profiler.time_ns[p] >= 0 for p in PHASES)
@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+
+# 启动预算：导入命令行入口模块的累计耗时上限（微秒）
+STARTUP_BUDGET_US = 150_000
+
+# 命令行提示出现之前不应加载的模块
+DEFERRED_MODULES = {
+    "tkinter",
+    "src.rules.tencent_common.score_rules",
+    "src.core.tables.store",
+}
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _import_times(module):
+    """使用 -X importtime 导入模块，返回 {模块名: 累计耗时(微秒)}"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+def test_cli_startup_budget():
+    """测试命令行入口的导入耗时在预算内"""
+    times = _import_times("cli_main")
+    assert times["cli_main"] < STARTUP_BUDGET_US
+
+def test_cli_defers_heavy_imports():
+    """测试命令行入口不加载GUI和计分规则"""
+    times = _import_times("cli_main")
+    assert not DEFERRED_MODULES & set(times)
+
+def test_gui_entry_defers_tkinter():
+    """测试GUI入口在创建窗口前不导入tkinter"""
+    times = _import_times("main")
+    assert "tkinter" not in times
+
+def test_strategy_package_is_lazy():
+    """测试策略包按需导入具体策略"""
+    times = _import_times("src.ai.strategy")
+    assert "src.ai.strategy.advanced_strategy" not in times
+    
+    from src.ai.strategy import AdvancedStrategy
+    from src.ai.strategy.advanced_strategy import AdvancedStrategy as direct
+    assert AdvancedStrategy is direct
+
+def test_ai_manager_shares_rule():
+    """测试AI决策管理器使用注入的规则实例"""
+    from src.rules.tencent_common.rule import TencentCommonRule
+    from src.ui.ai_integration import AIDecisionManager
+    
+    rule = TencentCommonRule()
+    manager = AIDecisionManager(rule)
+    assert manager.rule is rule
+    assert manager.strategy.rule is rule
@@ -0,0 +1,68 @@
+import random
+
+from src.core.data.game_state import GameState
+from src.core.data.player import Player
+from src.core.logic.deck_manager import DeckManager
+from src.core.logic.turn_handler import TurnHandler
+from src.rules.tencent_common.rule import TencentCommonRule
+from src.ui.ai_integration import AIDecisionManager
+
+def _game(seed=3):
+    random.seed(seed)
+    rule = TencentCommonRule()
+    players = [Player(name) for name in ("东家", "南家", "西家", "北家")]
+    state = GameState(players, rule, seed=seed)
+    state.initialize_game()
+    return rule, state
+
+def _counting(manager):
+    """统计策略实际分析的次数"""
+    calls = []
+    analyze = manager.strategy.analyze_discards
+    def counted(player, game_state):
+        calls.append(player)
+        return analyze(player, game_state)
+    manager.strategy.analyze_discards = counted
+    return calls
+
+def test_repeated_queries_use_cache():
+    """测试局面不变时推荐出牌和危险牌只计算一次"""
+    rule, state = _game()
+    manager = AIDecisionManager(rule)
+    calls = _counting(manager)
+    player = state.current_player
+    for _ in range(3):
+        best, reason = manager.get_best_discard(player, state)
+        danger = manager.analyze_danger_cards(player, state)
+    assert len(calls) == 1
+    assert best in player.hand and reason
+    assert set(danger) == set(player.hand)
+    assert list(danger.values()) == sorted(danger.values(), reverse=True)
+    
+    # 轮到的玩家变化不影响分析结果
+    state.current_player = player.next_player
+    manager.get_best_discard(player, state)
+    assert len(calls) == 1
+
+def test_state_change_invalidates():
+    """测试摸牌、打牌后重新计算"""
+    rule, state = _game()
+    manager = AIDecisionManager(rule)
+    calls = _counting(manager)
+    player = state.current_player
+    manager.get_best_discard(player, state)
+    player.hand.append(DeckManager.draw_card(state))
+    manager.get_best_discard(player, state)
+    assert len(calls) == 2
+    DeckManager.discard_card(state, player.hand.pop())
+    manager.analyze_danger_cards(player, state)
+    assert len(calls) == 3
+
+def test_matches_uncached_recommendation():
+    """测试缓存的推荐与策略直接计算的结果一致"""
+    rule, state = _game(seed=5)
+    manager = AIDecisionManager(rule)
+    while state.game_stage == "playing":
+        player = state.current_player
+        assert manager.get_best_discard(player, state) == manager.strategy.recommend_discard(player, state)
+        TurnHandler.process_turn(state)
@@ -0,0 +1,81 @@
+import random
+
+from src.core.data.game_state import GameState
+from src.core.data.player import Player
+from src.core.data.tile import card_from_id
+from src.core.logic.deck_manager import DeckManager
+from src.rules.tencent_common.rule import TencentCommonRule
+from src.ui.ai_integration import AIDecisionManager
+from src.ui.hint_worker import HintWorker
+
+def _setup(seed=11):
+    random.seed(seed)
+    rule = TencentCommonRule()
+    players = [Player(name) for name in ("东家", "南家", "西家", "北家")]
+    state = GameState(players, rule, seed=seed)
+    state.initialize_game()
+    manager = AIDecisionManager(rule)
+    return state, manager, HintWorker(manager)
+
+def test_clone_is_independent():
+    """测试局面副本与原局面互不影响，哈希相同"""
+    state, _, _ = _setup()
+    copy = state.clone()
+    assert copy.zobrist == state.zobrist
+    assert copy.current_player is copy.players[0]
+    copy.players[0].hand.append(copy.deck.draw())
+    assert copy.zobrist != state.zobrist
+    assert len(copy.deck) == len(state.deck) - 1
+
+def test_draw_hints_precomputed():
+    """测试摸牌前推演，摸牌后提示直接命中且与直接计算一致"""
+    state, manager, worker = _setup()
+    player = state.players[1]
+    try:
+        worker.speculate(player, state)
+        assert worker.wait(10)
+        assert worker.draw_hints
+        
+        player.hand.append(DeckManager.draw_card(state))
+        hint = worker.discard_hint(player, state)
+        assert hint is not None and worker.hits == 1
+        assert hint == manager.strategy.analyze_discards(player, state)
+    finally:
+        worker.close()
+
+def test_own_turn_speculates_after_discard():
+    """测试轮到出牌时先算出当前提示，并推演打出推荐牌后的响应"""
+    state, manager, worker = _setup()
+    player = state.players[0]
+    player.hand.append(DeckManager.draw_card(state))
+    try:
+        worker.speculate(player, state)
+        assert worker.wait(10)
+        assert worker.discard_hint(player, state) == manager.strategy.analyze_discards(player, state)
+        best = manager.analyze(player, state)[0]
+        player.hand.take(best.tile_id)
+        pong = next((t for t in range(34) if player.hand.counts[t] >= 2), None)
+        if pong is not None:
+            claim, _ = worker.claim_hint(player, "pong", card_from_id(pong))
+            assert claim == manager.strategy.should_claim(player, state, "pong", card_from_id(pong))
+    finally:
+        worker.close()
+
+def test_state_change_cancels_speculation():
+    """测试局面变化后旧的推演作废，不影响实际局面"""
+    state, _, worker = _setup()
+    player = state.players[1]
+    before = state.zobrist
+    try:
+        worker.speculate(player, state)
+        generation = worker._generation
+        worker.speculate(player, state)  # 局面未变，不重新推演
+        assert worker._generation == generation
+        DeckManager.discard_card(state, state.players[0].hand.pop())
+        worker.speculate(player, state)
+        assert worker._generation == generation + 1
+        assert worker.wait(10)
+    finally:
+        worker.close()
+    assert state.zobrist != before
+    assert worker._thread is None